@@ -0,0 +1,265 @@
+"""
+docsig._backend
+===============
+
+Parse Python source with the stdlib, building astroid only when needed.
+"""
+
+import ast as _ast
+import contextlib as _contextlib
+import functools as _functools
+import os as _os
+import sys as _sys
+import textwrap as _textwrap
+import typing as _t
+from ast import iter_child_nodes as _iter_child_nodes
+from pathlib import Path as _Path
+
+import astroid as _astroid
+
+# errors the stdlib parser raises for source it cannot parse
+_PARSE_ERRORS = (
+    SyntaxError,
+    ValueError,
+    TypeError,
+    MemoryError,
+    RecursionError,
+)
+
+# astroid builds its tree recursively, so a deeply nested expression can
+# exceed the recursion limit, which is reported as an error, so modules
+# nested this deep are left to astroid
+_MAX_DEPTH = 100
+
+
+def _needs_build(tree: _ast.AST) -> bool:
+    # one level of the tree at a time, so no node is held for longer
+    # than it takes to list its children
+    level = [tree]
+    for _ in range(_MAX_DEPTH + 1):
+        # astroid orders the bases of a decorated class, such as a
+        # dataclass, as it builds it, so the error ordering them is
+        # raised for the module as a whole
+        if any(
+            isinstance(i, _ast.ClassDef) and i.bases and i.decorator_list
+            for i in level
+        ):
+            return True
+
+        level = [i for node in level for i in _iter_child_nodes(node)]
+        if not level:
+            return False
+
+    return True
+
+
+# the name and path of each module being built or inferred, innermost
+# last, so a module imported relative to one can be found beside it
+_IMPORTING: list[tuple[str, _Path | None]] = []
+
+
+def _find_beside(modname: str, name: str, file: _Path) -> _Path | None:
+    # modules are named by the path they were given to check by, which
+    # need not be importable, such as a package outside the working dir,
+    # so a module in a package the named module is in, such as one it
+    # imports a base from, is looked for in the dir the package is
+    # named after, nearest first
+    parts = name.split(".")
+    for size, directory in zip(range(len(parts) - 1, 0, -1), file.parents):
+        package = ".".join(parts[:size])
+        if modname.startswith(f"{package}."):
+            path = directory.joinpath(*modname[len(package) + 1 :].split("."))
+            for module in path.with_suffix(".py"), path / "__init__.py":
+                if module.is_file():
+                    return module
+
+    return None
+
+
+def _import_beside(modname: str) -> _astroid.nodes.Module:
+    for name, file in reversed(_IMPORTING):
+        module = None if file is None else _find_beside(modname, name, file)
+        if module is not None:
+            return _astroid.MANAGER.ast_from_file(str(module), modname)
+
+    raise _astroid.AstroidBuildingError(modname=modname)
+
+
+@_functools.cache
+def _register_hook() -> None:
+    # astroid has no way to remove a hook, so it is added once, and
+    # does nothing outside of a build or inference
+    _astroid.MANAGER.register_failed_import_hook(_import_beside)
+
+
+@_contextlib.contextmanager
+def _importing(name: str, file: _Path | None) -> _t.Iterator[None]:
+    # the working dir is put on the path, so astroid can resolve the
+    # project packages bases are imported from (#522), and modules are
+    # found beside the module, without mutating sys.path, or resolving
+    # modules for anything else, for longer than astroid infers them
+    _register_hook()
+    cwd = _os.path.abspath(_os.getcwd())
+    added = cwd not in _sys.path
+    if added:
+        _sys.path.append(cwd)
+
+    _IMPORTING.append((name, file))
+    try:
+        yield
+    finally:
+        _IMPORTING.pop()
+        if added:
+            with _contextlib.suppress(ValueError):
+                _sys.path.remove(cwd)
+
+
+class Backend:
+    """Python source parsed for checking.
+
+    The stdlib parser is a fraction of the cost of building the astroid
+    tree, and holds everything read from a function: its arguments,
+    decorators, return annotation, and docstring. The astroid tree is
+    only built, once, where inference is needed to find the ancestors
+    of a class, where a decorated class has bases, as astroid orders
+    them as it builds the class, or where the stdlib cannot be relied
+    on to agree with astroid on whether the source is valid.
+
+    :param code: Python source to parse.
+    :param module_name: Module name, or empty string.
+    :param file: Path for the source (or None for stdin).
+    :param tree: Stdlib AST already parsed from the source, if any.
+    """
+
+    def __init__(
+        self,
+        code: str,
+        module_name: str = "",
+        file: _Path | None = None,
+        tree: _ast.Module | None = None,
+    ) -> None:
+        self._code = code
+        self._module_name = module_name
+        self._file = file
+        self._tree = tree
+        self._module: _astroid.nodes.Module | None = None
+        self._classes: dict[tuple[int, int], _astroid.nodes.ClassDef] = {}
+        # the ancestors of each class with bases inferred so far, and an
+        # iterator inferring the rest, so methods of the same class share
+        # them
+        self._ancestors: dict[
+            tuple[int, int],
+            tuple[
+                list[_astroid.nodes.ClassDef],
+                _t.Iterator[_astroid.nodes.ClassDef],
+            ],
+        ] = {}
+
+    @property
+    def name(self) -> str:
+        """Name of the parsed module."""
+        return self._module_name
+
+    @property
+    def file(self) -> _Path | None:
+        """Path for the parsed source (or None for stdin)."""
+        return self._file
+
+    @property
+    def inferences(self) -> int:
+        """Number of classes whose ancestors have been inferred."""
+        return len(self._ancestors)
+
+    def _build(self) -> _astroid.nodes.Module:
+        if self._module is None:
+            with _importing(self._module_name, self._file):
+                self._module = _astroid.parse(
+                    self._code,
+                    self._module_name,
+                    str(self._file),
+                )
+
+        return self._module
+
+    def parse(self) -> _ast.Module:
+        """Parse the source into a stdlib AST.
+
+        :return: The module's stdlib AST.
+        :raises astroid.AstroidSyntaxError: If the source is invalid.
+        :raises RecursionError: If the source is nested too deep.
+        :raises astroid.DuplicateBasesError: If the bases of a class
+            cannot be ordered.
+        """
+        # parsed as astroid parses it, so the same code is valid
+        code = f"{_textwrap.dedent(self._code)}\n"
+        tree = self._tree
+        if tree is None:
+            try:
+                tree = _ast.parse(code, type_comments=True)
+            except _PARSE_ERRORS:
+                pass
+
+        if tree is None or _needs_build(tree):
+            # errors are left to astroid, so they are reported the same
+            self._build()
+            # astroid parses without type comments if they are misplaced
+            tree = tree or _ast.parse(code)
+
+        return tree
+
+    def _infer(
+        self,
+        node: _ast.ClassDef,
+    ) -> _t.Iterator[_astroid.nodes.ClassDef]:
+        if not self._classes:
+            self._classes = {
+                (i.lineno, i.col_offset): i
+                for i in self._build().nodes_of_class(
+                    _astroid.nodes.ClassDef,
+                )
+            }
+
+        yield from self._classes[node.lineno, node.col_offset].ancestors()
+
+    def ancestors(
+        self,
+        node: _ast.ClassDef,
+    ) -> _t.Iterator[_astroid.nodes.ClassDef]:
+        """Infer the ancestors of a class, nearest first.
+
+        Ancestors are inferred no further than they are iterated, and
+        no more than once for each class.
+
+        :param node: Stdlib AST node of the class.
+        :return: Iterator of the class's ancestors as astroid nodes.
+        """
+        if not node.bases:
+            # a class without bases only derives from object, which
+            # needs nothing inferred
+            yield _astroid.MANAGER.ast_from_module_name("builtins")["object"]
+            return
+
+        key = node.lineno, node.col_offset
+        if key not in self._ancestors:
+            self._ancestors[key] = [], self._infer(node)
+
+        inferred, remaining = self._ancestors[key]
+        yield from inferred
+        while True:
+            # only while inferring, not while the caller holds an ancestor
+            with _importing(self._module_name, self._file):
+                ancestor = next(remaining, None)
+
+            if ancestor is None:
+                return
+
+            inferred.append(ancestor)
+            yield ancestor
+
+    def defines(self, node: _astroid.nodes.NodeNG) -> bool:
+        """Whether an astroid node belongs to this module.
+
+        :param node: Astroid node, such as an inferred ancestor.
+        :return: True if the node was built from this source.
+        """
+        return self._module is not None and node.root() is self._module
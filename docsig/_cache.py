@@ -0,0 +1,220 @@
+"""
+docsig._cache
+=============
+
+Persistent store of check results keyed by file content and config.
+"""
+
+import contextlib as _contextlib
+import dataclasses as _dataclasses
+import hashlib as _hashlib
+import json as _json
+import os as _os
+import sys as _sys
+import typing as _t
+from pathlib import Path as _Path
+
+import astroid as _ast
+
+from ._config import Config as _Config
+from ._diagnostic import Collector as _Collector
+from ._diagnostic import Diagnostic as _Diagnostic
+from ._diagnostic import Failures as _Failures
+from ._diagnostic import FunctionResult as _FunctionResult
+from ._parsers import Source as _Source
+from ._version import __version__
+from .messages import Messages as _Messages
+
+CACHE_DIR = ".docsig_cache"
+
+#: total size of stored results past which the least recently used are
+#: evicted
+MAX_SIZE = 32 * 1024 * 1024
+
+# mark the directory the way other tools mark theirs, so backup tools
+# skip it and it never shows up as untracked in git
+_CACHEDIR_TAG = """\
+Signature: 8a477f597d28d172789f06886806bc55
+# This file is a cache directory tag created by docsig.
+# For information about cache directory tags, see:
+#	https://bford.info/cachedir/spec.html
+"""
+_GITIGNORE = "# Created by docsig automatically.\n*\n"
+
+#: a stored result is only valid while the modules it depends on, such
+#: as those holding base classes, are unchanged
+_Dependencies = tuple[tuple[str, int, int], ...]
+
+
+def _stat(file: str) -> tuple[str, int, int]:
+    # a file that can no longer be read never matches a stored stat
+    try:
+        stat = _os.stat(file)
+    except OSError:
+        return file, -1, -1
+
+    return file, stat.st_mtime_ns, stat.st_size
+
+
+# entries hold plain data only, so reading one never runs code, even if
+# the cache directory was written to by someone else
+def _dump(dependencies: _Dependencies, failures: _Failures) -> bytes:
+    return _json.dumps(
+        [
+            dependencies,
+            [
+                [
+                    i.name,
+                    i.lineno,
+                    i.retcode,
+                    [_dataclasses.astuple(j) for j in i],
+                ]
+                for i in failures
+            ],
+        ],
+    ).encode()
+
+
+def _load(data: bytes) -> tuple[_Dependencies, _Failures]:
+    dependencies, results = _json.loads(data)
+    failures = _Failures()
+    for name, lineno, retcode, diagnostics in results:
+        collector = _Collector(name, lineno, _Messages())
+        collector.retcode.add(retcode)
+        for diagnostic in diagnostics:
+            collector.restore(_Diagnostic(*diagnostic))
+
+        failures.append(_FunctionResult(name, lineno, collector))
+
+    return tuple(tuple(i) for i in dependencies), failures
+
+
+class Cache:
+    """Store check results on disk so unchanged files are not parsed.
+
+    Results are keyed by the source bytes, the path, the config options
+    that affect results, and the versions of docsig, astroid, and
+    python, so a change to any of them is a miss rather than a stale
+    result.
+
+    :param config: Configuration object.
+    :param root: Directory to store results in.
+    :param max_size: Size in bytes past which results are evicted.
+    """
+
+    def __init__(
+        self,
+        config: _Config,
+        root: _Path = _Path(CACHE_DIR),
+        max_size: int = MAX_SIZE,
+    ) -> None:
+        self._root = root
+        self._max_size = max_size
+        # only the options that change what a file reports are part of
+        # the key, so e.g. verbose and non-verbose runs share results
+        self._salt = _hashlib.sha256(
+            repr(
+                (
+                    __version__,
+                    _ast.__version__,
+                    _sys.version,
+                    config.check,
+                    config.ignore,
+                    [i.ref for i in config.target],
+                    [i.ref for i in config.disable],
+                ),
+            ).encode(),
+        ).digest()
+
+    def key(self, file: _Path, source: _Source | None = None) -> str:
+        """Return the key for the file's current content.
+
+        :param file: Path to the file to check.
+        :param source: Bytes already read from the file, if any.
+        :return: Key for the file.
+        """
+        digest = _hashlib.sha256(self._salt)
+        # the module name astroid resolves imports with is derived from
+        # the path as given, so the same file reached another way is a
+        # different entry
+        digest.update(f"{file}\0{_os.path.abspath(file)}\0".encode())
+        digest.update(file.read_bytes() if source is None else source)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> _Path:
+        return self._root / key[:2] / key[2:]
+
+    def get(self, key: str) -> _Failures | None:
+        """Return the stored failures for the key, if still valid.
+
+        :param key: Key for the file.
+        :return: Stored failures, or None if there are none.
+        """
+        path = self._path(key)
+        try:
+            dependencies, failures = _load(path.read_bytes())
+        except (OSError, ValueError, TypeError):
+            return None
+
+        if any(_stat(i[0]) != i for i in dependencies):
+            return None
+
+        # mark as recently used, so eviction keeps it
+        with _contextlib.suppress(OSError):
+            _os.utime(path)
+
+        return failures
+
+    def set(
+        self,
+        key: str,
+        failures: _Failures,
+        dependencies: _t.Iterable[str],
+    ) -> None:
+        """Store failures for the key.
+
+        A cache that cannot be written to is not an error, the run only
+        loses the speedup.
+
+        :param key: Key for the file.
+        :param failures: Failures to store.
+        :param dependencies: Other files the failures depend on.
+        """
+        path = self._path(key)
+        stats: _Dependencies = tuple(_stat(i) for i in sorted(dependencies))
+        with _contextlib.suppress(OSError):
+            self._init_root()
+            path.parent.mkdir(exist_ok=True)
+            # write then rename, so a reader, possibly another process,
+            # never sees a partial entry
+            tmp = path.with_name(f"{path.name}.{_os.getpid()}.tmp")
+            tmp.write_bytes(_dump(stats, failures))
+            _os.replace(tmp, path)
+
+    def _init_root(self) -> None:
+        if not self._root.is_dir():
+            self._root.mkdir(parents=True, exist_ok=True)
+            (self._root / "CACHEDIR.TAG").write_text(_CACHEDIR_TAG)
+            (self._root / ".gitignore").write_text(_GITIGNORE)
+
+    def prune(self) -> None:
+        """Evict the least recently used results past the size limit."""
+        entries = []
+        with _contextlib.suppress(OSError):
+            for bucket in _os.scandir(self._root):
+                if bucket.is_dir():
+                    for entry in _os.scandir(bucket.path):
+                        stat = entry.stat()
+                        entries.append(
+                            (stat.st_mtime_ns, stat.st_size, entry.path),
+                        )
+
+        size = sum(i[1] for i in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self._max_size:
+                break
+
+            with _contextlib.suppress(OSError):
+                _os.remove(path)
+
+            size -= entry_size
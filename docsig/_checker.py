@@ -14,6 +14,7 @@ import astroid as _ast
 from ._config import Config as _Config
 from ._diagnostic import Collector as _Collector
 from ._diagnostic import FunctionResult as _FunctionResult
+from ._plan import Family as _Family
 from ._scope import Function as _Function
 from ._stub import UNNAMED as _UNNAMED
 from ._stub import VALID_DESCRIPTION as _VALID_DESCRIPTION
@@ -107,25 +108,16 @@ class FunctionChecker:  # pylint: disable=too-few-public-methods
     @staticmethod
     def _qualified_name(func: _Function) -> str:
         # prefix the enclosing class so the report reads Class.method
-        frame = func.frame
-        if (
-            frame is not None
-            and hasattr(frame, "name")
-            and frame.name
-            and not isinstance(frame, _ast.nodes.Module)
-        ):
-            return f"{frame.name}.{func.name}"
+        # a module is not named, so a function's name is left as it is
+        frame_name = getattr(func.frame, "name", None)
+        if frame_name:
+            return f"{frame_name}.{func.name}"
 
         return func.name
 
     @staticmethod
     def _disabled_messages(func: _Function, config: _Config) -> _Messages:
-        # targeting a subset of checks disables everything else
-        disabled = _Messages(func.messages)
-        if config.target:
-            disabled.extend(i for i in _E.all if i not in config.target)
-
-        return disabled
+        return func.messages | config.plan.disabled
 
     def run(self) -> _FunctionResult:
         """Run the function checks and return the result.
@@ -136,21 +128,37 @@ class FunctionChecker:  # pylint: disable=too-few-public-methods
             self._collector.retcode.add(2)
             self._sig9xx_error()
         else:
+            # only the checks that can raise a message not disabled for
+            # every function are run
+            families = self._config.plan.families
             self._sig0xx_config()
-            if self._func.docstring.string is None:
-                self._sig1xx_missing()
+            if not self._func.isdocumented:
+                if _Family.MISSING in families:
+                    self._sig1xx_missing()
             else:
-                self._sig2xx_signature()
-                for index in range(len(self._func)):
-                    doc = self._func.docstring.args.get(index)
+                self._check_params(families)
+                if _Family.RETURNS in families:
+                    self._sig5xx_returns(self._config.check.property_returns)
+
+        return _FunctionResult(self._name, self._func.lineno, self._collector)
+
+    def _check_params(self, families: tuple[_Family, ...]) -> None:
+        description = _Family.DESCRIPTION in families
+        parameters = _Family.PARAMETERS in families
+        # the signature check lines up the params the others compare
+        if description or parameters or _Family.SIGNATURE in families:
+            self._sig2xx_signature()
+
+        if description or parameters:
+            for index in range(len(self._func)):
+                doc = self._func.docstring.args.get(index)
+                if description:
                     self._sig3xx_description(doc)
+
+                if parameters:
                     sig = self._func.signature.args.get(index)
                     self._sig4xx_parameters(doc, sig)
 
-                self._sig5xx_returns(self._config.check.property_returns)
-
-        return _FunctionResult(self._name, self._func.lineno, self._collector)
-
     def _add(
         self,
         value: _Message,
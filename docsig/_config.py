@@ -6,6 +6,7 @@ Config dataclasses, pyproject.toml loader, and commandline.
 """
 
 import argparse as _argparse
+import functools as _functools
 import re as _re
 import typing as _t
 from dataclasses import dataclass as _dataclass
@@ -14,6 +15,7 @@ from pathlib import Path as _Path
 
 import tomli as _tomli
 
+from ._plan import Plan as _Plan
 from ._version import __version__
 from .messages import Messages as _Messages
 
@@ -22,25 +24,32 @@ PYPROJECT_TOML = "pyproject.toml"
 # the leading optional group allows the excluded dir to sit at any
 # depth, so the default excludes apply however the checked path is
 # given, e.g. a subdir or an absolute path, not only relative to cwd
+# not anchored at the end, a pattern matching a dir matches every path
+# below it, so an excluded dir is never walked
 DEFAULT_EXCLUDES = """\
 (?x)^(?:.*[\\\\/])?(
-    |\\.?venv[\\\\/].*
-    |\\.git[\\\\/].*
-    |\\.hg[\\\\/].*
-    |\\.idea[\\\\/].*
-    |\\.mypy_cache[\\\\/].*
-    |\\.nox[\\\\/].*
-    |\\.pytest_cache[\\\\/].*
-    |\\.svn[\\\\/].*
-    |\\.tox[\\\\/].*
-    |\\.vscode[\\\\/].*
-    |_?build[\\\\/].*
-    |__pycache__[\\\\/].*
-    |dist[\\\\/].*
-    |node_modules[\\\\/].*
-)$
+    \\.?venv
+    |\\.docsig_cache
+    |\\.git
+    |\\.hg
+    |\\.idea
+    |\\.mypy_cache
+    |\\.nox
+    |\\.pytest_cache
+    |\\.svn
+    |\\.tox
+    |\\.vscode
+    |_?build
+    |__pycache__
+    |dist
+    |node_modules
+)[\\\\/]
 """
 
+#: value of changed_since selecting the changes staged for commit, which
+#: cannot be mistaken for a ref, as a ref cannot contain ":"
+STAGED = ":staged"
+
 
 # split str by comma but allow for escaping
 def _split_comma(value: str) -> list[str]:
@@ -126,9 +135,12 @@ class _ArgumentParser(_argparse.ArgumentParser):
         namespace: _argparse.Namespace | None = None,
     ) -> tuple[_argparse.Namespace | None, list[str]]:
         namespace, args = super().parse_known_args(args, namespace)
+        # source read from stdin belongs to the project of its path
+        stdin_filename = getattr(namespace, "stdin_filename", None)
         config = get_config(
             _Path(self.prog).stem,
             *getattr(namespace, "path", []),
+            *([] if stdin_filename is None else [_Path(stdin_filename)]),
         )
         namespace.__dict__ = merge_configs(namespace.__dict__, config)
         return namespace, args
@@ -272,6 +284,48 @@ def build_parser() -> _ArgumentParser:
         action="store_true",
         help="check files even if they match a gitignore pattern",
     )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help=(
+            "only check python files changed since branching from REF,"
+            f" or staged if REF is {STAGED}"
+        ),
+    )
+    parser.add_argument(
+        "--files-from",
+        metavar="FILE",
+        help="check paths listed in FILE, or stdin if -, one per line or nul",
+    )
+    parser.add_argument(
+        "--trust-files-from",
+        action="store_true",
+        help="check paths from --files-from without gitignore or excludes",
+    )
+    parser.add_argument(
+        "--jobs",
+        metavar="INT",
+        action="store",
+        type=int,
+        default=1,
+        help="number of processes to check files with (0 for one per cpu)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="do not reuse or store the results of unchanged files",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print the time taken by each stage and the slowest files",
+    )
+    parser.add_argument(
+        "--profile-json",
+        metavar="FILE",
+        type=_Path,
+        help="write the time taken by each stage and file to FILE as json",
+    )
     parser.add_argument(
         "-s",
         "--string",
@@ -279,6 +333,16 @@ def build_parser() -> _ArgumentParser:
         metavar="STR",
         help="string to parse instead of files",
     )
+    parser.add_argument(
+        "--stdin-filename",
+        metavar="PATH",
+        help="check source read from stdin as if it were saved at PATH",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="check sources sent as json-rpc requests over stdio",
+    )
     return parser
 
 
@@ -344,11 +408,21 @@ class Filters:
     :param excludes: Files or dirs to exclude from checks.
     :param include_ignored: Check files even if they match a gitignore
         pattern.
+    :param changed_since: Only check python files changed since
+        branching from this git ref, committed or not, or staged for
+        commit if STAGED.
+    :param files_from: Also check the paths listed in this file, or in
+        stdin if ``"-"``, separated by newlines or NULs.
+    :param trust_files_from: Check the paths listed as they are, without
+        applying gitignore or exclude patterns.
     """
 
     exclude: list[str] = _field(default_factory=list)
     excludes: list[str] = _field(default_factory=list)
     include_ignored: bool = False
+    changed_since: str | None = None
+    files_from: str | None = None
+    trust_files_from: bool = False
 
 
 @_dataclass(frozen=True)
@@ -366,6 +440,11 @@ class Config:
     :param target: List of errors to target.
     :param disable: List of errors to disable.
     :param no_ansi: Disable ANSI output.
+    :param jobs: Number of processes to check files with, or 0 for one
+        per cpu.
+    :param no_cache: Do not reuse or store the results of unchanged
+        files.
+    :param profile: Time each stage of the run, and each file.
     """
 
     check: Check = _field(default_factory=Check)
@@ -376,3 +455,11 @@ class Config:
     list_checks: bool = False
     no_ansi: bool = False
     verbose: bool = False
+    jobs: int = 1
+    no_cache: bool = False
+    profile: bool = False
+
+    @_functools.cached_property
+    def plan(self) -> _Plan:
+        """Checks this configuration can raise, worked out once."""
+        return _Plan.from_config(self)
@@ -8,21 +8,31 @@ Entry point and orchestration for running docstring/signature checks.
 import logging as _logging
 import sys as _sys
 import typing as _t
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+from itertools import chain as _chain
+from itertools import islice as _islice
+from itertools import repeat as _repeat
+from itertools import tee as _tee
 from pathlib import Path as _Path
 from pprint import pformat as _pformat
 
-from . import _decorators
+from . import _decorators, _profile
+from ._cache import Cache as _Cache
 from ._config import DEFAULT_EXCLUDES as _DEFAULT_EXCLUDES
 from ._config import Check as _Check
 from ._config import Config as _Config
 from ._config import Filters as _Filters
 from ._config import Ignore as _Ignore
 from ._diagnostic import Failures as _Failures
-from ._files import Files as _Files
-from ._parsers import parse_from_file as _parse_from_file
+from ._files import FILE_INFO as _FILE_INFO
+from ._files import excluded as _excluded
+from ._files import iter_files as _iter_files
+from ._parsers import parse_from_bytes as _parse_from_bytes
 from ._parsers import parse_from_string as _parse_from_string
+from ._parsers import read_source as _read_source
 from ._report import print_checks as _print_checks
 from ._report import report as _report
+from ._server import Server as _Server
 from ._traverse import run_checks as _run_checks
 from .messages import Messages as _Messages
 
@@ -42,32 +52,156 @@ def setup_logger(verbose: bool) -> None:
         logger.addHandler(stream_handler)
 
 
-def runner(file: _Path, config: _Config) -> _Failures:
+def runner(
+    file: _Path,
+    config: _Config,
+    cache: _Cache | None = None,
+) -> _Failures:
     """Run checks for a single file and return collected failures.
 
     :param file: Path to the file to check.
     :param config: Configuration object.
+    :param cache: Cache to reuse the results of unchanged files from,
+        if any.
     :return: Collected failures for the file.
     """
-    module = _parse_from_file(file, config)
-    return _run_checks(module, config)
+    # the file is read once, for both its key and its code
+    with _read_source(file) as source:
+        if cache is None:
+            return _run_checks(_parse_from_bytes(source, config, file), config)
+
+        key = cache.key(file, source)
+        failures = cache.get(key)
+        if failures is not None:
+            logger = _logging.getLogger(__package__)
+            logger.debug(_FILE_INFO, file, "unchanged, using cached result")
+            return failures
+
+        module = _parse_from_bytes(source, config, file)
+
+    failures = _run_checks(module, config)
+    cache.set(key, failures, module.dependencies)
+    return failures
+
+
+def _profiled_runner(
+    file: _Path,
+    config: _Config,
+    cache: _Cache | None = None,
+) -> _Failures:
+    # the stages of checking a file count toward it, if profiled
+    with _profile.file(file):
+        return runner(file, config, cache)
+
+
+def _worker_runner(
+    file: _Path,
+    config: _Config,
+    cache: _Cache | None = None,
+) -> tuple[_Failures, _profile.Profile]:
+    # a worker profiles the files it checks afresh, so they can be
+    # added to the run's profile, rather than to a copy of it forked
+    # from the parent process
+    with _profile.profiling() as profile:
+        return _profiled_runner(file, config, cache), profile
 
 
 def _check_string(string: str, config: _Config) -> int:
     module = _parse_from_string(string, config)
-    return _report([(_run_checks(module, config), None)], config)
+    failures = _run_checks(module, config)
+    with _profile.stage(_profile.Stage.REPORT):
+        return _report([(failures, None)], config)
+
+
+def _check_stdin(file: _Path, config: _Config) -> int:
+    # read before anything else, so whoever writes the source is never
+    # left with a pipe nobody reads
+    with _profile.stage(_profile.Stage.READ):
+        source = _sys.stdin.buffer.read()
+
+    # the source is checked as though it was saved at the path, which
+    # need not exist, e.g. an unsaved buffer in an editor
+    failures = _Failures()
+    with _profile.stage(_profile.Stage.DISCOVERY):
+        skip = _excluded(file, config.filters)
+
+    if skip:
+        logger = _logging.getLogger(__package__)
+        logger.debug(_FILE_INFO, file, "in exclude list, skipping")
+    else:
+        module = _parse_from_bytes(source, config, file)
+        failures = _run_checks(module, config)
+
+    with _profile.stage(_profile.Stage.REPORT):
+        return _report([(failures, str(file))], config)
 
 
 def _check_files(paths: tuple[str | _Path, ...], config: _Config) -> int:
-    # a generator, so that each file is still checked and reported as it
-    # is reached rather than after the whole run
-    return _report(
-        (
-            (runner(file, config), str(file))
-            for file in _Files(paths, config.filters)
-        ),
-        config,
+    # files are checked as they are found, rather than once the whole
+    # tree has been walked
+    files = _profile.iterate(
+        _profile.Stage.DISCOVERY,
+        _iter_files(paths, config.filters),
     )
+    cache = None if config.no_cache else _Cache(config)
+    try:
+        return _report_files(files, config, cache)
+    finally:
+        if cache is not None:
+            cache.prune()
+
+
+def _report_files(
+    files: _t.Iterator[_Path],
+    config: _Config,
+    cache: _Cache | None,
+) -> int:
+    # look ahead far enough to know whether a pool is worth starting
+    head = list(_islice(files, 2))
+    files = _chain(head, files)
+    if config.jobs == 1 or len(head) < 2:
+        # a generator, so that each file is still checked and reported
+        # as it is reached rather than after the whole run
+        with _profile.stage(_profile.Stage.REPORT):
+            return _report(
+                (
+                    (_profiled_runner(file, config, cache), str(file))
+                    for file in files
+                ),
+                config,
+            )
+
+    # results are yielded in the order the files were submitted, not
+    # the order they complete, so the report reads the same as a serial
+    # run while each file is still printed as soon as its turn comes
+    # workers configure their own logger, as a spawned process does not
+    # inherit the parent's
+    files, names = _tee(files)
+    with _ProcessPoolExecutor(
+        max_workers=config.jobs or None,
+        initializer=setup_logger,
+        initargs=(config.verbose,),
+    ) as executor:
+        if config.profile:
+            results = _profile.merged(
+                executor.map(
+                    _worker_runner,
+                    files,
+                    _repeat(config),
+                    _repeat(cache),
+                ),
+            )
+        else:
+            results = executor.map(
+                runner,
+                files,
+                _repeat(config),
+                _repeat(cache),
+            )
+
+        # the time waiting on the workers is counted toward the report
+        with _profile.stage(_profile.Stage.REPORT):
+            return _report(zip(results, map(str, names)), config)
 
 
 @_decorators.parse_msgs
@@ -75,6 +209,7 @@ def _check_files(paths: tuple[str | _Path, ...], config: _Config) -> int:
 def docsig(  # pylint: disable=too-many-locals,too-many-arguments
     *path: str | _Path,
     string: str | None = None,
+    serve: bool = False,
     list_checks: bool = False,
     check_class: bool = False,
     check_class_constructor: bool = False,
@@ -94,6 +229,14 @@ def docsig(  # pylint: disable=too-many-locals,too-many-arguments
     disable: list[str] | None = None,
     exclude: str | list[str] | None = None,
     excludes: list[str] | None = None,
+    jobs: int = 1,
+    no_cache: bool = False,
+    changed_since: str | None = None,
+    files_from: str | _Path | None = None,
+    trust_files_from: bool = False,
+    profile: bool = False,
+    profile_json: str | _Path | None = None,
+    stdin_filename: str | _Path | None = None,
 ) -> int:
     """Run docstring/signature checks on paths or a string and report.
 
@@ -104,6 +247,8 @@ def docsig(  # pylint: disable=too-many-locals,too-many-arguments
 
     :param path: Path(s) to check.
     :param string: String to check instead of files.
+    :param serve: Check sources sent as JSON-RPC requests over stdio
+        until shut down, instead of files.
     :param list_checks: Display a list of all checks and their messages.
     :param check_class: Check class docstrings.
     :param check_class_constructor: Check ``__init__`` methods. Mutually
@@ -128,6 +273,24 @@ def docsig(  # pylint: disable=too-many-locals,too-many-arguments
     :param exclude: Regular expression(s) of files and dirs to exclude
         from checks, joined with the default exclusions.
     :param excludes: Files or dirs to exclude from checks.
+    :param jobs: Number of processes to check files with, or 0 for one
+        per cpu.
+    :param no_cache: Do not reuse or store the results of unchanged
+        files.
+    :param changed_since: Only check python files changed since
+        branching from this git ref, committed or not, or those staged
+        for commit if ``":staged"``.
+    :param files_from: Also check the paths listed in this file, or in
+        stdin if ``"-"``, separated by newlines or NULs, as they are
+        read.
+    :param trust_files_from: Check the paths listed as they are, without
+        applying gitignore or exclude patterns.
+    :param profile: Print the time taken by each stage of the run, and
+        by the slowest files.
+    :param profile_json: Path to write the time taken by each stage and
+        file to as JSON.
+    :param stdin_filename: Check source read from stdin instead of
+        files, as if it were saved at this path, which need not exist.
     :return: Exit code (non-zero if any check failed).
     """
     exclude_patterns = [_DEFAULT_EXCLUDES]
@@ -158,6 +321,9 @@ def docsig(  # pylint: disable=too-many-locals,too-many-arguments
         include_ignored=include_ignored,
         exclude=exclude_patterns,
         excludes=excludes or [],
+        changed_since=changed_since,
+        files_from=None if files_from is None else str(files_from),
+        trust_files_from=trust_files_from,
     )
     config = _Config(
         list_checks=list_checks,
@@ -166,6 +332,9 @@ def docsig(  # pylint: disable=too-many-locals,too-many-arguments
         filters=filters,
         no_ansi=no_ansi,
         verbose=verbose,
+        jobs=jobs,
+        no_cache=no_cache,
+        profile=profile or profile_json is not None,
         # the annotations describe the caller's interface; _parse_msgs
         # has already converted these to Messages by the time they land
         target=_t.cast("_Messages | None", target) or _Messages(),
@@ -177,7 +346,34 @@ def docsig(  # pylint: disable=too-many-locals,too-many-arguments
         # noinspection PyNoneFunctionAssignment
         return int(bool(_print_checks()))  # type: ignore
 
+    if serve:
+        return _Server(config).serve()
+
+    if not config.profile:
+        return _run(path, string, stdin_filename, config)
+
+    with _profile.profiling() as run_profile:
+        retcode = _run(path, string, stdin_filename, config)
+
+    if profile:
+        run_profile.print()
+
+    if profile_json is not None:
+        run_profile.dump(profile_json)
+
+    return retcode
+
+
+def _run(
+    path: tuple[str | _Path, ...],
+    string: str | None,
+    stdin_filename: str | _Path | None,
+    config: _Config,
+) -> int:
     if string:
         return _check_string(string, config)
 
+    if stdin_filename is not None:
+        return _check_stdin(_Path(stdin_filename), config)
+
     return _check_files(path, config)
@@ -41,7 +41,13 @@ def _validation_errors(
     kwargs: dict[str, _t.Any],
 ) -> list[str]:
     errors = []
-    if not args and not kwargs.get("string"):
+    if not (
+        args
+        or kwargs.get("string")
+        or kwargs.get("serve")
+        or kwargs.get("files_from") is not None
+        or kwargs.get("stdin_filename") is not None
+    ):
         errors.append(
             "the following arguments are required: path(s) or string",
         )
@@ -53,6 +59,34 @@ def _validation_errors(
                     f"unknown option to {option} '{message.description}'",
                 )
 
+    if kwargs.get("jobs", 1) < 0:
+        errors.append("argument to jobs must not be negative")
+
+    # would be read by git as an option
+    if (kwargs.get("changed_since") or "").startswith("-"):
+        errors.append("argument to changed-since must be a git ref")
+
+    # the changes listed by git would not apply to the paths in the list
+    if kwargs.get("changed_since") and kwargs.get("files_from") is not None:
+        errors.append(
+            "argument to files-from not allowed with argument to"
+            " changed-since",
+        )
+
+    # source read from stdin is checked in place of any paths, which
+    # would otherwise be left unchecked without a word
+    if kwargs.get("stdin_filename") is not None:
+        if args:
+            errors.append(
+                "path(s) not allowed with argument to stdin-filename",
+            )
+
+        if kwargs.get("files_from") is not None:
+            errors.append(
+                "argument to files-from not allowed with argument to"
+                " stdin-filename",
+            )
+
     if kwargs.get("check_class") and kwargs.get("check_class_constructor"):
         errors.append(
             "argument to check class constructor not allowed with"
@@ -72,9 +106,9 @@ def _validation_errors(
 def validate_args(func: _FuncType) -> _FuncType:
     """Validate arguments before calling the wrapped function.
 
-    If path or string is missing, or disable and target options are
-    unknown, or mutually exclusive options are set, return an error
-    string instead of calling the function.
+    If nothing to check is given, or an option has a value it cannot
+    take, or options that cannot be used together are, print the errors
+    and return the usage exit code instead of calling the function.
 
     Argparse is not sufficient if there is an issue with the
     pyproject.toml file or the API is used incorrectly.
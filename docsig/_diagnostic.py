@@ -97,6 +97,13 @@ class Collector:
         if value not in self._disabled and diagnostic not in self._diagnostics:
             self._diagnostics.append(diagnostic)
 
+    def restore(self, diagnostic: Diagnostic) -> None:
+        """Add a diagnostic reported by an earlier run.
+
+        :param diagnostic: Diagnostic to add.
+        """
+        self._diagnostics.append(diagnostic)
+
     @property
     def diagnostics(self) -> list[Diagnostic]:
         """Diagnostics sorted for stable output."""
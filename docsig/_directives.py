@@ -8,9 +8,12 @@ Parsing and storage for docsig comment directives.
 from __future__ import annotations as _
 
 import tokenize as _tokenize
+import typing as _t
+from bisect import bisect_right as _bisect_right
 from io import StringIO as _StringIO
 
 from .messages import E as _E
+from .messages import Message as _Message
 from .messages import Messages as _Messages
 
 #: scope for one line: the directive comments applying to the line
@@ -33,7 +36,6 @@ class Comment(_Messages):
     _valid_flags = ("next",)
 
     def __init__(self, string: str, col: int) -> None:
-        super().__init__()
         self._ismodule = col == 0
         parts = string.split("=")
         directive = parts[0].split("-")
@@ -51,17 +53,20 @@ class Comment(_Messages):
         # better not disable the commented function than disable the
         # whole file
         # note that no directive flag at all is still a valid flag
+        messages: _t.Iterable[_Message] = ()
         if self.isvalidflag:
             if len(parts) == 1:
-                self.extend(_E.all)
+                messages = _E.all
             else:
                 # whitespace around the separator is stripped, so that a
                 # list written the way prose is reads the same as a
                 # space free one
-                self.extend(
+                messages = (
                     _E.from_ref(i.strip()) for i in parts[1].split(",")
                 )
 
+        super().__init__(messages)
+
     @property
     def kind(self) -> str:
         """The type of this directive."""
@@ -131,20 +136,23 @@ class _Scanner:
         comments in between do not end that reach, and consecutive
         directives stack rather than replacing one another
 
+    A scope is never changed once made, but replaced by a new one, so
+    that lines sharing a scope share the same object, and it is only
+    recorded where it changes.
+
     :param messages: Initial list of messages to disable.
     """
 
     def __init__(self, messages: _Messages) -> None:
         self._directives = Directives()
-        self._comments = Comments()
-        self._messages = _Messages(messages)
+        self._scope: _Scope = Comments(), _Messages(messages)
 
         # module scope from before a 'next' directive, to restore after
         # the next statement
         self._next_scope: _Scope | None = None
 
         # scope of an inline directive, deferred to the following line
-        self._pending_inline: tuple[int, Comments, _Messages] | None = None
+        self._pending_inline: tuple[int, _Scope] | None = None
 
     @property
     def directives(self) -> Directives:
@@ -168,10 +176,9 @@ class _Scanner:
     def _visit(self, token: _tokenize.TokenInfo) -> None:
         lineno, col = token.start
 
-        # inherit the comments and messages defined in the module
-        # scope; module state is only updated if the comment turns out
-        # to be a module-level directive
-        scope: _Scope = Comments(self._comments), _Messages(self._messages)
+        # inherit the module scope, which is only replaced if the
+        # comment turns out to be a module-level directive
+        scope = self._scope
         if token.type == _tokenize.COMMENT:
             comment = Comment.parse(token.string, col)
             if comment is not None:
@@ -180,21 +187,20 @@ class _Scanner:
         elif self._next_scope is not None and token.type != _tokenize.NL:
             # a statement ends a 'next' directive: restore the module
             # scope from before the directive
-            # the scope copied above still carries the directive, so it
+            # the scope taken above still carries the directive, so it
             # applies to this line alone
             # comments are excluded so 'next' directives can be stacked
-            self._comments, self._messages = self._next_scope
+            self._scope = self._next_scope
             self._next_scope = None
 
         # an indented directive reaches the statement it annotates
         # across any blank or comment lines between the two
         if self._pending_inline is not None:
-            _, pending_comments, pending_messages = self._pending_inline
-            scope = Comments(pending_comments), _Messages(pending_messages)
+            scope = self._pending_inline[1]
 
-        # the first entry recorded for a line wins, unless an inline
+        # the first scope recorded for a line wins, unless an inline
         # directive already claimed the line in _apply
-        self._directives.setdefault(lineno, scope)
+        self._directives.record(lineno, scope)
         self._end_pending_inline(lineno, token.type)
 
     def _apply(self, comment: Comment, lineno: int, scope: _Scope) -> _Scope:
@@ -202,44 +208,35 @@ class _Scanner:
             # stack onto an indented directive that is still waiting
             # for its statement, so neither directive is lost, the way
             # module directives already accumulate
-            _, pending_comments, pending_messages = self._pending_inline
-            scope = Comments(pending_comments), _Messages(pending_messages)
+            scope = self._pending_inline[1]
 
-        comments, messages = scope
-        comments.append(comment)
+        comments, messages = Comments([*scope[0], comment]), scope[1]
         if comment.disable:
-            messages.extend(comment)
+            messages |= comment
 
         elif comment.enable:
-            messages = _Messages(i for i in self._messages if i not in comment)
+            messages = self._scope[1] - comment
 
         if comment.isnext and self._next_scope is None:
             # save module scope from before the directive so it can be
             # restored after the next statement
             # stacked 'next' directives keep the first snapshot
-            self._next_scope = (
-                Comments(self._comments),
-                _Messages(self._messages),
-            )
+            self._next_scope = self._scope
 
+        scope = comments, messages
         if comment.ismodule:
-            self._comments = comments
-            self._messages = messages
+            self._scope = scope
         else:
             # keep disable on this line even if an earlier token
             # already recorded an empty entry (e.g. a string arg before
             # an inline comment)
-            self._directives[lineno] = Comments(comments), _Messages(messages)
+            self._directives.record(lineno, scope, replace=True)
 
             # defer this scope to the following line without changing
             # module scope
-            self._pending_inline = (
-                lineno,
-                Comments(comments),
-                _Messages(messages),
-            )
+            self._pending_inline = lineno, scope
 
-        return comments, messages
+        return scope
 
     def _end_pending_inline(self, lineno: int, kind: int) -> None:
         # the end of a statement on a line after the directive ends its
@@ -253,22 +250,82 @@ class _Scanner:
             self._pending_inline = None
 
 
-class Directives(dict[int, _Scope]):
-    """Map line number to comments and disabled messages for that line.
+class Directives:
+    """Comments and disabled messages in effect at each line.
 
-    Keys are line numbers; values are tuples of comment directives and
-    the messages to disable at that line. Used when running checks to
-    respect inline and module-level docsig enable/disable directives.
+    Used when running checks to respect inline and module-level docsig
+    enable/disable directives. Scopes are stored as sorted intervals,
+    each from the line it takes effect at until the next, so the size
+    of the store follows the number of directives, rather than the
+    length of the source.
     """
 
+    def __init__(self) -> None:
+        # the first line of each interval, and its scope
+        self._lines: list[int] = []
+        self._scopes: list[_Scope] = []
+        # the last line recorded, whether or not its scope was stored
+        self._last = 0
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def record(
+        self,
+        lineno: int,
+        scope: _Scope,
+        replace: bool = False,
+    ) -> None:
+        """Record the scope in effect from a line.
+
+        Lines are recorded in order, and the first scope recorded for a
+        line is kept, unless replaced.
+
+        :param lineno: Line the scope takes effect at.
+        :param scope: Comments and disabled messages for the line.
+        :param replace: Replace the scope already recorded for the line.
+        """
+        if lineno == self._last:
+            if not replace:
+                return
+
+            if self._lines and self._lines[-1] == lineno:
+                self._scopes[-1] = scope
+                return
+
+        self._last = lineno
+        # a line sharing the scope of the line before it is left to it
+        if not self._scopes or self._scopes[-1] is not scope:
+            self._lines.append(lineno)
+            self._scopes.append(scope)
+
+    def get(self, lineno: int) -> _Scope:
+        """Get the comments and disabled messages in effect at a line.
+
+        :param lineno: Line to get the scope of.
+        :return: Comments and disabled messages for the line.
+        """
+        index = _bisect_right(self._lines, lineno) - 1
+        if index < 0:
+            return Comments(), _Messages()
+
+        return self._scopes[index]
+
     @classmethod
     def from_text(cls, text: str, messages: _Messages) -> Directives:
-        """Build a directives map from docsig directives in the code.
+        """Build directives from docsig directives in the code.
 
         :param text: Python source code to scan for directives.
         :param messages: Initial list of messages to disable.
-        :return: Directives instance keyed by line number.
+        :return: Directives for each line of the code.
         """
+        if f"{__package__}:" not in text:
+            # no directive to tokenize the source for, so every line has
+            # the same scope
+            directives = cls()
+            directives.record(1, (Comments(), _Messages(messages)))
+            return directives
+
         scanner = _Scanner(messages)
         scanner.scan(text)
         return scanner.directives
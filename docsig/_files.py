@@ -5,57 +5,175 @@ docsig._files
 Path collection and filtering for files to check.
 """
 
+import contextlib as _contextlib
 import logging as _logging
 import os as _os
 import re as _re
+import stat as _stat
+import subprocess as _subprocess
+import sys as _sys
+import typing as _t
 from pathlib import Path as _Path
 
 from pathspec import PathSpec as _PathSpec
 from pathspec.patterns import GitWildMatchPattern as _GitWildMatchPattern
-from wcmatch.pathlib import Path as _WcPath
+from wcmatch import glob as _glob
 
+from ._config import STAGED as _STAGED
 from ._config import Filters as _Filters
 
 FILE_INFO = "%s: %s"
 
+#: value of files_from reading the list of paths from stdin
+STDIN = "-"
+
+# bytes of a list of paths read at a time, so the paths at the start of
+# the list are checked while the rest is still being written
+_CHUNK = 64 * 1024
+
 
 class _Gitignore(_PathSpec):
-    def __init__(self, repo: _Path | None = None) -> None:
-        patterns = []
-        # only consider gitignore patterns valid if inside a git repo
-        # there might be stray gitignore files lying about
-        if repo is not None:
-            # add patterns from all gitignore files
-            # adjust patterns to account for their relative paths
-            for file in repo.rglob(".gitignore"):
-                for pattern in file.read_text(encoding="utf-8").splitlines():
-                    if pattern.startswith("#"):
-                        continue
-
-                    # if the pattern starts with "/" then os.path.join
-                    # will consider it in the filesystem root, and it
-                    # will only ever return /pattern
-                    if pattern.startswith("/"):
-                        pattern = pattern[1:]
-
-                    # use os.path.dirname, so it joins without a leading
-                    # "./", like it does with pathlib parent
-                    # use os.path.join so trailing slash is preserved
-                    # replace sep with "/" as, even on windows,
-                    # gitignore patterns only ever use "/"
-                    patterns.append(
-                        _os.path.join(
-                            _os.path.dirname(file.relative_to(repo)),
-                            pattern.strip(),
-                        ).replace(_os.sep, "/"),
-                    )
-
-        super().__init__(map(_GitWildMatchPattern, patterns))
-
-
-def _glob(path: _Path, pattern: str) -> bool:
-    # pylint: disable-next=no-member
-    return _WcPath(str(path)).globmatch(pattern)  # type: ignore
+    def __init__(self, directory: _Path | None = None) -> None:
+        # the patterns of a single gitignore file, which are relative to
+        # the directory holding it
+        lines = []
+        if directory is not None:
+            file = directory / ".gitignore"
+            if file.is_file():
+                lines = file.read_text(encoding="utf-8").splitlines()
+
+        super().__init__(
+            _GitWildMatchPattern(i.strip())
+            for i in lines
+            if not i.startswith("#")
+        )
+
+    def decide(self, path: str) -> bool | None:
+        """Say whether the patterns of this file ignore a path.
+
+        :param path: Path relative to the directory holding the file.
+        :return: Whether the path is ignored, or None if no pattern
+            matches it.
+        """
+        # like git, the last pattern to match decides, so a negated
+        # pattern can re-include what an earlier one ignored, and no
+        # match leaves it to the gitignore files further up
+        for pattern in reversed(self.patterns):
+            if (
+                pattern.include is not None
+                and pattern.match_file(path) is not None
+            ):
+                return pattern.include
+
+        return None
+
+
+# flags set for a whole pattern, which can only be given at its start
+_GLOBAL_FLAGS = _re.compile(r"\(\?([aiLmsux]+)\)")
+
+# a backreference by number counts the groups of every pattern joined
+# before it, and one by name may repeat the name of another's group
+_BACKREF = _re.compile(r"\\[1-9]|\(\?P=")
+
+# a pattern looking ahead can rule out any path below a directory
+_LOOKAHEAD = _re.compile(r"\(\?[=!]")
+
+# a pattern anchored at the end, or a word boundary, looks past the end
+# of what it matches
+_ANCHORED = _re.compile(r"\$|\\[ZbB]")
+
+# a pattern ending in this matches a directory and every path below it
+_DIR_TAIL = f"({_re.escape(_os.sep)}.*)?$"
+
+# globs match as a path object matches them, as a path of this system
+_GLOB_FLAGS = _glob.FORCEWIN if _os.name == "nt" else _glob.FORCEUNIX
+
+
+def _join(patterns: list[str]) -> str | None:
+    # join patterns into one alternation, which matches where any one
+    # of them would, with the flags each starts with scoped to it, or
+    # None if one cannot be scoped
+    alternatives = []
+    for pattern in patterns:
+        flags = ""
+        match = _GLOBAL_FLAGS.match(pattern)
+        if match is not None:
+            flags = match.group(1)
+            pattern = pattern[match.end() :]
+            if "x" in flags:
+                # a verbose pattern may end in a comment
+                pattern += "\n"
+
+        if _GLOBAL_FLAGS.search(pattern) or _BACKREF.search(pattern):
+            return None
+
+        alternatives.append(f"(?{flags}:{pattern})")
+
+    return "|".join(alternatives)
+
+
+class _Excludes:
+    # exclude regexes and globs compiled once for a walk, so a path is
+    # matched against each kind once, rather than once per pattern
+    def __init__(self, filters: _Filters) -> None:
+        self._regexes = [_re.compile(i) for i in filters.exclude]
+        joined = _join(filters.exclude)
+        if joined:
+            try:
+                self._regexes = [_re.compile(joined)]
+            except _re.error:
+                pass
+
+        # patterns certain to match every path below a directory they
+        # match, each with whether it is matched against the directory
+        # itself, or the directory with a trailing separator
+        self._dir_regexes = []
+        for pattern in filters.exclude:
+            head = pattern.removesuffix(_DIR_TAIL)
+            if not _LOOKAHEAD.search(head) and not _ANCHORED.search(head):
+                self._dir_regexes.append(
+                    (_re.compile(pattern), head != pattern),
+                )
+
+        self._globs = (
+            _glob.compile(filters.excludes, flags=_GLOB_FLAGS)
+            if filters.excludes
+            else None
+        )
+
+    def file(self, path: _Path) -> bool:
+        """Say whether a file is excluded.
+
+        :param path: Path to the file, as it was reached.
+        :return: Whether an exclude regex or glob matches the file.
+        """
+        string = str(path)
+        return any(i.match(string) for i in self._regexes) or (
+            self._globs is not None and self._globs.match(string)
+        )
+
+    def dir(self, path: _Path) -> bool:
+        """Say whether every path below a directory is excluded.
+
+        :param path: Path to the directory, as it was reached.
+        :return: Whether the directory can be left without walking it.
+        """
+        # a pattern not anchored at the end only looks at the start of
+        # a path, so if it matches the directory with a separator it
+        # matches every path that continues it, and one ending in
+        # _DIR_TAIL matches every path below a directory it matches
+        # anything else, such as a pattern matching names without a
+        # suffix, may match the directory but not what is in it, so
+        # its files are walked and matched one at a time
+        # globs match a fixed number of parts, so cannot say anything
+        # about what is below a directory, and are only matched against
+        # files
+        string = str(path)
+        prefix = f"{string}{_os.sep}"
+        return any(
+            regex.match(string if whole else prefix)
+            for regex, whole in self._dir_regexes
+        )
 
 
 def _find_repo(path: _Path) -> _Path | None:
@@ -71,75 +189,400 @@ def _find_repo(path: _Path) -> _Path | None:
     return None
 
 
-class Files(list[_Path]):
-    """Collect paths to check (gitignore and exclude applied).
+def _git(repo: _Path, *args: str) -> list[str]:
+    # output of git, split on nul, as paths are listed with -z
+    process = _subprocess.run(
+        ["git", *args],
+        cwd=repo,
+        capture_output=True,
+        check=False,
+    )
+    if process.returncode:
+        raise RuntimeError(process.stderr.decode().strip())
 
-    :param paths: Path(s) to collect (files or directories).
-    :param filters: Filters object.
-    """
+    return [i for i in process.stdout.decode().split("\0") if i]
 
-    def __init__(
-        self,
-        paths: tuple[str | _Path, ...],
-        filters: _Filters,
-    ) -> None:
-        super().__init__()
-        self._include_ignored = filters.include_ignored
-        self._repo: _Path | None = None
-        self._gitignore = _Gitignore()
-        logger = _logging.getLogger(__package__)
+
+def _git_changed(repo: _Path, ref: str) -> list[_Path]:
+    # added, copied, modified, and renamed, as there is nothing left to
+    # check of a deleted file
+    args = ["diff", "--name-only", "-z", "--diff-filter=ACMR"]
+    untracked = []
+    if ref == _STAGED:
+        args.append("--cached")
+    else:
+        # changed since the branch left the ref, as a three dot diff
+        # would, but including changes not yet committed, as well as
+        # files not yet added
+        (base,) = _git(repo, "merge-base", ref, "HEAD")
+        args.extend([base.strip(), "--"])
+        untracked = _git(
+            repo,
+            "ls-files",
+            "-z",
+            "--others",
+            "--exclude-standard",
+        )
+
+    return [repo / i for i in (*_git(repo, *args), *untracked)]
+
+
+def _changed(roots: list[_Path], ref: str) -> list[_Path]:
+    # ask git which files changed rather than walking each path, so the
+    # cost is in the number of changed files, not the size of the repo
+    changed: dict[_Path, list[_Path]] = {}
+    files = set()
+    cwd = _Path.cwd().resolve()
+    for root in roots:
+        repo = _find_repo(root)
+        if repo is None:
+            raise RuntimeError(f"{root} is not in a git repository")
+
+        if repo not in changed:
+            changed[repo] = _git_changed(repo, ref)
+
+        resolved = root.resolve()
+        for file in changed[repo]:
+            # a file staged and then deleted is no longer there to check
+            if (
+                file.suffix == ".py"
+                and (file == resolved or resolved in file.parents)
+                and file.is_file()
+            ):
+                # reported relative to where the run was invoked from,
+                # like the paths of a walk
+                try:
+                    files.add(file.relative_to(cwd))
+                except ValueError:
+                    files.add(file)
+
+    return sorted(files)
+
+
+class _Walker:
+    def __init__(self, filters: _Filters) -> None:
+        self._filters = filters
+        self._excludes = _Excludes(filters)
         # gitignore patterns come from the repo each checked path
         # belongs to, which is not necessarily the repo containing the
         # current working directory
-        gitignores: dict[_Path | None, _Gitignore] = {}
-        for path in paths:
-            root = _Path(path)
-            self._repo = _find_repo(root)
-            if self._repo not in gitignores:
-                gitignores[self._repo] = _Gitignore(self._repo)
-
-            self._gitignore = gitignores[self._repo]
-            self._populate(root)
-
-        for path in list(self):
-            if any(_re.match(i, str(path)) for i in filters.exclude) or any(
-                _glob(path, i) for i in filters.excludes
+        self._repo: _Path | None = None
+        # the repo of each directory reached looking for one, so a list
+        # of thousands of files in the same repo only looks once
+        self._repos: dict[_Path, _Path | None] = {}
+        # gitignore files are only read for the directories the walk
+        # enters, and the ones above them, each no more than once
+        self._gitignores: dict[_Path, _Gitignore] = {}
+        # device and inode of each file yielded, so a file reached by
+        # more than one path, such as through overlapping paths given
+        # to check, is only checked once
+        self._seen: set[tuple[int, int] | None] = set()
+
+    def walk(self, root: _Path) -> _t.Iterator[_Path]:
+        """Yield the files to check at or below a path.
+
+        :param root: File or directory to walk.
+        :return: Iterator of files not ignored, excluded, or already
+            yielded.
+        """
+        self._repo = self._find_repo(root.resolve())
+        logger = _logging.getLogger(__package__)
+        if not self._filters.include_ignored and self._ignored_parent(root):
+            logger.debug(FILE_INFO, root, "in gitignore, skipping")
+            return
+
+        try:
+            stat = root.stat()
+        except FileNotFoundError:
+            # a path that does not exist is not walked, so only a broken
+            # link given to check is left
+            logger.debug(FILE_INFO, root, "broken link, skipping")
+            return
+
+        yield from self._visit(
+            root,
+            self._relative(root),
+            _stat.S_ISREG(stat.st_mode),
+            _stat.S_ISDIR(stat.st_mode),
+            (stat.st_dev, stat.st_ino),
+        )
+
+    def excluded(self, file: _Path) -> bool:
+        """Say whether the walk would skip a file, were it to reach it.
+
+        :param file: Path to the file, which need not exist.
+        :return: Whether the file is gitignored or excluded.
+        """
+        self._repo = self._find_repo(file.resolve())
+        if not self._filters.include_ignored:
+            relative = self._relative(file)
+            if self._ignored_parent(file) or (
+                relative is not None and self._matched(relative, False)
             ):
-                logger.debug(FILE_INFO, path, "in exclude list, skipping")
-                self.remove(path)
+                return True
 
-        self.sort()
+        return self._excludes.file(file)
 
-    def _populate(self, root: _Path) -> None:
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def _visit(
+        self,
+        path: _Path,
+        relative: tuple[str, ...] | None,
+        is_file: bool,
+        is_dir: bool,
+        key: tuple[int, int] | None,
+    ) -> _t.Iterator[_Path]:
+        # the key is the device and inode of a file, and None otherwise
         logger = _logging.getLogger(__package__)
-        if not root.exists():
-            if root.is_symlink():
-                logger.debug(FILE_INFO, root, "broken link, skipping")
+        if (
+            not self._filters.include_ignored
+            and relative is not None
+            and self._matched(relative, is_dir)
+        ):
+            logger.debug(FILE_INFO, path, "in gitignore, skipping")
+            return
+
+        if is_file:
+            if self._excludes.file(path):
+                logger.debug(FILE_INFO, path, "in exclude list, skipping")
+            elif key not in self._seen:
+                self._seen.add(key)
+                yield path
+
+        elif is_dir:
+            # a directory every file below would be excluded from is
+            # never entered, such as a virtualenv
+            if self._excludes.dir(path):
+                logger.debug(FILE_INFO, path, "in exclude list, skipping")
                 return
 
-            raise FileNotFoundError(root)
+            yield from self._scan(path, relative)
 
-        if not self._include_ignored and self._ignored(root):
-            logger.debug(FILE_INFO, root, "in gitignore, skipping")
-            return
+    def _scan(
+        self,
+        directory: _Path,
+        relative: tuple[str, ...] | None,
+    ) -> _t.Iterator[_Path]:
+        # the type of each entry is read with the directory, rather than
+        # asked of each path
+        with _os.scandir(directory) as it:
+            entries = {directory / i.name: i for i in it}
 
-        if root.is_file():
-            self.append(root)
+        # a file that is not a link is on the device of its directory,
+        # and its inode is read with the directory, so only the
+        # directory is stat-ed for the key of each file
+        device = directory.stat().st_dev
 
-        if root.is_dir():
-            for path in root.iterdir():
-                self._populate(path)
+        # paths compare part by part, so visiting each directory's
+        # entries in sorted order yields the files already sorted
+        for path in sorted(entries):
+            entry = entries[path]
+            is_file = entry.is_file()
+            is_dir = not is_file and entry.is_dir()
+            if not is_file and not is_dir and not _os.path.exists(path):
+                logger = _logging.getLogger(__package__)
+                logger.debug(FILE_INFO, path, "broken link, skipping")
+                continue
 
-    def _ignored(self, path: _Path) -> bool:
+            key = None
+            if is_file and entry.is_symlink():
+                # a link is keyed by the file it points to, so the file is
+                # checked once however it is reached, and stat-ed through
+                # its path, as an entry carries neither on windows
+                stat = path.stat()
+                key = stat.st_dev, stat.st_ino
+            elif is_file:
+                key = device, entry.inode()
+
+            # the path a link points to is what gitignore patterns are
+            # matched against, so only a link's is worked out again
+            if entry.is_symlink():
+                child = self._relative(path)
+            elif relative is not None:
+                child = (*relative, entry.name)
+            else:
+                child = None
+
+            yield from self._visit(path, child, is_file, is_dir, key)
+
+    def _find_repo(self, path: _Path) -> _Path | None:
+        # as _find_repo, remembering the answer for each path on the way
+        if path not in self._repos:
+            git = path / ".git"
+            if (git / "HEAD").is_file() or git.is_file():
+                self._repos[path] = path
+            elif path.parent == path:
+                self._repos[path] = None
+            else:
+                self._repos[path] = self._find_repo(path.parent)
+
+        return self._repos[path]
+
+    def _gitignore(self, directory: _Path) -> _Gitignore:
+        if directory not in self._gitignores:
+            self._gitignores[directory] = _Gitignore(directory)
+
+        return self._gitignores[directory]
+
+    def _relative(self, path: _Path) -> tuple[str, ...] | None:
         # gitignore patterns are relative to the repo root, so the path
         # is matched relative to the repo root too, wherever the run
         # was invoked from
         if self._repo is None:
-            return False
+            return None
 
         try:
-            relative = path.resolve().relative_to(self._repo)
+            return path.resolve().relative_to(self._repo).parts
         except ValueError:
+            return None
+
+    def _ignored_parent(self, path: _Path) -> bool:
+        # a path given to check is ignored if a directory it is in is,
+        # which would have kept the walk from reaching it
+        relative = self._relative(path)
+        if relative is None:
             return False
 
-        return self._gitignore.match_file(relative)
+        return any(
+            self._matched(relative[:count], True)
+            for count in range(1, len(relative))
+        )
+
+    def _matched(self, parts: tuple[str, ...], is_dir: bool) -> bool:
+        # only called with parts relative to a repo, so there is one
+        repo = _t.cast(_Path, self._repo)
+        # the gitignore file nearest to the path decides, as one further
+        # down the tree overrides those above it
+        # a trailing slash lets patterns only for directories match
+        suffix = "/" if is_dir else ""
+        for depth in reversed(range(len(parts))):
+            gitignore = self._gitignore(repo.joinpath(*parts[:depth]))
+            decision = gitignore.decide(f"{'/'.join(parts[depth:])}{suffix}")
+            if decision is not None:
+                return decision
+
+        return False
+
+
+def _split(fd: int) -> _t.Iterator[str]:
+    # paths are separated by NULs, as git ls-files -z lists them, if
+    # the first separator is one, and by newlines otherwise
+    separator = None
+    pending = b""
+    # each read returns what is available, rather than waiting on a pipe
+    # to fill the chunk
+    for chunk in iter(lambda: _os.read(fd, _CHUNK), b""):
+        pending += chunk
+        if separator is None:
+            nul, newline = pending.find(b"\0"), pending.find(b"\n")
+            if nul == newline == -1:
+                continue
+
+            separator = b"\0" if newline == -1 or -1 < nul < newline else b"\n"
+
+        *lines, pending = pending.split(separator)
+        for line in lines:
+            # a list written on windows ends its lines with \r\n
+            if separator == b"\n":
+                line = line.removesuffix(b"\r")
+
+            yield _os.fsdecode(line)
+
+    yield _os.fsdecode(pending)
+
+
+def _listed(files_from: str) -> _t.Iterator[_Path]:
+    # the paths listed in a file, or stdin, as they are read
+    with _contextlib.ExitStack() as stack:
+        if files_from == STDIN:
+            fd = _sys.stdin.fileno()
+        else:
+            fd = stack.enter_context(open(files_from, "rb")).fileno()
+
+        yield from (_Path(i) for i in _split(fd) if i)
+
+
+def iter_files(
+    paths: tuple[str | _Path, ...],
+    filters: _Filters,
+) -> _t.Iterator[_Path]:
+    """Yield paths to check as they are found (gitignore and exclude).
+
+    Each directory is scanned only when reached, so checking can start
+    before the whole tree has been walked. Files are yielded in sorted
+    order within each path, and paths in sorted order.
+
+    If the filters select files changed since a git ref, only those
+    below the paths are yielded, and no directory is walked.
+
+    If the filters name a list of paths, those listed are yielded after
+    the paths, in the order they are read, skipping any that do not
+    exist. If the list is trusted, files are yielded as listed, without
+    gitignore or exclude patterns being applied to them, and only a
+    directory listed is walked.
+
+    :param paths: Path(s) to collect (files or directories).
+    :param filters: Filters object.
+    :return: Iterator of paths to check.
+    :raises FileNotFoundError: If a path given does not exist.
+    :raises RuntimeError: If changed files cannot be listed by git.
+    """
+    roots = sorted(map(_Path, paths))
+    # raise for a mistyped path before anything is checked, rather than
+    # partway through the run
+    for root in roots:
+        if not root.exists() and not root.is_symlink():
+            raise FileNotFoundError(root)
+
+    if filters.changed_since is not None:
+        roots = _changed(roots, filters.changed_since)
+
+    walker = _Walker(filters)
+    for root in roots:
+        yield from walker.walk(root)
+
+    if filters.files_from is not None:
+        logger = _logging.getLogger(__package__)
+        for path in _listed(filters.files_from):
+            try:
+                mode = path.stat().st_mode
+            except (FileNotFoundError, NotADirectoryError):
+                # a list can be written before a file in it is removed,
+                # which leaves nothing to check, not a mistyped path
+                logger.debug(FILE_INFO, path, "does not exist, skipping")
+                continue
+
+            # a directory cannot be checked as it is listed, so it is
+            # walked, even if the list is trusted
+            if filters.trust_files_from and not _stat.S_ISDIR(mode):
+                yield path
+            else:
+                yield from walker.walk(path)
+
+
+def excluded(file: _Path, filters: _Filters) -> bool:
+    """Tell whether a file would be skipped (gitignore and exclude).
+
+    The file is matched as if it was walked to, but does not have to
+    exist, such as the path of unsaved source.
+
+    :param file: Path to the file.
+    :param filters: Filters object.
+    :return: Whether the file would be skipped.
+    """
+    return _Walker(filters).excluded(file)
+
+
+class Files(list[_Path]):
+    """Collect paths to check (gitignore and exclude applied).
+
+    :param paths: Path(s) to collect (files or directories).
+    :param filters: Filters object.
+    """
+
+    def __init__(
+        self,
+        paths: tuple[str | _Path, ...],
+        filters: _Filters,
+    ) -> None:
+        super().__init__(iter_files(paths, filters))
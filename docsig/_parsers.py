@@ -3,14 +3,22 @@ docsig._parsers
 ===============
 """
 
+import contextlib as _contextlib
+import io as _io
 import logging as _logging
+import mmap as _mmap
 import os as _os
+import re as _re
+import typing as _t
+from ast import Module as _Module
 from pathlib import Path as _Path
 from tokenize import TokenError as _TokenError
 from tokenize import detect_encoding as _detect_encoding
 
 import astroid as _ast
 
+from . import _profile
+from ._backend import Backend as _Backend
 from ._config import Config as _Config
 from ._directives import Directives as _Directives
 from ._files import FILE_INFO as _FILE_INFO
@@ -23,12 +31,40 @@ _ERRORS = (
     _ast.DuplicateBasesError,
 )
 
+# a module without either keyword has no function or class to check
+_CHECKABLE = _re.compile(r"\b(?:def|class)\b")
+
+#: files of at least this many bytes are mapped into memory rather
+#: than copied into it
+MMAP_SIZE = 1024 * 1024
+
+#: raw bytes of a file, read or mapped into memory
+Source = bytes | _mmap.mmap
+
+
+def _directives(
+    code: str,
+    config: _Config,
+    source_name: _Path | str,
+) -> _Directives:
+    try:
+        return _Directives.from_text(code, config.disable)
+    except _TokenError as err:
+        logger = _logging.getLogger(__package__)
+        logger.debug(
+            _FILE_INFO,
+            source_name,
+            f"error parsing comments {err}".lower(),
+        )
+        return _Directives()
+
 
 def parse_from_string(
     code: str,
     config: _Config,
     module_name: str = "",
     file: _Path | None = None,
+    tree: _Module | None = None,
 ) -> _Scope:
     """Build a scope from a string of Python code.
 
@@ -40,23 +76,27 @@ def parse_from_string(
     :param config: Configuration object.
     :param module_name: Module name, or empty string.
     :param file: Path for the source (or None for stdin).
+    :param tree: Stdlib AST already parsed from the code, if any.
     :return: Scope for the parsed code or syntax error.
     """
     logger = _logging.getLogger(__package__)
     source_name = file or "stdin"
+    backend = _Backend(code, module_name, file, tree)
     try:
-        node = _ast.parse(code, module_name, str(file))
-        try:
-            directives = _Directives.from_text(code, config.disable)
-        except _TokenError as err:
-            directives = _Directives()
-            logger.debug(
-                _FILE_INFO,
-                source_name,
-                f"error parsing comments {err}".lower(),
-            )
-
-        scope = _Scope.from_ast(node, directives, file, config)
+        with _profile.stage(_profile.Stage.PARSE):
+            node = backend.parse()
+
+        # nothing to check, such as a constants module or a package
+        # __init__ of imports, so there are no comments to read either
+        if _CHECKABLE.search(code) is None:
+            scope = _Scope()
+        else:
+            with _profile.stage(_profile.Stage.DIRECTIVES):
+                directives = _directives(code, config, source_name)
+
+            with _profile.stage(_profile.Stage.SCOPE):
+                scope = _Scope.from_ast(node, directives, config, backend)
+
         logger.debug(_FILE_INFO, source_name, "parsing python code successful")
     except _ERRORS as err:
         logger.debug(
@@ -69,44 +109,105 @@ def parse_from_string(
     return scope
 
 
-def _source_encoding(file: _Path) -> str:
+def _decode(source: Source) -> str:
     # follow the python tokenizer's own rules (pep 263 cookie or bom) so
     # any file cpython can run can be read; fall back to utf-8 when
     # detection itself fails, so undecodable files still surface as
     # unicode-decode-error
+    # a cookie can only be on the first two lines, so only they are
+    # copied for detection, not all of a mapped file
+    end = source.find(b"\n", source.find(b"\n") + 1)
+    head = source[: end + 1] if end != -1 else source[:]
     try:
-        with file.open("rb") as fd:
-            return _detect_encoding(fd.readline)[0]
+        encoding = _detect_encoding(_io.BytesIO(head).readline)[0]
     except SyntaxError:
-        return "utf-8"
+        encoding = "utf-8"
+
+    code = str(source, encoding)
+    # newlines are translated as they would be reading the file as text
+    if "\r" in code:
+        code = code.replace("\r\n", "\n").replace("\r", "\n")
+
+    return code
+
+
+def _python_or_empty(scope: _Scope, file: _Path) -> _Scope:
+    # not all python files end with .py, but considering this isn't a
+    # *.py file and there was an error parsing the file it's likely not
+    # meant to bea a python file
+    # return empty scope without the error
+    if scope.error is not None and not file.name.endswith(".py"):
+        return _Scope()
+
+    return scope
+
+
+def parse_from_source(
+    code: str,
+    config: _Config,
+    file: _Path,
+    tree: _Module | None = None,
+) -> _Scope:
+    """Build a scope from the source of a file, saved or not.
+
+    Parse the code as though it was read from the file. On syntax error
+    and a non-.py path, returns an empty scope (not treated as Python).
+
+    :param code: Python source to parse.
+    :param config: Configuration object.
+    :param file: Path the source belongs to.
+    :param tree: Stdlib AST already parsed from the code, if any.
+    :return: Scope for the parsed source or an error/empty scope.
+    """
+    module_name = str(file)[:-3].replace(_os.sep, ".").replace("-", "_")
+    return _python_or_empty(
+        parse_from_string(code, config, module_name, file, tree),
+        file,
+    )
+
+
+@_contextlib.contextmanager
+def read_source(file: _Path) -> _t.Iterator[Source]:
+    """Read the raw bytes of a file, once.
 
+    A file of at least ``MMAP_SIZE`` bytes is mapped into memory rather
+    than copied into it, and is only mapped within this context.
 
-def parse_from_file(file: _Path, config: _Config) -> _Scope:
-    """Build a scope from a file containing Python code.
+    :param file: Path to the file to read.
+    :return: Context holding the bytes of the file.
+    """
+    with file.open("rb") as fd:
+        size = _os.fstat(fd.fileno()).st_size
+        # an empty file, which cannot be mapped, is always read
+        if size < MMAP_SIZE:
+            with _profile.stage(_profile.Stage.READ):
+                source = fd.read()
+
+            yield source
+        else:
+            with _mmap.mmap(fd.fileno(), 0, access=_mmap.ACCESS_READ) as mm:
+                yield mm
+
+
+def parse_from_bytes(source: Source, config: _Config, file: _Path) -> _Scope:
+    """Build a scope from the raw bytes of a file.
 
-    Reads the file and delegates to parse_from_string. On UnicodeError,
-    returns a scope with a Unicode error. On syntax error and a non-.py
-    path, returns an empty scope (not treated as Python).
+    Decodes the bytes the way Python would the file and delegates to
+    parse_from_source. On UnicodeError, returns a scope with a Unicode
+    error. On syntax error and a non-.py path, returns an empty scope
+    (not treated as Python).
 
-    :param file: Path to the file to parse.
+    :param source: Raw bytes of the file.
     :param config: Configuration object.
+    :param file: Path the bytes were read from.
     :return: Scope for the parsed file or an error/empty scope.
     """
     try:
-        code = file.read_text(encoding=_source_encoding(file))
-        module_name = str(file)[:-3].replace(_os.sep, ".").replace("-", "_")
-        scope = parse_from_string(code, config, module_name, file)
-
+        with _profile.stage(_profile.Stage.READ):
+            code = _decode(source)
     except UnicodeDecodeError as err:
         logger = _logging.getLogger(__package__)
         logger.debug(_FILE_INFO, file, str(err).replace("\n", " "))
-        scope = _Scope.from_error(type(err))
+        return _python_or_empty(_Scope.from_error(type(err)), file)
 
-    # not all python files end with .py, but considering this isn't a
-    # *.py file and there was an error parsing the file it's likely not
-    # meant to bea a python file
-    # return empty scope without the error
-    if scope.error is not None and not file.name.endswith(".py"):
-        scope = _Scope()
-
-    return scope
+    return parse_from_source(code, config, file)
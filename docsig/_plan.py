@@ -0,0 +1,133 @@
+"""
+docsig._plan
+============
+
+Checks a configuration can raise, worked out once for a run.
+"""
+
+from __future__ import annotations as _
+
+import typing as _t
+from dataclasses import dataclass as _dataclass
+from enum import Enum as _Enum
+
+from .messages import E as _E
+from .messages import Messages as _Messages
+
+# for annotations alone, as importing them here would be circular
+if _t.TYPE_CHECKING:  # pragma: no cover
+    from ._config import Config as _Config
+    from ._scope import Function as _Function
+    from ._scope import Scope as _Scope
+
+#: scope or function holding a function
+_Parent: _t.TypeAlias = "_Scope | _Function"
+
+#: test of a function, and the scope or function holding it, for a
+#: reason not to check it
+_Skip = _t.Callable[["_Function", _Parent], bool]
+
+
+class Family(_Enum):
+    """Checks run together, by the hundreds of the codes they raise."""
+
+    MISSING = 1
+    SIGNATURE = 2
+    DESCRIPTION = 3
+    PARAMETERS = 4
+    RETURNS = 5
+
+
+# the messages each family can raise, e.g. SIG1xx, held apart from the
+# enum so families raising equal messages are not made aliases
+_MESSAGES = {
+    i: _Messages(v for k, v in _E.items() if k // 100 == i.value)
+    for i in Family
+}
+
+# families of checks that read the docstring of a documented function
+_READ_DOCSTRING = (
+    Family.SIGNATURE,
+    Family.DESCRIPTION,
+    Family.PARAMETERS,
+    Family.RETURNS,
+)
+
+
+def _protected(function: _Function, _: _Parent) -> bool:
+    return function.isprotected
+
+
+def _dunder(function: _Function, _: _Parent) -> bool:
+    return function.isdunder
+
+
+def _bare(function: _Function, _: _Parent) -> bool:
+    return function.docstring.bare
+
+
+def _init(function: _Function, _: _Parent) -> bool:
+    return function.isinit
+
+
+def _init_of_protected(function: _Function, parent: _Parent) -> bool:
+    return function.isinit and parent.isprotected
+
+
+@_dataclass(frozen=True)
+# pylint: disable-next=too-few-public-methods
+class Plan:
+    """Checks a configuration can raise, worked out once for a run.
+
+    :param skips: Reasons not to check a function, in the order they
+        are tested.
+    :param families: Families of checks that can raise a message, in
+        the order they are run.
+    :param disabled: Messages disabled for every function.
+    :param skip_overridden: Whether a function overriding a method of a
+        base class is not reported, which is only asked of one that
+        fails, as the ancestors of its class may need to be inferred.
+    """
+
+    skips: tuple[_Skip, ...]
+    families: tuple[Family, ...]
+    disabled: _Messages
+    skip_overridden: bool
+
+    @classmethod
+    def from_config(cls, config: _Config) -> Plan:
+        """Work out the checks a configuration can raise.
+
+        :param config: Configuration object.
+        :return: Plan of the checks to run.
+        """
+        check = config.check
+        skips: list[_Skip] = []
+        if not check.protected:
+            skips.append(_protected)
+
+        if not check.dunders:
+            skips.append(_dunder)
+
+        if not (check.class_ or check.class_constructor):
+            skips.append(_init)
+        elif not check.protected:
+            skips.append(_init_of_protected)
+
+        # targeting a subset of checks disables everything else
+        disabled = _E.all - config.target if config.target else _Messages()
+        families = tuple(i for i in Family if _MESSAGES[i] - disabled)
+        # a docstring is only parsed to find it documents nothing if a
+        # check that would read it is run, and tested last, as it is
+        # the only reason not to check a function that costs a parse
+        if config.ignore.no_params and any(
+            i in families for i in _READ_DOCSTRING
+        ):
+            skips.append(_bare)
+
+        return cls(
+            tuple(skips),
+            families,
+            disabled,
+            not check.overridden,
+        )
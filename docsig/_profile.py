@@ -0,0 +1,284 @@
+"""
+docsig._profile
+===============
+
+Time spent in each stage of a run, and on each file.
+"""
+
+from __future__ import annotations as _
+
+import contextlib as _contextlib
+import json as _json
+import sys as _sys
+import time as _time
+import typing as _t
+from dataclasses import asdict as _asdict
+from dataclasses import dataclass as _dataclass
+from enum import Enum as _Enum
+from pathlib import Path as _Path
+
+#: files listed as the slowest in a profile
+SLOWEST = 10
+
+
+class Stage(str, _Enum):
+    """Stages of a run, in the order they are reached for a file."""
+
+    DISCOVERY = "discovery"
+    READ = "read"
+    PARSE = "parse"
+    DIRECTIVES = "directives"
+    SCOPE = "scope"
+    CHECK = "check"
+    REPORT = "report"
+
+
+@_dataclass
+# pylint: disable-next=too-few-public-methods
+class Timing:
+    """Wall and CPU time, in seconds.
+
+    :param wall: Wall time, in seconds.
+    :param cpu: CPU time, in seconds.
+    """
+
+    wall: float = 0.0
+    cpu: float = 0.0
+
+    def add(self, other: Timing) -> None:
+        """Add the time of another timing to this one.
+
+        :param other: Timing to add.
+        """
+        self.wall += other.wall
+        self.cpu += other.cpu
+
+
+class Profile:
+    """Time spent in each stage of a run, and on each file.
+
+    The time of a stage excludes any stage entered within it, e.g. the
+    files read while a report is printed as each one is checked.
+    """
+
+    def __init__(self) -> None:
+        self._stages = {i: Timing() for i in Stage}
+        self._files: dict[str, dict[Stage, Timing]] = {}
+        self._file: dict[Stage, Timing] | None = None
+        # time of the stages entered within each stage in progress
+        self._nested: list[Timing] = []
+
+    @property
+    def stages(self) -> dict[Stage, Timing]:
+        """Time spent in each stage."""
+        return self._stages
+
+    @property
+    def files(self) -> dict[str, dict[Stage, Timing]]:
+        """Time spent in each stage, for each file."""
+        return self._files
+
+    @_contextlib.contextmanager
+    def stage(self, stage_: Stage) -> _t.Iterator[None]:
+        """Time a stage, for the file being checked, if any.
+
+        :param stage_: Stage to time.
+        :return: Context in which the stage is timed.
+        """
+        wall, cpu = _time.perf_counter(), _time.process_time()
+        self._nested.append(Timing())
+        try:
+            yield
+        finally:
+            elapsed = Timing(
+                _time.perf_counter() - wall,
+                _time.process_time() - cpu,
+            )
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1].add(elapsed)
+
+            own = Timing(elapsed.wall - nested.wall, elapsed.cpu - nested.cpu)
+            self._stages[stage_].add(own)
+            if self._file is not None:
+                self._file.setdefault(stage_, Timing()).add(own)
+
+    @_contextlib.contextmanager
+    def file(self, file_: _Path | str) -> _t.Iterator[None]:
+        """Count the stages timed to a file.
+
+        :param file_: File being checked.
+        :return: Context in which stages count toward the file.
+        """
+        self._file = self._files.setdefault(str(file_), {})
+        try:
+            yield
+        finally:
+            self._file = None
+
+    def iterate(
+        self,
+        stage_: Stage,
+        iterable: _t.Iterable[_t.Any],
+    ) -> _t.Iterator[_t.Any]:
+        """Time a stage as each item is produced.
+
+        :param stage_: Stage to time.
+        :param iterable: Iterable, e.g. of paths found as they are.
+        :return: Iterator of the same items.
+        """
+        iterator = iter(iterable)
+        while True:
+            with self.stage(stage_):
+                item = next(iterator, StopIteration)
+
+            if item is StopIteration:
+                return
+
+            yield item
+
+    def merge(self, other: Profile) -> None:
+        """Add the time of another profile to this one.
+
+        :param other: Profile, e.g. from a worker process.
+        """
+        for key, timing in other.stages.items():
+            self._stages[key].add(timing)
+
+        for path, stages in other.files.items():
+            into = self._files.setdefault(path, {})
+            for key, timing in stages.items():
+                into.setdefault(key, Timing()).add(timing)
+
+    def _total(self, path: str) -> Timing:
+        total = Timing()
+        for timing in self._files[path].values():
+            total.add(timing)
+
+        return total
+
+    def slowest(self, count: int = SLOWEST) -> list[tuple[str, Timing]]:
+        """Files that took the longest wall time, slowest first.
+
+        :param count: Number of files to list.
+        :return: Files paired with their total time.
+        """
+        totals = [(i, self._total(i)) for i in self._files]
+        totals.sort(key=lambda x: x[1].wall, reverse=True)
+        return totals[:count]
+
+    def to_json(self) -> dict[str, _t.Any]:
+        """Represent the profile as JSON.
+
+        :return: Stages and files, each with their wall and CPU time.
+        """
+        return {
+            "stages": {i.value: _asdict(t) for i, t in self._stages.items()},
+            "files": {
+                f: {i.value: _asdict(t) for i, t in stages.items()}
+                for f, stages in self._files.items()
+            },
+        }
+
+    def print(self, count: int = SLOWEST) -> None:
+        """Print the slowest files and the time of each stage.
+
+        Printed to stderr, so it is kept apart from the report.
+
+        :param count: Number of files to list.
+        """
+        lines = [f"slowest {count} files (wall, cpu):"]
+        for path, timing in self.slowest(count):
+            lines.append(f"  {timing.wall:.4f}s {timing.cpu:.4f}s {path}")
+
+        lines.append("stages (wall, cpu):")
+        for key, timing in self._stages.items():
+            lines.append(
+                f"  {timing.wall:.4f}s {timing.cpu:.4f}s {key.value}",
+            )
+
+        print("\n".join(lines), file=_sys.stderr)
+
+    def dump(self, path: _Path | str) -> None:
+        """Write the profile to a file as JSON.
+
+        :param path: Path to write to.
+        """
+        _Path(path).write_text(
+            _json.dumps(self.to_json(), indent=2),
+            encoding="utf-8",
+        )
+
+
+# profile of the run in progress, if any
+_ACTIVE: Profile | None = None
+
+
+@_contextlib.contextmanager
+def profiling() -> _t.Iterator[Profile]:
+    """Profile the run within this context.
+
+    :return: Context in which the run is profiled.
+    """
+    global _ACTIVE  # pylint: disable=global-statement
+    previous, _ACTIVE = _ACTIVE, Profile()
+    try:
+        yield _ACTIVE
+    finally:
+        _ACTIVE = previous
+
+
+def stage(stage_: Stage) -> _t.ContextManager[None]:
+    """Time a stage, if the run is profiled.
+
+    :param stage_: Stage to time.
+    :return: Context in which the stage is timed.
+    """
+    if _ACTIVE is None:
+        return _contextlib.nullcontext()
+
+    return _ACTIVE.stage(stage_)
+
+
+def file(file_: _Path | str) -> _t.ContextManager[None]:
+    """Count the stages timed to a file, if the run is profiled.
+
+    :param file_: File being checked.
+    :return: Context in which stages count toward the file.
+    """
+    if _ACTIVE is None:
+        return _contextlib.nullcontext()
+
+    return _ACTIVE.file(file_)
+
+
+def iterate(
+    stage_: Stage,
+    iterable: _t.Iterable[_t.Any],
+) -> _t.Iterator[_t.Any]:
+    """Time a stage as each item is produced, if the run is profiled.
+
+    :param stage_: Stage to time.
+    :param iterable: Iterable, e.g. of paths found as they are.
+    :return: Iterator of the same items.
+    """
+    if _ACTIVE is None:
+        return iter(iterable)
+
+    return _ACTIVE.iterate(stage_, iterable)
+
+
+def merged(
+    results: _t.Iterable[tuple[_t.Any, Profile]],
+) -> _t.Iterator[_t.Any]:
+    """Add the profile of each result to the run's, as it is reached.
+
+    :param results: Results paired with the profile of producing them,
+        e.g. by a worker process.
+    :return: Iterator of the results alone.
+    """
+    for result, profile in results:
+        if _ACTIVE is not None:
+            _ACTIVE.merge(profile)
+
+        yield result
@@ -161,6 +161,19 @@ def _to_json(payload: _Report) -> list[dict[str, _t.Any]]:
     ]
 
 
+def to_json(
+    failures: _Failures,
+    file: str | None = None,
+) -> list[dict[str, _t.Any]]:
+    """Return failures in the JSON shape editor plugins consume.
+
+    :param failures: Failures for one module.
+    :param file: Path the failures came from, or None for a string.
+    :return: One object per diagnostic.
+    """
+    return _to_json(_build_report(failures, file))
+
+
 def _to_text(payload: _Report, config: _Config) -> list[str]:
     output: list[str] = []
     for entry in payload:
@@ -5,12 +5,14 @@ docsig._scope
 AST-backed scopes and functions for docstring checking.
 """
 
+import ast as _ast
+import functools as _functools
 import re as _re
 import typing as _t
-from pathlib import Path as _Path
 
-import astroid as _ast
+import astroid as _astroid
 
+from ._backend import Backend as _Backend
 from ._config import Config as _Config
 from ._directives import Comments as _Comments
 from ._directives import Directives as _Directives
@@ -34,14 +36,34 @@ _DEFAULT_NAME = "module"
 #: decorators marking a method as a property or property method
 _PROPERTY_DECORATORS = "property", "cached_property", "setter", "deleter"
 
-#: astroid node enclosing a function, or None outside any frame
-_Frame: _t.TypeAlias = (
-    _ast.nodes.FunctionDef
-    | _ast.nodes.Module
-    | _ast.nodes.ClassDef
-    | _ast.nodes.Lambda
-    | None
-)
+#: AST node of a function
+_FunctionDef: _t.TypeAlias = _ast.FunctionDef | _ast.AsyncFunctionDef
+
+#: AST node enclosing a function, or None outside any frame
+_Frame: _t.TypeAlias = _FunctionDef | _ast.Module | _ast.ClassDef | None
+
+#: directive comments in effect for a node, and the messages they leave
+#: disabled
+_Directive: _t.TypeAlias = tuple[_Comments, _Messages]
+
+
+def _doc_node(node: _FunctionDef | _ast.ClassDef) -> _ast.Constant | None:
+    # a docstring is a string literal as the first statement of a body
+    if node.body and isinstance(node.body[0], _ast.Expr):
+        value = node.body[0].value
+        if isinstance(value, _ast.Constant) and isinstance(value.value, str):
+            return value
+
+    return None
+
+
+def _lineno(node: _ast.stmt) -> int:
+    # a decorated function is reported from its first decorator
+    if isinstance(node, (_ast.FunctionDef, _ast.AsyncFunctionDef)):
+        for decorator in node.decorator_list:
+            return decorator.lineno
+
+    return node.lineno
 
 
 class _Walker:
@@ -51,23 +73,26 @@ class _Walker:
     the overloads they merge into, are collected per scope. The one
     exception is imports, which are shared across the whole tree.
 
+    :param frame: AST node of the scope being walked.
     :param directives: Directives and excluded errors per line.
-    :param file: Path for this scope (or None).
     :param config: Configuration object.
     :param imports: Imports shared across the whole tree.
+    :param backend: Source the scope was parsed from.
     """
 
     def __init__(
         self,
+        frame: _Frame,
         directives: _Directives,
-        file: _Path | None,
         config: _Config,
         imports: _Imports,
+        backend: _Backend,
     ) -> None:
+        self._frame = frame
         self._directives = directives
-        self._file = file
         self._config = config
         self._imports = imports
+        self._backend = backend
         self._children = _Children()
         self._overloads = _Overloads()
 
@@ -76,72 +101,61 @@ class _Walker:
         """Children collected from the walked scope."""
         return self._children
 
-    def walk(self, node: _ast.nodes.NodeNG) -> None:
+    def walk(self, node: _ast.AST, scope: _Directive | None = None) -> None:
         """Collect children from the body of an AST node.
 
         :param node: AST node whose body to walk.
+        :param scope: Comments and disabled messages in effect for the
+            node, which each statement in its body inherits.
         """
         # need to keep track of `comments` as, even though they are
         # resolved in the directive object, they are needed to notify
         # the user in the case that they are invalid
-        scope_comments, scope_disabled = self._directives_at(node.lineno or 0)
+        scope_comments, scope_disabled = scope or (_Comments(), _Messages())
         for subnode in getattr(node, "body", []):
             comments, disabled = self._directives_for(subnode)
-            comments.extend(scope_comments)
-            disabled.extend(scope_disabled)
-            if isinstance(
+            comments = _Comments([*comments, *scope_comments])
+            disabled |= scope_disabled
+            if isinstance(subnode, (_ast.Import, _ast.ImportFrom)):
+                self._collect_imports(subnode)
+            elif isinstance(
                 subnode,
-                (_ast.nodes.Import, _ast.nodes.ImportFrom),
+                (_ast.FunctionDef, _ast.AsyncFunctionDef),
             ):
-                self._collect_imports(subnode)
-            elif isinstance(subnode, _ast.nodes.FunctionDef):
                 self._visit_function(subnode, comments, disabled)
-            elif isinstance(subnode, _ast.nodes.ClassDef):
-                self._children.append(
-                    Scope.from_ast(
-                        subnode,
-                        self._directives,
-                        self._file,
-                        self._config,
-                        self._imports,
-                    ),
-                )
+            elif isinstance(subnode, _ast.ClassDef):
+                self._visit_class(subnode, comments, disabled)
             else:
-                self.walk(subnode)
+                self.walk(subnode, (comments, disabled))
 
-    def _directives_at(self, lineno: int) -> tuple[_Comments, _Messages]:
-        return self._directives.get(lineno, (_Comments(), _Messages()))
+    def _directives_at(self, lineno: int) -> _Directive:
+        return self._directives.get(lineno)
 
-    def _directives_for(
-        self,
-        subnode: _ast.nodes.NodeNG,
-    ) -> tuple[_Comments, _Messages]:
-        comments, disabled = self._directives_at(subnode.lineno or 0)
+    def _directives_for(self, subnode: _ast.stmt) -> _Directive:
+        lineno = _lineno(subnode)
+        comments, disabled = self._directives_at(lineno)
 
-        # astroid sets lineno to the first decorator
-        # inline disable on the def line is at fromlineno
-        fromlineno = getattr(subnode, "fromlineno", 0)
-        if (
-            isinstance(subnode, _ast.nodes.FunctionDef)
-            and fromlineno
-            and fromlineno != (subnode.lineno or 0)
-        ):
-            more_comments, more_disabled = self._directives_at(fromlineno)
-            comments.extend(more_comments)
-            disabled.extend(more_disabled)
+        # a decorated function starts at the first decorator
+        # inline disable on the def line is at the def line
+        if lineno != subnode.lineno:
+            more_comments, more_disabled = self._directives_at(
+                subnode.lineno,
+            )
+            comments = _Comments([*comments, *more_comments])
+            disabled |= more_disabled
 
         return comments, disabled
 
     def _collect_imports(
         self,
-        subnode: _ast.nodes.Import | _ast.nodes.ImportFrom,
+        subnode: _ast.Import | _ast.ImportFrom,
     ) -> None:
-        for original, alias in subnode.names:
-            self._imports[original] = alias or original
+        for alias in subnode.names:
+            self._imports[alias.name] = alias.asname or alias.name
 
     def _visit_function(
         self,
-        subnode: _ast.nodes.FunctionDef,
+        subnode: _FunctionDef,
         comments: _Comments,
         disabled: _Messages,
     ) -> None:
@@ -149,12 +163,13 @@ class _Walker:
         # imports it contains are collected before decorators or the
         # signature are resolved
         body_walker = _Walker(
+            subnode,
             self._directives,
-            self._file,
             self._config,
             self._imports,
+            self._backend,
         )
-        body_walker.walk(subnode)
+        body_walker.walk(subnode, (comments, disabled))
         func = Function(
             subnode,
             comments,
@@ -162,6 +177,8 @@ class _Walker:
             self._config,
             self._imports,
             body_walker.children,
+            self._frame,
+            self._backend,
         )
         if func.isoverloaded:
             self._record_overload(func)
@@ -169,6 +186,24 @@ class _Walker:
             self._merge_overload(func)
             self._children.append(func)
 
+    def _visit_class(
+        self,
+        subnode: _ast.ClassDef,
+        comments: _Comments,
+        disabled: _Messages,
+    ) -> None:
+        walker = _Walker(
+            subnode,
+            self._directives,
+            self._config,
+            self._imports,
+            self._backend,
+        )
+        walker.walk(subnode, (comments, disabled))
+        self._children.append(
+            Scope(subnode.name, walker.children, self._backend),
+        )
+
     def _record_overload(self, func: "Function") -> None:
         # keep one overload variant per name, preferring a variant that
         # declares a return value over one that returns None
@@ -191,37 +226,40 @@ class Scope:
     """Container for functions or methods (module or class).
 
     :param name: Name of this scope.
+    :param children: Functions or classes parsed from the scope body.
+    :param backend: Source the scope was parsed from.
     """
 
-    def __init__(self, name: str = _DEFAULT_NAME) -> None:
+    def __init__(
+        self,
+        name: str = _DEFAULT_NAME,
+        children: _Children | None = None,
+        backend: _Backend | None = None,
+    ) -> None:
         self._name = name
         self._error: type[BaseException] | None = None
-        self._children = _Children()
+        self._children = children or _Children()
+        self._backend = backend or _Backend("")
 
-    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
     @classmethod
     def from_ast(
         cls,
-        node: _ast.nodes.Module | _ast.nodes.ClassDef,
+        node: _ast.Module,
         directives: _Directives,
-        file: _Path | None,
         config: _Config,
-        imports: _Imports | None = None,
+        backend: _Backend,
     ) -> "Scope":
-        """Build a scope from the body of an AST node.
+        """Build a scope from the body of a module.
 
-        :param node: AST node for this scope.
+        :param node: AST node of the module.
         :param directives: Directives and excluded errors per line.
-        :param file: Path for this scope (or None).
         :param config: Configuration object.
-        :param imports: Imports shared across the whole tree.
+        :param backend: Source the node was parsed from.
         :return: A scope with children parsed from the node's body.
         """
-        scope = cls(node.name)
-        walker = _Walker(directives, file, config, imports or _Imports())
+        walker = _Walker(node, directives, config, _Imports(), backend)
         walker.walk(node)
-        scope._children = walker.children
-        return scope
+        return cls(backend.name, walker.children, backend)
 
     @classmethod
     def from_error(cls, error: type[BaseException]) -> "Scope":
@@ -250,8 +288,19 @@ class Scope:
         """Child scopes (functions or nested classes)."""
         return self._children
 
+    @property
+    def dependencies(self) -> set[str]:
+        """Files outside this scope that its results were derived from."""
+        return {i for c in self._children for i in c.dependencies}
+
+    @property
+    def backend(self) -> _Backend:
+        """Source this scope was parsed from."""
+        return self._backend
+
 
-class Function:  # pylint: disable=too-many-instance-attributes
+# pylint: disable-next=too-many-instance-attributes,too-many-public-methods
+class Function:
     """A callable with parsed signature and docstring for checking.
 
     :param node: AST node for the function (or None for error).
@@ -260,17 +309,21 @@ class Function:  # pylint: disable=too-many-instance-attributes
     :param config: Configuration object.
     :param imports: Imports in this scope.
     :param children: Children parsed from the function body.
+    :param frame: AST node enclosing the function.
+    :param backend: Source the function was parsed from.
     """
 
     # pylint: disable-next=too-many-arguments,too-many-positional-arguments
     def __init__(
         self,
-        node: _ast.nodes.FunctionDef | None = None,
+        node: _FunctionDef | None = None,
         comments: _Comments | None = None,
         messages: _Messages | None = None,
         config: _Config | None = None,
         imports: _Imports | None = None,
         children: _Children | None = None,
+        frame: _Frame = None,
+        backend: _Backend | None = None,
     ) -> None:
         self._name = node.name if node is not None else _DEFAULT_NAME
         self._comments = comments or _Comments()
@@ -279,13 +332,15 @@ class Function:  # pylint: disable=too-many-instance-attributes
         self._imports = imports or _Imports()
         self._children = children or _Children()
         self._frame: _Frame = None
-        self._decorators: _ast.nodes.Decorators | None = None
-        self._signature = _Signature()
-        self._docstring = _Docstring()
+        self._backend = backend or _Backend("")
+        self._decorators: list[_ast.expr] = []
+        self._node = node
+        self._doc_node: _ast.Constant | None = None
         self._lineno = 0
         self._error: type[BaseException] | None = None
-        if node is not None and node.parent is not None:
-            self._parse_ast(node, node.parent.frame())
+        self._dependencies: set[str] = set()
+        if node is not None and frame is not None:
+            self._parse_ast(node, frame)
 
     @classmethod
     def from_error(cls, error: type[BaseException]) -> "Function":
@@ -302,34 +357,26 @@ class Function:  # pylint: disable=too-many-instance-attributes
         func._error = error
         return func
 
-    def _parse_ast(self, node: _ast.nodes.FunctionDef, frame: _Frame) -> None:
+    def _parse_ast(self, node: _FunctionDef, frame: _Frame) -> None:
         self._frame = frame
-        self._decorators = node.decorators
-        self._lineno = node.lineno
-        self._signature = _Signature.from_ast(
-            node,
-            self._config.ignore,
-            skip_bound_arg=self.ismethod and not self.isstaticmethod,
-        )
-        doc_node = self._select_doc_node(node)
-        if doc_node is not None:
-            self._docstring = _Docstring.from_ast(doc_node)
+        self._decorators = node.decorator_list
+        self._lineno = _lineno(node)
+        self._doc_node = self._select_doc_node(node)
 
     def _select_doc_node(
         self,
-        node: _ast.nodes.FunctionDef,
-    ) -> _ast.nodes.Const | None:
+        node: _FunctionDef,
+    ) -> _ast.Constant | None:
         # docstring for __init__ is expected on the class docstring,
         # unless the class constructor is documented instead
         if (
             self.isinit
             and not self._config.check.class_constructor
-            and self._frame is not None
-            and not isinstance(self._frame, _ast.nodes.Lambda)
+            and isinstance(self._frame, _ast.ClassDef)
         ):
-            return self._frame.doc_node
+            return _doc_node(self._frame)
 
-        return node.doc_node
+        return _doc_node(node)
 
     def __len__(self) -> int:
         """Length of the longest of signature args or docstring args."""
@@ -337,13 +384,10 @@ class Function:  # pylint: disable=too-many-instance-attributes
 
     def _decorated_with(self, name: str) -> bool:
         name = self._imports.get(name, name)
-        if self._decorators is None:
-            return False
-
         return any(
-            (isinstance(dec, _ast.nodes.Name) and dec.name == name)
-            or (isinstance(dec, _ast.nodes.Attribute) and dec.attrname == name)
-            for dec in self._decorators.nodes
+            (isinstance(dec, _ast.Name) and dec.id == name)
+            or (isinstance(dec, _ast.Attribute) and dec.attr == name)
+            for dec in self._decorators
         )
 
     @property
@@ -358,7 +402,7 @@ class Function:  # pylint: disable=too-many-instance-attributes
 
     @property
     def frame(self) -> _Frame:
-        """Astroid frame node enclosing this function."""
+        """AST node enclosing this function."""
         return self._frame
 
     @property
@@ -372,14 +416,46 @@ class Function:  # pylint: disable=too-many-instance-attributes
         return self._children
 
     @property
+    def dependencies(self) -> set[str]:
+        """Files outside this function that its results were derived from.
+
+        These are the modules holding any base classes consulted to
+        decide whether the function is overridden.
+        """
+        return self._dependencies.union(
+            *(i.dependencies for i in self._children),
+        )
+
+    @_functools.cached_property
     def signature(self) -> _Signature:
-        """The function's signature parameters."""
-        return self._signature
+        """The function's signature parameters.
 
-    @property
+        Built on first access, as the checks to run may not need it.
+        """
+        if self._node is None or self._frame is None:
+            return _Signature()
+
+        return _Signature.from_ast(
+            self._node,
+            self._config.ignore,
+            skip_bound_arg=self.ismethod and not self.isstaticmethod,
+        )
+
+    @_functools.cached_property
     def docstring(self) -> _Docstring:
-        """The function's docstring."""
-        return self._docstring
+        """The function's docstring.
+
+        Built on first access, as the checks to run may not need it.
+        """
+        if self._doc_node is None:
+            return _Docstring()
+
+        return _Docstring.from_ast(self._doc_node)
+
+    @property
+    def isdocumented(self) -> bool:
+        """Whether this function has a docstring, without parsing it."""
+        return self._doc_node is not None
 
     @property
     def messages(self) -> _Messages:
@@ -394,7 +470,7 @@ class Function:  # pylint: disable=too-many-instance-attributes
     @property
     def ismethod(self) -> bool:
         """Whether this function is defined in a class (method)."""
-        return isinstance(self._frame, _ast.nodes.ClassDef)
+        return isinstance(self._frame, _ast.ClassDef)
 
     @property
     def isstaticmethod(self) -> bool:
@@ -429,15 +505,37 @@ class Function:  # pylint: disable=too-many-instance-attributes
 
     @property
     def isoverridden(self) -> bool:
-        """Whether this function overrides a base class method."""
-        if not isinstance(self._frame, _ast.nodes.ClassDef) or self.isinit:
+        """Whether this function overrides a base class method.
+
+        The ancestors of its class may need to be inferred to find out,
+        which costs more than any other property of a function.
+        """
+        if not isinstance(self._frame, _ast.ClassDef) or self.isinit:
             return False
 
-        return any(
-            self.name in ancestor
-            and isinstance(ancestor[self.name], _ast.nodes.FunctionDef)
-            for ancestor in self._frame.ancestors()
-        )
+        try:
+            for ancestor in self._backend.ancestors(self._frame):
+                # a base class from another module makes the result
+                # depend on that module too
+                file = ancestor.root().file
+                if file is not None and not self._backend.defines(ancestor):
+                    self._dependencies.add(file)
+
+                if self.name in ancestor and isinstance(
+                    ancestor[self.name],
+                    _astroid.nodes.FunctionDef,
+                ):
+                    return True
+        except (_astroid.DuplicateBasesError, RecursionError) as err:
+            # reported for the function, as it would be for the module
+            # had it been raised building it
+            self._error = type(err)
+        except _astroid.InferenceError:
+            # as astroid does for a base it cannot infer, the function
+            # is taken not to override anything there
+            pass
+
+        return False
 
     @property
     def isprotected(self) -> bool:
@@ -453,4 +551,4 @@ class Function:  # pylint: disable=too-many-instance-attributes
 
         :param rettype: Return type of the overloaded variant.
         """
-        self._signature.overload(rettype)
+        self.signature.overload(rettype)
@@ -0,0 +1,194 @@
+"""
+docsig._server
+==============
+
+Long-running JSON-RPC server that checks sources sent over stdio.
+
+Each line read is one JSON-RPC 2.0 request, and each response is
+written as one line, so the process, along with everything it has
+imported and compiled, is reused for every check an editor asks for.
+"""
+
+import json as _json
+import os as _os
+import sys as _sys
+import typing as _t
+import warnings as _warnings
+from pathlib import Path as _Path
+
+import astroid as _ast
+
+from ._config import Config as _Config
+from ._parsers import parse_from_source as _parse_from_source
+from ._parsers import parse_from_string as _parse_from_string
+from ._report import to_json as _to_json
+from ._traverse import run_checks as _run_checks
+
+_VERSION = "2.0"
+
+# json-rpc error codes
+_PARSE_ERROR = -32700
+_INVALID_REQUEST = -32600
+_METHOD_NOT_FOUND = -32601
+_INVALID_PARAMS = -32602
+_INTERNAL_ERROR = -32603
+
+_Response = dict[str, _t.Any]
+
+
+class _RequestError(Exception):
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+def _error(request_id: _t.Any, code: int, message: str) -> _Response:
+    return {
+        "jsonrpc": _VERSION,
+        "id": request_id,
+        "error": {"code": code, "message": message},
+    }
+
+
+class Server:  # pylint: disable=too-few-public-methods
+    """Check sources sent as JSON-RPC requests over a stream.
+
+    Methods:
+
+    * check - params ``source``, the code to check, and optionally
+        ``path``, the file the code belongs to; the result is the same
+        list of diagnostics a run with _DOCSIG_FORMAT_JSON prints
+    * shutdown - respond and stop serving
+
+    :param config: Configuration object.
+    """
+
+    def __init__(self, config: _Config) -> None:
+        self._config = config
+        self._running = False
+        # modules astroid has built for base classes, with the time the
+        # file they were built from was last modified
+        self._mtimes: dict[str, int] = {}
+
+    def serve(
+        self,
+        stdin: _t.TextIO | None = None,
+        stdout: _t.TextIO | None = None,
+    ) -> int:
+        """Respond to requests until shutdown or the end of the input.
+
+        :param stdin: Stream to read requests from, stdin by default.
+        :param stdout: Stream to write responses to, stdout by default.
+        :return: Exit code.
+        """
+        stdin = stdin or _sys.stdin
+        stdout = stdout or _sys.stdout
+        self._running = True
+        with _warnings.catch_warnings():
+            # new violations are already marked in the payload
+            _warnings.simplefilter("ignore", FutureWarning)
+            for line in stdin:
+                if not line.strip():
+                    continue
+
+                response = self._handle(line)
+                if response is not None:
+                    stdout.write(f"{_json.dumps(response)}\n")
+                    stdout.flush()
+
+                if not self._running:
+                    break
+
+        return 0
+
+    def _handle(self, line: str) -> _Response | None:
+        try:
+            request = _json.loads(line)
+        except ValueError as err:
+            return _error(None, _PARSE_ERROR, str(err))
+
+        if not isinstance(request, dict):
+            return _error(None, _INVALID_REQUEST, "request is not an object")
+
+        request_id = request.get("id")
+        try:
+            response = {
+                "jsonrpc": _VERSION,
+                "id": request_id,
+                "result": self._dispatch(
+                    request.get("method"),
+                    request.get("params", {}),
+                ),
+            }
+        except _RequestError as err:
+            response = _error(request_id, err.code, str(err))
+        # a source that fails to check must not stop the server from
+        # responding to the requests that follow
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            response = _error(request_id, _INTERNAL_ERROR, repr(err))
+
+        # a request without an id is a notification, which is not
+        # responded to, not even with an error
+        if "id" not in request:
+            return None
+
+        return response
+
+    def _dispatch(self, method: _t.Any, params: _t.Any) -> _t.Any:
+        if method == "shutdown":
+            self._running = False
+            return None
+
+        if method != "check":
+            raise _RequestError(_METHOD_NOT_FOUND, f"unknown method {method}")
+
+        if not isinstance(params, dict):
+            params = {}
+
+        source = params.get("source")
+        path = params.get("path")
+        if not isinstance(source, str) or not (
+            path is None or isinstance(path, str)
+        ):
+            raise _RequestError(
+                _INVALID_PARAMS,
+                "check expects a source string and an optional path",
+            )
+
+        return self._check(source, path)
+
+    def _check(self, source: str, path: str | None) -> list[_Response]:
+        self._evict_changed_modules()
+        try:
+            if path is None:
+                module = _parse_from_string(source, self._config)
+            else:
+                module = _parse_from_source(
+                    source,
+                    self._config,
+                    _Path(path),
+                )
+
+            return _to_json(_run_checks(module, self._config), path)
+        finally:
+            # record the modules built for this check as they are now
+            self._evict_changed_modules()
+
+    def _evict_changed_modules(self) -> None:
+        # astroid keeps every module it builds, such as those holding
+        # base classes, for the life of the process, which would leave
+        # a server reporting against files as they were when first read
+        cache = _ast.MANAGER.astroid_cache
+        for name, module in list(cache.items()):
+            file = module.file
+            if file is None:
+                continue
+
+            try:
+                mtime = _os.stat(file).st_mtime_ns
+            except OSError:
+                mtime = -1
+
+            if self._mtimes.setdefault(name, mtime) != mtime:
+                del cache[name]
+                del self._mtimes[name]
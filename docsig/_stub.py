@@ -11,6 +11,8 @@ function's AST with ``from_ast``.
 
 from __future__ import annotations as _
 
+import ast as _ast
+import functools as _functools
 import inspect as _inspect
 import re as _re
 import typing as _t
@@ -18,8 +20,6 @@ from collections import Counter as _Counter
 from dataclasses import dataclass as _dataclass
 from enum import Enum as _Enum
 
-import astroid as _ast
-
 from ._config import Ignore as _Ignore
 from ._vendor.sphinx.ext import napoleon as _s
 
@@ -29,6 +29,10 @@ UNNAMED = "-1000"
 # an example of valid parameter description
 VALID_DESCRIPTION = " A valid description."
 
+# docstrings parsed, by their raw text, as large code bases repeat
+# docstrings, such as those of overloads or implementations of a protocol
+_CACHE_SIZE = 1024
+
 # annotations meaning the function never returns a value, treated the
 # same as ``-> None`` for documentation purposes
 _NO_RETURN = ("NoReturn", "Never")
@@ -55,34 +59,18 @@ _DIRECTIVE = _re.compile(r"^[ \t]*\.\..*\n(?:[ \t]+.*\n)*", _re.MULTILINE)
 #: cross-reference at column 0 does not pass for a field
 _RST_FIELD = _re.compile(r"^:\w+[^:\n]*:(?=\s|$)", _re.MULTILINE)
 
-#: every section name napoleon knows, longest first so multi-word names
-#: are preferred; derived from napoleon itself rather than hand-listed,
-#: because a hand-listed subset silently stops docstrings it does not
-#: recognize from ever reaching napoleon, hiding their params
+#: every section name napoleon knows, lowercased as napoleon matches
+#: them regardless of case; derived from napoleon itself rather than
+#: hand-listed, because a hand-listed subset silently stops docstrings
+#: it does not recognize from ever reaching napoleon, hiding their params
 # noinspection PyProtectedMember
-_SECTION_NAMES = "|".join(
-    _re.escape(name)
-    for name in sorted(
-        # pylint: disable-next=protected-access
-        _s.GoogleDocstring("")._sections,  # type: ignore
-        key=len,
-        reverse=True,
-    )
+_SECTION_NAMES = frozenset(
+    # pylint: disable-next=protected-access
+    _s.GoogleDocstring("")._sections,  # type: ignore
 )
 
-#: a numpy section header such as ``Returns`` underlined with dashes;
-#: trailing whitespace after the name is tolerated, as napoleon strips
-#: it and the underline below already allows it
-_NUMPY_SECTION = _re.compile(
-    rf"^({_SECTION_NAMES})[ \t]*\n\s*-{{3,}}\s*$",
-    _re.MULTILINE | _re.IGNORECASE,
-)
-
-#: a Google section header such as ``Args:``
-_GOOGLE_SECTION = _re.compile(
-    rf"^({_SECTION_NAMES}):\s*$",
-    _re.MULTILINE | _re.IGNORECASE,
-)
+#: the dashes underlining a numpy section header such as ``Returns``
+_UNDERLINE = _re.compile(r"\s*-{3,}\s*")
 
 #: a return field such as ``:return:``, capturing its description
 _RETURN_FIELD = _re.compile(
@@ -114,8 +102,8 @@ class RetType(_Enum):
     UNTYPED = 3
 
     @staticmethod
-    def _annotates_none(returns: _ast.nodes.NodeNG | None) -> bool:
-        if isinstance(returns, _ast.nodes.Const):
+    def _annotates_none(returns: _ast.expr | None) -> bool:
+        if isinstance(returns, _ast.Constant):
             if isinstance(returns.value, str):
                 # a quoted annotation, e.g. -> "None", is legal
                 # forward-reference style and annotates whatever the
@@ -127,16 +115,16 @@ class RetType(_Enum):
 
             return returns.value is None
 
-        if isinstance(returns, _ast.nodes.Name):
-            return returns.name in _NO_RETURN
+        if isinstance(returns, _ast.Name):
+            return returns.id in _NO_RETURN
 
-        if isinstance(returns, _ast.nodes.Attribute):
-            return returns.attrname in _NO_RETURN
+        if isinstance(returns, _ast.Attribute):
+            return returns.attr in _NO_RETURN
 
         return False
 
     @classmethod
-    def from_ast(cls, returns: _ast.nodes.NodeNG | None) -> RetType:
+    def from_ast(cls, returns: _ast.expr | None) -> RetType:
         """Build return type from the function's return AST node.
 
         :param returns: Return annotation AST node or None.
@@ -146,11 +134,11 @@ class RetType(_Enum):
             return cls.NONE
 
         annotation_nodes = (
-            _ast.nodes.Const,
-            _ast.nodes.Name,
-            _ast.nodes.Attribute,
-            _ast.nodes.Subscript,
-            _ast.nodes.BinOp,
+            _ast.Constant,
+            _ast.Name,
+            _ast.Attribute,
+            _ast.Subscript,
+            _ast.BinOp,
         )
         if isinstance(returns, annotation_nodes):
             return cls.SOME
@@ -182,6 +170,54 @@ class DocType(_Enum):
         return cls.UNKNOWN
 
 
+class Style(_Enum):
+    """Style a docstring is written in."""
+
+    RST = 1
+    GOOGLE = 2
+    NUMPY = 3
+    PLAIN = 4
+
+    @classmethod
+    def from_str(cls, string: str) -> Style:
+        """Classify a docstring in a single pass over its lines.
+
+        Existing rst fields are preferred over napoleon section headers,
+        and numpy headers over Google ones. A docstring without any
+        field or section is plain, and has nothing to parse.
+
+        :param string: Docstring with its indent cleaned.
+        :return: Style the docstring is written in.
+        """
+        numpy = google = fields = header = False
+        for line in string.split("\n"):
+            if line.startswith(":") and _RST_FIELD.match(line):
+                return cls.RST
+
+            stripped = line.rstrip()
+            # blank lines may come between a numpy header and its
+            # underline
+            if not stripped:
+                continue
+
+            numpy = numpy or (header and bool(_UNDERLINE.fullmatch(line)))
+            header = line.rstrip(" \t").casefold() in _SECTION_NAMES
+            google = google or (
+                stripped.endswith(":")
+                and stripped[:-1].casefold() in _SECTION_NAMES
+            )
+            fields = fields or line.lstrip(" \t").startswith(":")
+
+        if numpy:
+            return cls.NUMPY
+
+        if google:
+            return cls.GOOGLE
+
+        # fields indented below the margin are still read as they are
+        return cls.RST if fields else cls.PLAIN
+
+
 @_dataclass(frozen=True, eq=False)
 class Param:
     """Single parameter from a docstring or function signature.
@@ -311,13 +347,13 @@ class Signature(_Stub):
 
     @staticmethod
     def _params_from_args(
-        args: _ast.nodes.Arguments,
+        args: _ast.arguments,
         skip_bound_arg: bool,
     ) -> _t.Iterator[Param]:
         # yield params in the order they are documented: positional,
         # *args, keyword-only, then **kwargs
         posonlyargs = list(args.posonlyargs)
-        positional = list(args.args)  # type: ignore
+        positional = list(args.args)
         if skip_bound_arg:
             # drop self or cls without mutating the AST node
             if posonlyargs:
@@ -326,21 +362,21 @@ class Signature(_Stub):
                 positional = positional[1:]
 
         for arg in (*posonlyargs, *positional):
-            yield Param(name=arg.name)
+            yield Param(name=arg.arg)
 
         if args.vararg:
-            yield Param(DocType.ARG, name=args.vararg)
+            yield Param(DocType.ARG, name=args.vararg.arg)
 
         for arg in args.kwonlyargs:
-            yield Param(name=arg.name)
+            yield Param(name=arg.arg)
 
         if args.kwarg:
-            yield Param(DocType.KWARG, name=args.kwarg)
+            yield Param(DocType.KWARG, name=args.kwarg.arg)
 
     @classmethod
     def from_ast(
         cls,
-        node: _ast.nodes.FunctionDef,
+        node: _ast.FunctionDef | _ast.AsyncFunctionDef,
         ignore: _Ignore,
         skip_bound_arg: bool = False,
     ) -> Signature:
@@ -354,9 +390,8 @@ class Signature(_Stub):
         """
         rettype = RetType.from_ast(node.returns)
         signature = cls(_Return(rettype == RetType.SOME, rettype), ignore)
-        if node.args.args is not None:
-            for param in cls._params_from_args(node.args, skip_bound_arg):
-                signature.args.append(param)
+        for param in cls._params_from_args(node.args, skip_bound_arg):
+            signature.args.append(param)
 
         return signature
 
@@ -373,15 +408,18 @@ class Docstring(_Stub):
 
     :param string: Raw docstring text after normalization.
     :param returns: True if a return or yield section is present.
+    :param style: Style the docstring was written in.
     """
 
     def __init__(
         self,
         string: str | None = None,
         returns: _Return | None = None,
+        style: Style | None = None,
     ) -> None:
         super().__init__(returns)
         self._string = string
+        self._style = style
 
     @staticmethod
     def _indent_anomaly(string: str) -> bool:
@@ -411,17 +449,12 @@ class Docstring(_Stub):
         return False
 
     @staticmethod
-    def _normalize_docstring(string: str) -> str:
-        # convert Google or numpy style to rst when detected, preferring
-        # existing rst fields over napoleon section headers
-        string = _inspect.cleandoc(string)
-        if _RST_FIELD.search(string):
-            return string
-
-        if _NUMPY_SECTION.search(string):
+    def _normalize_docstring(string: str, style: Style) -> str:
+        # convert Google or numpy style to rst
+        if style == Style.NUMPY:
             return str(_s.NumpyDocstring(string))  # type: ignore
 
-        if _GOOGLE_SECTION.search(string):
+        if style == Style.GOOGLE:
             return str(_s.GoogleDocstring(string))  # type: ignore
 
         return string
@@ -457,22 +490,49 @@ class Docstring(_Stub):
             closing_token,
         )
 
+    @staticmethod
+    @_functools.lru_cache(maxsize=_CACHE_SIZE)
+    def _parse(
+        raw: str,
+    ) -> tuple[str, Style, _Return, tuple[Param, ...]]:
+        # the params are returned as a tuple rather than the docstring
+        # itself, as checking a docstring's args can change them
+        string = _inspect.cleandoc(raw)
+        style = Style.from_str(string)
+        if style == Style.PLAIN:
+            # no field for a param or a return to be parsed from
+            return string, style, _Return(description_missing=True), ()
+
+        indent = int(Docstring._indent_anomaly(raw))
+        string = Docstring._normalize_docstring(string, style)
+        params = tuple(
+            Docstring._parse_param(field, closing_token, description, indent)
+            for field, closing_token, description in _PARAM_FIELD.findall(
+                string,
+            )
+        )
+        return string, style, Docstring._parse_returns(string), params
+
     @classmethod
-    def from_ast(cls, node: _ast.Const) -> Docstring:
+    def cache_info(cls) -> tuple[int, int]:
+        """Hits and misses of docstrings parsed by their raw text.
+
+        :return: Number of hits and misses so far.
+        """
+        info = cls._parse.cache_info()
+        return info.hits, info.misses
+
+    @classmethod
+    def from_ast(cls, node: _ast.Constant) -> Docstring:
         """Build Docstring from the function's docstring AST node.
 
         :param node: Const node holding the docstring string.
         :return: Docstring with args and return flag.
         """
-        indent = int(cls._indent_anomaly(node.value))
-        string = cls._normalize_docstring(node.value)
-        docstring = cls(string, cls._parse_returns(string))
-        for field, closing_token, description in _PARAM_FIELD.findall(
-            string,
-        ):
-            docstring.args.append(
-                cls._parse_param(field, closing_token, description, indent),
-            )
+        string, style, returns, params = cls._parse(node.value)
+        docstring = cls(string, returns, style)
+        for param in params:
+            docstring.args.append(param)
 
         return docstring
 
@@ -481,6 +541,11 @@ class Docstring(_Stub):
         """Raw docstring text after normalization, or None."""
         return self._string
 
+    @property
+    def style(self) -> Style | None:
+        """Style the docstring was written in, or None."""
+        return self._style
+
     @property
     def bare(self) -> bool:
         """True if docstring exists but has no params and no return.
@@ -5,11 +5,19 @@ docsig._traverse
 Traverse modules and run docstring/signature checks per function.
 """
 
+import ast as _ast
+import logging as _logging
+from pathlib import Path as _Path
+
+from . import _profile
 from ._checker import check_function as _check_function
 from ._config import Config as _Config
 from ._diagnostic import Failures as _Failures
+from ._diagnostic import FunctionResult as _FunctionResult
+from ._files import FILE_INFO as _FILE_INFO
 from ._scope import Function as _Function
 from ._scope import Scope as _Scope
+from ._stub import Docstring as _Docstring
 
 
 def _should_check_function(
@@ -17,25 +25,42 @@ def _should_check_function(
     parent: _Scope | _Function,
     config: _Config,
 ) -> bool:
-    if function.isoverridden and not config.check.overridden:
-        return False
+    return not any(skip(function, parent) for skip in config.plan.skips)
+
+
+def _check(function: _Function, config: _Config) -> _FunctionResult | None:
+    result = _check_function(function, config)
+    if not result or not config.plan.skip_overridden:
+        return result
 
-    if function.isprotected and not config.check.protected:
-        return False
+    # whether a method overrides another makes no difference to one that
+    # passes, so the ancestors of its class are only inferred for one
+    # that fails
+    if function.isoverridden:
+        return None
 
-    if function.isdunder and not config.check.dunders:
-        return False
+    # an error inferring them is reported in place of the failures
+    if function.error is not None:
+        return _check_function(function, config)
 
-    if function.docstring.bare and config.ignore.no_params:
-        return False
+    return result
 
-    if function.isinit and (
-        not (config.check.class_ or config.check.class_constructor)
-        or (parent.isprotected and not config.check.protected)
-    ):
-        return False
 
-    return True
+def _log_docstring_cache(
+    source_name: _Path | str,
+    cached: tuple[int, int],
+) -> None:
+    # hits and misses for this source alone, rather than the run so far
+    hits, misses = _Docstring.cache_info()
+    hits -= cached[0]
+    misses -= cached[1]
+    if hits or misses:
+        logger = _logging.getLogger(__package__)
+        logger.debug(
+            _FILE_INFO,
+            source_name,
+            f"{hits} docstring cache hits, {misses} misses",
+        )
 
 
 def _run_check(
@@ -43,20 +68,31 @@ def _run_check(
     parent: _Scope | _Function,
     config: _Config,
     failures: _Failures,
-) -> None:
-    if isinstance(child, _Function) and _should_check_function(
-        child,
-        parent,
-        config,
-    ):
-        result = _check_function(child, config)
-        if result:
-            failures.append(result)
+) -> int:
+    # return the number of methods reached in a class with bases, each
+    # of which would infer the ancestors of its class itself if checked
+    # for being overridden first
+    inferable = 0
+    if isinstance(child, _Function):
+        frame = child.frame
+        if (
+            isinstance(frame, _ast.ClassDef)
+            and frame.bases
+            and not child.isinit
+        ):
+            inferable += 1
+
+        if _should_check_function(child, parent, config):
+            result = _check(child, config)
+            if result:
+                failures.append(result)
 
     # recurse for either class methods or, if enabled, nested functions
     if not isinstance(child, _Function) or config.check.nested:
         for child_of_child in child.children:
-            _run_check(child_of_child, child, config, failures)
+            inferable += _run_check(child_of_child, child, config, failures)
+
+    return inferable
 
 
 def run_checks(module: _Scope, config: _Config) -> _Failures:
@@ -71,12 +107,28 @@ def run_checks(module: _Scope, config: _Config) -> _Failures:
     :return: A list of function and class failures.
     """
     failures = _Failures()
-    for child in module.children:
-        if (
-            not child.isprotected
-            or config.check.protected
-            or config.check.protected_class_methods
-        ):
-            _run_check(child, module, config, failures)
+    inferable = 0
+    # docstrings are parsed as they are checked
+    cached = _Docstring.cache_info()
+    with _profile.stage(_profile.Stage.CHECK):
+        for child in module.children:
+            if (
+                not child.isprotected
+                or config.check.protected
+                or config.check.protected_class_methods
+            ):
+                inferable += _run_check(child, module, config, failures)
+
+    source_name = module.backend.file or "stdin"
+    _log_docstring_cache(source_name, cached)
+    # the ancestors of a class are inferred at most once, and only for
+    # a method not skipped for another reason first
+    avoided = inferable - module.backend.inferences
+    if avoided:
+        _logging.getLogger(__package__).debug(
+            _FILE_INFO,
+            source_name,
+            f"{avoided} of {inferable} inferences of base classes avoided",
+        )
 
     return failures
@@ -6,6 +6,9 @@ Error message definitions (Message, MessageMap, E) and format templates
 for docstring-check output.
 """
 
+from __future__ import annotations as _
+
+import functools as _functools
 import typing as _t
 
 #: Error code for unknown errors.
@@ -21,8 +24,118 @@ FLAKE8 = "{ref} {description} ({symbolic})"
 NEW = "{ref} is a new violation and will error in a future version"
 
 
-class Messages(list["Message"]):
-    """Sequence of Message instances, typically for one failure."""
+class Messages:
+    """Set of Message instances, typically for one failure.
+
+    Held as a mask with a bit for each message code, so membership and
+    set operations take constant time. Messages iterate in order of
+    their code, followed by any unknown messages in the order given, as
+    often as given, so each is reported. They can be indexed, and are
+    equal to a list of the messages they iterate, as the list they were
+    once held in was. Once made, a set of messages does not change, so
+    there is no ``append`` or ``extend``; sets are joined with ``|``.
+
+    :param messages: Messages to hold.
+    """
+
+    __slots__ = "_mask", "_unknown"
+
+    def __init__(self, messages: _t.Iterable[Message] = ()) -> None:
+        mask = 0
+        unknown: list[Message] = []
+        for message in messages:
+            code = _CODES.get(message)
+            if code is not None:
+                mask |= 1 << code
+            else:
+                unknown.append(message)
+
+        self._mask = mask
+        self._unknown = tuple(unknown)
+
+    @classmethod
+    def _from_mask(
+        cls,
+        mask: int,
+        unknown: tuple[Message, ...] = (),
+    ) -> Messages:
+        messages = cls()
+        messages._mask = mask
+        messages._unknown = unknown
+        return messages
+
+    def __iter__(self) -> _t.Iterator[Message]:
+        mask = self._mask
+        while mask:
+            bit = mask & -mask
+            yield E[bit.bit_length() - 1]
+            mask ^= bit
+
+        yield from self._unknown
+
+    def __len__(self) -> int:
+        return self._mask.bit_count() + len(self._unknown)
+
+    def __contains__(self, message: object) -> bool:
+        code = _CODES.get(message)  # type: ignore
+        if code is not None:
+            return bool(self._mask >> code & 1)
+
+        return message in self._unknown
+
+    def __getitem__(self, index: int) -> Message:
+        return list(self)[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, list):
+            return list(self) == other
+
+        return (
+            isinstance(other, Messages)
+            and self._mask == other._mask
+            and sorted(self._unknown) == sorted(other._unknown)
+        )
+
+    def __hash__(self) -> int:
+        return hash((self._mask, frozenset(self._unknown)))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def index(self, message: Message) -> int:
+        """Return the position of a message as the set iterates.
+
+        :param message: Message to find.
+        :return: Index of the message.
+        :raises ValueError: If the message is not in the set.
+        """
+        return list(self).index(message)
+
+    def count(self, message: Message) -> int:
+        """Return the number of times a message is in the set.
+
+        :param message: Message to count.
+        :return: Number of times the message is iterated.
+        """
+        return list(self).count(message)
+
+    def __or__(self, other: Messages) -> Messages:
+        return Messages._from_mask(
+            self._mask | other._mask,
+            (*self._unknown, *(i for i in other._unknown if i not in self)),
+        )
+
+    def __and__(self, other: Messages) -> Messages:
+        return Messages._from_mask(
+            self._mask & other._mask,
+            tuple(i for i in self._unknown if i in other),
+        )
+
+    def __sub__(self, other: Messages) -> Messages:
+        return Messages._from_mask(
+            self._mask & ~other._mask,
+            tuple(i for i in self._unknown if i not in other),
+        )
 
 
 class Message(_t.NamedTuple):
@@ -73,11 +186,7 @@ class MessageMap(dict[int, Message]):
         :param ref: Code (e.g. SIG101) or symbolic name.
         :return: Matching Message, or unknown if not found.
         """
-        for value in self.values():
-            if ref in (value.ref, value.symbolic):
-                return value
-
-        return Message(UNKNOWN, ref)
+        return self._refs.get(ref) or Message(UNKNOWN, ref)
 
     def from_codes(self, refs: list[str]) -> Messages:
         """Return Messages for the given codes or symbolic refs.
@@ -92,6 +201,16 @@ class MessageMap(dict[int, Message]):
         """All Messages except single-digit config errors (SIG0xx)."""
         return Messages(v for k, v in self.items() if len(str(k)) > 1)
 
+    @_functools.cached_property
+    def _refs(self) -> dict[str, Message]:
+        # codes and symbolic names, so a ref is found without a search
+        refs: dict[str, Message] = {}
+        for value in self.values():
+            refs.setdefault(value.ref, value)
+            refs.setdefault(value.symbolic, value)
+
+        return refs
+
 
 # SIGxxx: Error
 E = MessageMap(
@@ -270,3 +389,6 @@ E = MessageMap(
         ),
     },
 )
+
+# the code of each message, which is the bit it is held at in Messages
+_CODES = {v: k for k, v in E.items()}
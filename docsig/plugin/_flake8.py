@@ -7,9 +7,6 @@ errors.
 """
 
 import ast as _ast
-import contextlib as _contextlib
-import os as _os
-import sys as _sys
 import typing as _t
 from argparse import Namespace as _Namespace
 from pathlib import Path as _Path
@@ -17,9 +14,10 @@ from pathlib import Path as _Path
 from .._config import Check as _Check
 from .._config import Config as _Config
 from .._config import Ignore as _Ignore
-from .._core import runner as _runner
 from .._core import setup_logger as _setup_logger
 from .._diagnostic import Diagnostic as _Diagnostic
+from .._parsers import parse_from_source as _parse_from_source
+from .._traverse import run_checks as _run_checks
 from .._version import __version__
 from ..messages import FLAKE8 as _FLAKE8
 from ..messages import E as _E
@@ -27,28 +25,12 @@ from ..messages import E as _E
 _Flake8Error = tuple[int, int, str, type[_t.Any]]
 
 
-@_contextlib.contextmanager
-def _cwd_on_sys_path() -> _t.Iterator[None]:
-    # so astroid can resolve project packages for overridden checks
-    # (#522) without mutating sys.path at import time
-    cwd = _os.path.abspath(_os.getcwd())
-    added = cwd not in _sys.path
-    if added:
-        _sys.path.append(cwd)
-    try:
-        yield
-    finally:
-        if added:
-            with _contextlib.suppress(ValueError):
-                _sys.path.remove(cwd)
-
-
 class Flake8:
     """Plugin that runs docsig on a file and yields flake8 errors.
 
-    :param tree: Parsed AST module (unused; flake8 requires it for the
-        API).
+    :param tree: AST module flake8 parsed from the file.
     :param filename: Path to the file to check.
+    :param lines: Lines of the file flake8 read.
     """
 
     off_by_default = False
@@ -56,9 +38,15 @@ class Flake8:
     version = __version__
     a = _Namespace()
 
-    def __init__(self, tree: _ast.Module, filename: str) -> None:
-        _tree = tree  # noqa
+    def __init__(
+        self,
+        tree: _ast.Module,
+        filename: str,
+        lines: list[str],
+    ) -> None:
+        self.tree = tree
         self.filename = filename
+        self.lines = lines
 
     # won't import flake8 type
     # conflicts with this module name
@@ -206,8 +194,16 @@ class Flake8:
             return
 
         _setup_logger(self.a.verbose)
-        with _cwd_on_sys_path():
-            results = _runner(_Path(self.filename), self._build_config())
+        config = self._build_config()
+        # flake8 has already read and parsed the file, so it is checked
+        # as it was read rather than read again
+        module = _parse_from_source(
+            "".join(self.lines),
+            config,
+            _Path(self.filename),
+            self.tree,
+        )
+        results = _run_checks(module, config)
 
         for result in results:
             if not result.retcode:
@@ -19,7 +19,16 @@ _ID = "https://docsig.io/en/latest/usage/configuration/schema.json"
 _SCHEMA = "http://json-schema.org/draft-07/schema#"
 _DESCRIPTION_EXCLUDE = ("comma separated ",)
 _NARGS = ("+", "*")
-_EXCLUDED_OPTIONS = ("help", "list-checks", "string", "version")
+_EXCLUDED_OPTIONS = (
+    "changed-since",
+    "files-from",
+    "help",
+    "list-checks",
+    "serve",
+    "stdin-filename",
+    "string",
+    "version",
+)
 
 
 class ValidatePyproject(dict[str, _t.Any]):
@@ -66,6 +75,8 @@ class ValidatePyproject(dict[str, _t.Any]):
             self["properties"][name] = {"default": action.default}
             if isinstance(action.default, bool):
                 self["properties"][name]["type"] = "boolean"
+            elif isinstance(action.default, int):
+                self["properties"][name]["type"] = "integer"
             elif type(action).__name__ == "_AppendAction":
                 # append options take a single value or a list
                 self["properties"][name]["type"] = ["string", "array"]
@@ -15,6 +15,8 @@ FixtureInitPyprojectTomlFile = t.Callable[[dict[str, t.Any]], Path]
 
 PATH = Path("module") / "file.py"
 
+_T = t.TypeVar("_T")
+
 
 class FixtureInitFile(
     t.Protocol,
@@ -32,6 +34,19 @@ class FixtureMakeTree(t.Protocol):  # pylint: disable=too-few-public-methods
         """Type for ``fixture_make_tree``."""
 
 
+class FixtureBench(t.Protocol):  # pylint: disable=too-few-public-methods
+    """Type for ``fixture_bench``."""
+
+    def __call__(
+        self,
+        func: t.Callable[..., _T],
+        /,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> _T:
+        """Type for ``fixture_bench``."""
+
+
 CHECK_ARGS = (
     "--check-class",
     "--check-protected",
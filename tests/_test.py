@@ -7,23 +7,45 @@ tests._test
 from __future__ import annotations
 
 import argparse
+import ast
 import io
 import json
 import os
 import pickle
+import typing as t
 from argparse import Namespace
 from pathlib import Path
+from unittest.mock import Mock
 
+import astroid
 import pytest
 
 import docsig
 from docsig import docsig as _docsig
 
+# noinspection PyProtectedMember
+from docsig._config import Filters
+
+# noinspection PyProtectedMember
+from docsig._directives import Directives
+
+# noinspection PyProtectedMember
+from docsig._files import Files, iter_files
+
+# noinspection PyProtectedMember
+from docsig._parsers import MMAP_SIZE, _decode, read_source
+
 # noinspection PyProtectedMember
 from docsig._report import pretty_print_error
+
+# noinspection PyProtectedMember
+from docsig._scope import Function
+
+# noinspection PyProtectedMember
+from docsig._stub import Docstring, Style
 from docsig.messages import FLAKE8 as F
 from docsig.messages import TEMPLATE as T
-from docsig.messages import E, Message
+from docsig.messages import E, Message, Messages
 from docsig.plugin import ValidatePyproject
 
 # noinspection PyProtectedMember
@@ -33,6 +55,7 @@ from . import (
     CHECK_ARGS,
     PATH,
     WILL_ERROR,
+    FixtureFlake8,
     FixtureInitFile,
     FixtureInitPyprojectTomlFile,
     FixtureMain,
@@ -244,6 +267,87 @@ def test_file_not_found_error(main: FixtureMain) -> None:
     assert str(err.value) == "does-not-exist"
 
 
+def test_iter_files_is_lazy_and_sorted(make_tree: FixtureMakeTree) -> None:
+    """Test files are found as the walk reaches them, in sorted order.
+
+    :param make_tree: Create directory tree from dict mapping.
+    """
+    make_tree(
+        {
+            "b": {"file.py": [], "a.py": []},
+            "a": {"file.py": []},
+            "z.py": [],
+        },
+    )
+    files = iter_files((".", "b"), Filters())
+    assert next(files) == Path("a") / "file.py"
+    # directories not yet reached are only scanned once they are
+    make_tree({"b": {"new.py": []}})
+    assert list(files) == [
+        Path("b") / "a.py",
+        Path("b") / "file.py",
+        Path("b") / "new.py",
+        Path("pyproject.toml"),
+        Path("z.py"),
+    ]
+    assert Files((".",), Filters()) == sorted(Files((".",), Filters()))
+
+
+def test_overlapping_paths_checked_once(
+    capsys: pytest.CaptureFixture,
+    make_tree: FixtureMakeTree,
+    main: FixtureMain,
+) -> None:
+    """Test a file reached through more than one path is checked once.
+
+    :param capsys: Capture sys out.
+    :param make_tree: Create directory tree from dict mapping.
+    :param main: Mock ``main`` function.
+    """
+    make_tree({"src": {"pkg": {"module.py": ["def function(param): ..."]}}})
+    args = "src", str(Path("src") / "pkg"), "src", "--no-cache"
+    assert main(*args, "--target", E[101].ref, test_flake8=False) == 1
+    assert capsys.readouterr().out.count("module.py") == 1
+
+
+def test_linked_file_checked_once(
+    capsys: pytest.CaptureFixture,
+    make_tree: FixtureMakeTree,
+    main: FixtureMain,
+) -> None:
+    """Test a file and a link to it are checked once.
+
+    :param capsys: Capture sys out.
+    :param make_tree: Create directory tree from dict mapping.
+    :param main: Mock ``main`` function.
+    """
+    make_tree({"src": {"module.py": ["def function(param): ..."]}})
+    (Path("src") / "link.py").symlink_to("module.py")
+    args = "src", "--no-cache", "--target", E[101].ref
+    assert main(*args, test_flake8=False) == 1
+    out = capsys.readouterr().out
+    assert out.count("in function") == 1
+    assert "link.py" in out
+
+
+def test_broken_link_given_skipped(
+    make_tree: FixtureMakeTree,
+    patch_logger: io.StringIO,
+    main: FixtureMain,
+) -> None:
+    """Test a broken link given to check is skipped.
+
+    :param make_tree: Create directory tree from dict mapping.
+    :param patch_logger: Logs as an io instance.
+    :param main: Mock ``main`` function.
+    """
+    make_tree({"src": {}})
+    link = Path("src") / "link.py"
+    link.symlink_to("does-not-exist.py")
+    assert main(str(link), "--verbose", test_flake8=False) == 0
+    assert f"{link}: broken link, skipping" in patch_logger.getvalue()
+
+
 @pytest.mark.parametrize(
     "args,expected",
     [
@@ -1267,6 +1371,14 @@ def test_validate_pyproject(monkeypatch: pytest.MonkeyPatch) -> None:
                 ),
                 "default": False,
             },
+            "jobs": {
+                "type": "integer",
+                "description": (
+                    "number of processes to check files with (0 for one per"
+                    " cpu)"
+                ),
+                "default": 1,
+            },
         },
         "allOf": [
             {"not": {"required": ["check-class", "check-class-constructor"]}},
@@ -1468,6 +1580,14 @@ def test_validate_pyproject(monkeypatch: pytest.MonkeyPatch) -> None:
         action="store_true",
         help="check files even if they match a gitignore pattern",
     )
+    parser.add_argument(
+        "--jobs",
+        metavar="INT",
+        action="store",
+        type=int,
+        default=1,
+        help="number of processes to check files with (0 for one per cpu)",
+    )
     parser.add_argument(
         "-s",
         "--string",
@@ -1875,3 +1995,542 @@ def test_multi_file_json_is_one_valid_document(
     assert len(issues) == 2
     assert {Path(i["path"]).name for i in issues} == {"one.py", "two.py"}
     assert all(i["message"].startswith(E[203].ref) for i in issues)
+
+
+def test_jobs_report_matches_serial_run(
+    capsys: pytest.CaptureFixture,
+    make_tree: FixtureMakeTree,
+    main: FixtureMain,
+) -> None:
+    """Checking files in parallel reports the same as a serial run.
+
+    :param capsys: Capture sys out.
+    :param make_tree: Create directory tree from dict mapping.
+    :param main: Mock ``main`` function.
+    """
+    template = ["def function(param) -> None:", '    """Summary."""']
+    make_tree(
+        {
+            "module": {f"file{i}.py": template for i in range(8)},
+            "valid.py": ["def function() -> None:", '    """Summary."""'],
+            "invalid.py": [WILL_ERROR],
+        },
+    )
+    serial = main(".", test_flake8=False)
+    expected = capsys.readouterr().out
+    assert main(".", "--jobs", "2", test_flake8=False) == serial == 123
+    assert capsys.readouterr().out == expected
+    assert main(".", "--jobs", "0", test_flake8=False) == serial
+    assert capsys.readouterr().out == expected
+
+
+def test_negative_jobs(
+    capsys: pytest.CaptureFixture,
+    init_file: FixtureInitFile,
+    main: FixtureMain,
+) -> None:
+    """Test error raised when the number of jobs is negative.
+
+    :param capsys: Capture sys out.
+    :param init_file: Initialize a test file.
+    :param main: Mock ``main`` function.
+    """
+    init_file("")
+    assert main(".", "--jobs", "-1", test_flake8=False) == 2
+    std = capsys.readouterr()
+    assert std.err.strip() == "argument to jobs must not be negative"
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "from .module import name\n\n__all__ = ['name']\n",
+        'DEFAULT = 1\nclassifiers = ["definition"]\n',
+        "",
+        'def function(param) -> None:\n    """Summary.\n\n'
+        '    :param param: Description.\n    """\n',
+        "class Klass:\n    def method(self) -> None:\n"
+        '        """Summary."""\n',
+        "class Klass(Base):\n    pass\n",
+        "class Klass(Base):\n    def method(self) -> None:\n"
+        '        """Summary."""\n',
+    ],
+    ids=[
+        "reexport",
+        "constants",
+        "empty",
+        "function",
+        "no-bases",
+        "no-method",
+        "passing-method",
+    ],
+)
+def test_astroid_only_built_to_infer_bases(
+    monkeypatch: pytest.MonkeyPatch,
+    init_file: FixtureInitFile,
+    main: FixtureMain,
+    template: str,
+) -> None:
+    """Test astroid is not built without a base class to infer.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param init_file: Initialize a test file.
+    :param main: Mock ``main`` function.
+    :param template: Contents of the module.
+    """
+    parse = Mock()
+    init_file(template)
+    monkeypatch.setattr("docsig._backend._astroid.parse", parse)
+    assert main(".", "--no-cache", test_flake8=False) == 0
+    parse.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "module,expected",
+    [("base", 0), ("missing", 1)],
+    ids=["found", "not-found"],
+)
+def test_base_from_checked_module_outside_cwd(
+    monkeypatch: pytest.MonkeyPatch,
+    make_tree: FixtureMakeTree,
+    main: FixtureMain,
+    module: str,
+    expected: int,
+) -> None:
+    """Test a base imported from a package outside the working dir.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param make_tree: Create directory tree from dict mapping.
+    :param main: Mock ``main`` function.
+    :param module: Module the base is imported from.
+    :param expected: Expected exit status.
+    """
+    make_tree(
+        {
+            "project": {
+                "package": {
+                    "__init__.py": [],
+                    "base.py": [
+                        "class Base:",
+                        "    def method(self, param) -> None:",
+                        '        """Summary.',
+                        "",
+                        "        :param param: Description.",
+                        '        """',
+                    ],
+                    "child.py": [
+                        f"from .{module} import Base",
+                        "class Child(Base):",
+                        "    def method(self, param) -> None:",
+                        "        pass",
+                    ],
+                },
+            },
+            "elsewhere": {},
+        },
+    )
+    package = Path("project", "package").resolve()
+    monkeypatch.chdir("elsewhere")
+    assert main(str(package), "--no-cache", test_flake8=False) == expected
+
+
+def test_misplaced_type_comment(
+    capsys: pytest.CaptureFixture,
+    main: FixtureMain,
+) -> None:
+    """Test source astroid parses despite a misplaced type comment.
+
+    :param capsys: Capture sys out.
+    :param main: Mock ``main`` function.
+    """
+    source = (
+        'def function(param) -> None:\n    """Summary."""\n    # type: int\n'
+    )
+    assert main("--string", source, test_flake8=False) == 1
+    std = capsys.readouterr()
+    assert E[203].ref in std.out
+
+
+@pytest.mark.parametrize(
+    "error,expected",
+    [
+        (astroid.DuplicateBasesError("", [], None), (E[904].ref, 2)),
+        (RecursionError(), (E[903].ref, 2)),
+        (astroid.InferenceError(), (E[101].ref, 1)),
+    ],
+    ids=["duplicate-bases", "recursion", "inference"],
+)
+def test_error_inferring_bases(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    main: FixtureMain,
+    error: Exception,
+    expected: tuple[str, int],
+) -> None:
+    """Test an error inferring the bases of a class does not crash.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param capsys: Capture sys out.
+    :param main: Mock ``main`` function.
+    :param error: Error inferring the bases.
+    :param expected: Message expected for the method, and exit status.
+    """
+    monkeypatch.setattr(
+        "docsig._backend.Backend.ancestors",
+        Mock(side_effect=error),
+    )
+    ref, retcode = expected
+    source = """
+class Klass(Base):
+    def method(self, param) -> None:
+        pass
+"""
+    assert main("--string", source, test_flake8=False) == retcode
+    assert ref in capsys.readouterr().out
+
+
+def test_nothing_to_check_syntax_error(
+    capsys: pytest.CaptureFixture,
+    init_file: FixtureInitFile,
+    main: FixtureMain,
+) -> None:
+    """Test a syntax error is reported for a module without a function.
+
+    :param capsys: Capture sys out.
+    :param init_file: Initialize a test file.
+    :param main: Mock ``main`` function.
+    """
+    init_file("CONSTANT = (\n")
+    assert main(".", test_flake8=False) == 123
+    assert E[901].ref in capsys.readouterr().out
+
+
+def test_inference_of_bases_avoided(
+    init_file: FixtureInitFile,
+    patch_logger: io.StringIO,
+    main: FixtureMain,
+) -> None:
+    """Test the ancestors of a class are only inferred when needed.
+
+    :param init_file: Initialize a test file.
+    :param patch_logger: Logs as an io instance.
+    :param main: Mock ``main`` function.
+    """
+    template = '''
+class Base:
+    def method(self, param) -> None:
+        """Summary.
+
+        :param param: Description of param.
+        """
+
+class Child(Base):
+    def _protected(self, param) -> None:
+        pass
+
+    def __len__(self) -> int:
+        pass
+
+    def method(self, param) -> None:
+        """Summary."""
+
+    def other(self) -> None:
+        """Summary."""
+'''
+    file = init_file(template)
+    assert main(".", "--verbose", "--no-cache", test_flake8=False) == 0
+    # the ancestors of Child are inferred once, for the first method not
+    # skipped that fails, rather than for each of its methods, and
+    # nothing would be inferred for the methods of Base, without bases
+    assert (
+        f"{file.relative_to(Path.cwd())}: "
+        "3 of 4 inferences of base classes avoided"
+    ) in patch_logger.getvalue()
+
+
+def test_flake8_checks_lines_already_read(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    init_file: FixtureInitFile,
+    flake8: FixtureFlake8,
+) -> None:
+    """Test the flake8 plugin does not read the file flake8 has read.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param capsys: Capture sys out.
+    :param init_file: Initialize a test file.
+    :param flake8: Flake8 plugin fixture.
+    """
+    read = Mock()
+    init_file('def function(param) -> None:\n    """Summary."""\n')
+    monkeypatch.setattr("docsig._parsers.read_source", read)
+    monkeypatch.setattr("docsig._core._read_source", read)
+    assert flake8(".") == 1
+    assert "SIG203" in capsys.readouterr().out
+    read.assert_not_called()
+
+
+def test_identical_docstrings_parsed_once(
+    capsys: pytest.CaptureFixture,
+    init_file: FixtureInitFile,
+    patch_logger: io.StringIO,
+    main: FixtureMain,
+) -> None:
+    """Test an identical docstring is parsed once and checked each time.
+
+    :param capsys: Capture sys out.
+    :param init_file: Initialize a test file.
+    :param patch_logger: Logs as an io instance.
+    :param main: Mock ``main`` function.
+    """
+    docstring = '''
+    """Summary for test_identical_docstrings_parsed_once.
+
+    Args:
+        a: Description of a.
+        a: Description of a.
+    """
+'''
+    file = init_file(
+        "".join(
+            f"def function_{i}(a, b) -> None:{docstring}" for i in range(2)
+        ),
+    )
+    main(".", "--verbose", "--no-cache", test_flake8=False)
+    assert capsys.readouterr().out.count(E[201].ref) == 2
+    assert (
+        f"{file.relative_to(Path.cwd())}: 1 docstring cache hits, 1 misses"
+    ) in patch_logger.getvalue()
+
+
+@pytest.mark.parametrize(
+    "docstring,style,args",
+    [
+        (":param a: Description.\n:param b: Description.", "RST", 2),
+        ("Summary.\n\nArgs:\n    a: Description of a.", "GOOGLE", 1),
+        ("Parameters\n----------\na : int\n    Description.", "NUMPY", 1),
+        ("Args:\n    a: Description of a.\n:param b: Description.", "RST", 1),
+        ("Summary.\n\n    :param a: Description of a.", "RST", 1),
+        ("Summary.\n\nSee :class:`Thing` for more.", "PLAIN", 0),
+    ],
+    ids=["rst", "google", "numpy", "mixed", "indented", "plain"],
+)
+def test_docstring_style(docstring: str, style: str, args: int) -> None:
+    """Test the style a docstring is written in is recorded once parsed.
+
+    :param docstring: Docstring to parse.
+    :param style: Name of the expected style.
+    :param args: Number of params expected to be parsed.
+    """
+    parsed = Docstring.from_ast(ast.Constant(docstring))
+    assert parsed.style == Style[style]
+    assert len(parsed.args) == args
+
+
+def test_source_without_directives_not_tokenized(
+    monkeypatch: pytest.MonkeyPatch,
+    init_file: FixtureInitFile,
+    main: FixtureMain,
+) -> None:
+    """Test source without a directive is not tokenized to find them.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param init_file: Initialize a test file.
+    :param main: Mock ``main`` function.
+    """
+    generate_tokens = Mock()
+    init_file("def function(param) -> None:\n    pass\n")
+    monkeypatch.setattr(
+        "docsig._directives._tokenize.generate_tokens",
+        generate_tokens,
+    )
+    args = ".", "--no-cache", "--disable", E[101].ref
+    assert main(*args, test_flake8=False) == 0
+    generate_tokens.assert_not_called()
+
+
+def test_directives_stored_where_scope_changes() -> None:
+    """Test scope is stored once for each interval between directives."""
+    lines = [
+        *["x = 1"] * 500,
+        "y = 2  # docsig: disable=SIG101",
+        *["x = 1"] * 500,
+        "# docsig: disable=SIG202",
+        *["x = 1"] * 500,
+    ]
+    directives = Directives.from_text("\n".join(lines), Messages([E[203]]))
+    assert len(directives) == 4
+    for lineno, disabled in (
+        (1, [E[203]]),
+        (501, [E[101], E[203]]),
+        (502, [E[101], E[203]]),
+        (503, [E[203]]),
+        (1002, [E[202], E[203]]),
+        (1502, [E[202], E[203]]),
+    ):
+        assert sorted(directives.get(lineno)[1]) == sorted(disabled)
+
+
+def test_inline_directive_replaces_scope_of_line() -> None:
+    """Test a directive after code is in effect for its own line."""
+    directives = Directives.from_text(
+        "# docsig: disable-next=SIG101\n"
+        "x = 1\n"
+        "y = 'string'  # docsig: disable=SIG102\n",
+        Messages(),
+    )
+    assert directives.get(2)[1] == Messages([E[101]])
+    assert directives.get(3)[1] == Messages([E[102]])
+
+
+def test_directives_token_error(
+    capsys: pytest.CaptureFixture,
+    init_file: FixtureInitFile,
+    patch_logger: io.StringIO,
+    main: FixtureMain,
+) -> None:
+    """Test source that cannot be tokenized is checked without directives.
+
+    :param capsys: Capture sys out.
+    :param init_file: Initialize a test file.
+    :param patch_logger: Logs as an io instance.
+    :param main: Mock ``main`` function.
+    """
+    file = init_file(
+        "def function(param) -> None:  # docsig: disable\n"
+        "    pass\n"
+        '""\\\n',
+    )
+    args = ".", "--verbose", "--no-cache"
+    assert main(*args, test_flake8=False) == 1
+    assert E[101].ref in capsys.readouterr().out
+    assert (
+        f"{file.relative_to(Path.cwd())}: error parsing comments"
+    ) in patch_logger.getvalue()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [(), ("--ignore-no-params",)],
+    ids=["default", "ignore-no-params"],
+)
+def test_target_missing_skips_parsing(
+    capsys: pytest.CaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    init_file: FixtureInitFile,
+    main: FixtureMain,
+    options: tuple[str, ...],
+) -> None:
+    """Test signatures and docstrings are not parsed to find them missing.
+
+    :param capsys: Capture sys out.
+    :param monkeypatch: Mock patch environment and attributes.
+    :param init_file: Initialize a test file.
+    :param main: Mock ``main`` function.
+    :param options: Further options to check with.
+    """
+    from_ast = Mock()
+    init_file(
+        "def function_1(param) -> None:\n    pass\n\n\n"
+        'def function_2(param) -> None:\n    """Summary."""\n',
+    )
+    monkeypatch.setattr("docsig._scope._Signature.from_ast", from_ast)
+    monkeypatch.setattr("docsig._scope._Docstring.from_ast", from_ast)
+    args = ".", "--no-cache", "--target", E[101].ref, *options
+    assert main(*args, test_flake8=False) == 1
+    out = capsys.readouterr().out
+    assert "function_1" in out
+    assert "function_2" not in out
+    from_ast.assert_not_called()
+
+
+def test_skipped_functions_not_parsed(
+    monkeypatch: pytest.MonkeyPatch,
+    init_file: FixtureInitFile,
+    main: FixtureMain,
+) -> None:
+    """Test functions that are not checked are not parsed.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param init_file: Initialize a test file.
+    :param main: Mock ``main`` function.
+    """
+    from_ast = Mock()
+    init_file(
+        "class _Protected:\n"
+        "    def __eq__(self, other) -> bool:\n"
+        '        """Summary."""\n\n'
+        "    def _method(self, param) -> None:\n"
+        '        """Summary."""\n',
+    )
+    monkeypatch.setattr("docsig._scope._Signature.from_ast", from_ast)
+    monkeypatch.setattr("docsig._scope._Docstring.from_ast", from_ast)
+    assert main(".", "--no-cache", "--check-class", test_flake8=False) == 0
+    from_ast.assert_not_called()
+
+
+def test_function_not_parsed_has_empty_stubs() -> None:
+    """Test a function carrying an error has nothing to parse."""
+    function = Function.from_error(SyntaxError)
+    assert not function.signature.args
+    assert not function.docstring.args
+
+
+@pytest.mark.parametrize("mmap_size", [MMAP_SIZE, 1], ids=["read", "mmap"])
+@pytest.mark.parametrize(
+    "source,expected",
+    [
+        (b"\xef\xbb\xbfpass\n", "pass\n"),
+        (
+            b"# coding: latin-1\n# caf\xe9\n",
+            "# coding: latin-1\n# caf\u00e9\n",
+        ),
+        (b"pass\r\npass\rpass\n", "pass\npass\npass\n"),
+        (b"", ""),
+    ],
+    ids=["bom", "cookie", "newlines", "empty"],
+)
+def test_source_decoded_as_python_reads_it(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    mmap_size: int,
+    source: bytes,
+    expected: str,
+) -> None:
+    """Test the bytes of a file are decoded as Python would read them.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param tmp_path: Create and return the temporary directory.
+    :param mmap_size: Size from which files are mapped into memory.
+    :param source: Bytes of the file.
+    :param expected: Expected source code.
+    """
+    monkeypatch.setattr("docsig._parsers.MMAP_SIZE", mmap_size)
+    file = tmp_path / "file.py"
+    file.write_bytes(source)
+    with read_source(file) as buffer:
+        assert _decode(buffer) == expected
+
+
+def test_file_opened_once(
+    monkeypatch: pytest.MonkeyPatch,
+    init_file: FixtureInitFile,
+    main: FixtureMain,
+) -> None:
+    """Test a file is opened once to key its result and check it.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param init_file: Initialize a test file.
+    :param main: Mock ``main`` function.
+    """
+    opened = []
+    open_ = io.open
+
+    def _open(file: Path, *args: t.Any, **kwargs: t.Any) -> t.IO[t.Any]:
+        opened.append(file)
+        return open_(file, *args, **kwargs)
+
+    file = init_file('def function(param) -> None:\n    """Summary."""\n')
+    monkeypatch.setattr("io.open", _open)
+    assert main(file, test_flake8=False) == 1
+    assert opened.count(file) == 1
@@ -3,11 +3,193 @@ tests.benchmark_test
 ====================
 """
 
+from __future__ import annotations
+
+import ast
+import contextlib
+import io
+import os
+import random
+import sys
+import typing as t
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 
 from docsig import docsig
 
-from . import FixtureMain
+# noinspection PyProtectedMember
+from docsig._backend import Backend
+
+# noinspection PyProtectedMember
+from docsig._config import DEFAULT_EXCLUDES, Check, Config, Filters
+
+# noinspection PyProtectedMember
+from docsig._directives import Directives
+
+# noinspection PyProtectedMember
+from docsig._files import Files
+
+# noinspection PyProtectedMember
+from docsig._parsers import parse_from_string
+
+# noinspection PyProtectedMember
+from docsig._report import report
+
+# noinspection PyProtectedMember
+from docsig._scope import Scope
+
+# noinspection PyProtectedMember
+from docsig._traverse import run_checks
+from docsig.messages import Messages
+
+from . import FixtureBench
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # not available on windows, where peak memory is not recorded
+    resource = None  # type: ignore
+
+# the corpus is only as large as a benchmark needs when benchmarking,
+# so the same tests still run quickly as part of the suite
+CORPUS_MODULES = (
+    2000 if os.getenv("RUN_BENCHMARK", "false").lower() == "true" else 20
+)
+
+# modules in each chain of classes, each deriving from the class of the
+# module before it
+HIERARCHY_DEPTH = 10
+
+RST = '''"""Summary of {name}.
+
+        :param a: Description of a.
+        :param {b}: Description of b.
+        :return: Description of return.
+        """'''
+
+GOOGLE = '''"""Summary of {name}.
+
+        Args:
+            a (int): Description of a.
+            {b} (str): Description of b.
+
+        Returns:
+            int: Description of return.
+        """'''
+
+NUMPY = '''"""Summary of {name}.
+
+        Parameters
+        ----------
+        a : int
+            Description of a.
+        {b} : str
+            Description of b.
+
+        Returns
+        -------
+        int
+            Description of return.
+        """'''
+
+
+def _function(rng: random.Random, name: str) -> str:
+    # one in five documents a param that does not exist, one in ten has
+    # no docstring, and one in ten disables a check inline
+    template = rng.choice((RST, GOOGLE, NUMPY))
+    b = "c" if rng.random() < 0.2 else "b"
+    comment = "  # docsig: disable=SIG402" if rng.random() < 0.1 else ""
+    body = "        return a"
+    if rng.random() >= 0.1:
+        body = f"        {template.format(name=name, b=b)}\n{body}"
+
+    return f"    def {name}(self, a: int, b: str) -> int:{comment}\n{body}"
+
+
+def _module(rng: random.Random, index: int, functions: int) -> str:
+    # a class deriving from the class of the module before it, unless
+    # it starts a new chain, and methods that are overridden in turn
+    base = index - 1
+    lines = ['"""Generated module."""', ""]
+    if index % HIERARCHY_DEPTH:
+        lines.append(f"from .module{base} import Class{base}")
+        lines.append("")
+        parent = f"Class{base}"
+    else:
+        parent = "object"
+
+    if rng.random() < 0.2:
+        lines.append("# docsig: disable=SIG501")
+
+    lines.append(f"class Class{index}({parent}):")
+    lines.append(f'    """Class {index}."""')
+    for method in range(functions):
+        lines.append("")
+        lines.append(_function(rng, f"method{method}"))
+        if rng.random() < 0.05:
+            lines.append("    # docsig: enable")
+
+    return "\n".join([*lines, ""])
+
+
+def _process_peak_rss() -> int | None:
+    # the peak resident memory of the whole test process so far, as
+    # ru_maxrss, not of the benchmark alone, in kilobytes, which macos
+    # reports in bytes
+    if resource is None:  # pragma: no cover
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _throughput(bench: FixtureBench, files: int, functions: int) -> None:
+    # record the rate a benchmark checked at, only where it was timed
+    stats = getattr(bench, "stats", None)
+    if stats is not None:
+        mean = stats.stats.mean
+        bench.extra_info.update(  # type: ignore
+            files_per_sec=files / mean,
+            functions_per_sec=functions / mean,
+            process_peak_rss_kb=_process_peak_rss(),
+        )
+
+
+class _Corpus(t.NamedTuple):
+    root: Path
+    files: list[Path]
+    sources: list[str]
+    functions: int
+
+
+@pytest.fixture(name="corpus", scope="module")
+def fixture_corpus(tmp_path_factory: pytest.TempPathFactory) -> _Corpus:
+    """Generate a package of modules as checked in a real project.
+
+    Docstrings mix rst, Google, and NumPy styles, classes derive from
+    each other across modules, and directives are used throughout.
+
+    :param tmp_path_factory: Create temporary directories.
+    :return: The package generated, its files, and their sources.
+    """
+    rng = random.Random(0)
+    root = tmp_path_factory.mktemp("corpus")
+    package = root / "package"
+    package.mkdir()
+    (package / "__init__.py").touch()
+    files, sources, functions = [], [], 0
+    for index in range(CORPUS_MODULES):
+        count = rng.randint(5, 15)
+        source = _module(rng, index, count)
+        file = package / f"module{index}.py"
+        file.write_text(source, encoding="utf-8")
+        files.append(file)
+        sources.append(source)
+        functions += count
+
+    return _Corpus(root, files, sources, functions)
 
 
 @pytest.mark.parametrize(
@@ -168,7 +350,7 @@ def function() -> None:
     ],
 )
 @pytest.mark.benchmark
-def test_bench(bench: FixtureMain, template: str, path: str) -> None:
+def test_bench(bench: FixtureBench, template: str, path: str) -> None:
     """A small benchmark test.
 
     :param bench: Benchmark fixture that is active when the environment
@@ -177,3 +359,259 @@ def test_bench(bench: FixtureMain, template: str, path: str) -> None:
     :param path: An associated mock file path.
     """
     bench(docsig, path, string=template)
+
+
+@pytest.mark.benchmark
+def test_bench_excluded_venv(bench: FixtureBench) -> None:
+    """Benchmark finding files beside a large virtualenv.
+
+    :param bench: Benchmark fixture that is active when the environment
+        allows it to be.
+    """
+    for package in range(100):
+        path = Path(".venv", "lib", "site-packages", f"package{package}")
+        path.mkdir(parents=True)
+        for module in range(20):
+            (path / f"module{module}.py").touch()
+
+    Path("src").mkdir()
+    (Path("src") / "module.py").touch()
+    files = bench(Files, (".",), Filters(exclude=[DEFAULT_EXCLUDES]))
+    assert Path("src") / "module.py" in files
+    assert not any(i.parts[0] == ".venv" for i in files)
+
+
+@pytest.mark.benchmark
+def test_bench_discovery_syscalls(
+    monkeypatch: pytest.MonkeyPatch,
+    bench: FixtureBench,
+) -> None:
+    """Benchmark the calls made to the filesystem to find files.
+
+    Each directory is listed and stat-ed once, whatever its number of
+    files, rather than each file being asked what type it is.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param bench: Benchmark fixture that is active when the environment
+        allows it to be.
+    """
+    for package in range(20):
+        path = Path("src", f"package{package}")
+        path.mkdir(parents=True)
+        for module in range(50):
+            (path / f"module{module}.py").touch()
+
+    calls: dict[str, int] = {}
+    # methods of each entry listed, as an entry is stat-ed without going
+    # through os
+    methods: dict[str, int] = {}
+    scandir = os.scandir
+
+    class _Entry:  # pylint: disable=too-few-public-methods
+        def __init__(self, entry: os.DirEntry[str]) -> None:
+            self._entry = entry
+
+        def __getattr__(self, name: str) -> t.Any:
+            methods[name] = methods.get(name, 0) + 1
+            return getattr(self._entry, name)
+
+    @contextlib.contextmanager
+    def _scandir(path: str | os.PathLike[str]) -> t.Iterator[t.Any]:
+        calls["scandir"] = calls.get("scandir", 0) + 1
+        with scandir(path) as it:
+            yield (_Entry(i) for i in it)
+
+    def _count(name: str) -> t.Callable[..., t.Any]:
+        func = getattr(os, name)
+
+        def _counted(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            calls[name] = calls.get(name, 0) + 1
+            return func(*args, **kwargs)
+
+        return _counted
+
+    with monkeypatch.context() as context:
+        for name in "stat", "lstat", "listdir":
+            context.setattr(os, name, _count(name))
+
+        context.setattr(os, "scandir", _scandir)
+        files = Files(("src",), Filters())
+
+    # a few for the path given and finding its repo, and two for each
+    # of the directories, the type and inode of each file being read
+    # with its directory
+    assert len(files) == 1000
+    assert sum(calls.values()) + methods.get("stat", 0) < 100
+    bench(Files, ("src",), Filters())
+
+
+@pytest.mark.benchmark
+def test_bench_parse(bench: FixtureBench) -> None:
+    """Benchmark parsing a module of documented functions and classes.
+
+    :param bench: Benchmark fixture that is active when the environment
+        allows it to be.
+    """
+    function = '''
+@decorator
+def function{0}(a: int, b: str = "b", *args: int, **kwargs: str) -> int:
+    """Docstring summary.
+
+    :param a: Description of a.
+    :param b: Description of b.
+    :param args: Description of args.
+    :param kwargs: Description of kwargs.
+    :return: Description of return.
+    """
+    return a
+'''
+    klass = '''
+class Klass{0}:
+    """Docstring summary.
+
+    :param a: Description of a.
+    """
+
+    def __init__(self, a: int) -> None:
+        self.a = a
+
+    @property
+    def prop(self) -> int:
+        """Docstring summary."""
+        return self.a
+'''
+    code = "".join(
+        f"{function.format(i)}{klass.format(i)}" for i in range(100)
+    )
+    module = bench(parse_from_string, code, Config())
+    assert len(module.children) == 200
+
+
+@pytest.mark.benchmark
+def test_bench_corpus(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    bench: FixtureBench,
+    corpus: _Corpus,
+) -> None:
+    """Benchmark checking a whole corpus from the command line.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param capsys: Capture sys out.
+    :param bench: Benchmark fixture that is active when the environment
+        allows it to be.
+    :param corpus: Generated package of modules.
+    """
+    monkeypatch.chdir(corpus.root)
+    assert bench(docsig, ".", check_class=True, no_cache=True) == 1
+    assert "module0.py" in capsys.readouterr().out
+    _throughput(bench, len(corpus.files), corpus.functions)
+
+
+@pytest.mark.benchmark
+def test_bench_stage_discovery(bench: FixtureBench, corpus: _Corpus) -> None:
+    """Benchmark finding the files of a corpus.
+
+    :param bench: Benchmark fixture that is active when the environment
+        allows it to be.
+    :param corpus: Generated package of modules.
+    """
+    files = bench(Files, (corpus.root,), Filters(exclude=[DEFAULT_EXCLUDES]))
+    assert len(files) == len(corpus.files) + 1
+
+
+@pytest.mark.benchmark
+def test_bench_stage_parse(bench: FixtureBench, corpus: _Corpus) -> None:
+    """Benchmark parsing the modules of a corpus.
+
+    :param bench: Benchmark fixture that is active when the environment
+        allows it to be.
+    :param corpus: Generated package of modules.
+    """
+
+    def _parse() -> list[ast.Module]:
+        return [Backend(i).parse() for i in corpus.sources]
+
+    assert len(bench(_parse)) == len(corpus.files)
+
+
+@pytest.mark.benchmark
+def test_bench_stage_directives(bench: FixtureBench, corpus: _Corpus) -> None:
+    """Benchmark reading the directives of a corpus.
+
+    :param bench: Benchmark fixture that is active when the environment
+        allows it to be.
+    :param corpus: Generated package of modules.
+    """
+
+    def _directives() -> list[Directives]:
+        return [Directives.from_text(i, Messages()) for i in corpus.sources]
+
+    assert any(bench(_directives))
+
+
+@pytest.mark.benchmark
+def test_bench_stage_check(bench: FixtureBench, corpus: _Corpus) -> None:
+    """Benchmark building scopes for a corpus and checking them.
+
+    Signatures and docstrings are parsed as they are checked, so the
+    scopes are built afresh for each round.
+
+    :param bench: Benchmark fixture that is active when the environment
+        allows it to be.
+    :param corpus: Generated package of modules.
+    """
+    config = Config(check=Check(class_=True))
+    parsed = [
+        (f, s, Backend(s).parse(), Directives.from_text(s, Messages()))
+        for f, s in zip(corpus.files, corpus.sources)
+    ]
+
+    def _check() -> int:
+        failures = 0
+        for file, source, tree, directives in parsed:
+            # a new backend, so no ancestors inferred in an earlier round
+            # are reused
+            backend = Backend(source, f"package.{file.stem}", file, tree)
+            scope = Scope.from_ast(
+                backend.parse(), directives, config, backend
+            )
+            failures += len(run_checks(scope, config))
+
+        return failures
+
+    assert bench(_check)
+    _throughput(bench, len(corpus.files), corpus.functions)
+
+
+@pytest.mark.benchmark
+def test_bench_stage_report(bench: FixtureBench, corpus: _Corpus) -> None:
+    """Benchmark reporting the failures of a corpus.
+
+    :param bench: Benchmark fixture that is active when the environment
+        allows it to be.
+    :param corpus: Generated package of modules.
+    """
+    config = Config()
+    results = [
+        (run_checks(parse_from_string(s, config), config), str(f))
+        for f, s in zip(corpus.files, corpus.sources)
+    ]
+
+    def _report() -> int:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return report(results, config)
+
+    assert bench(_report) == 1
+
+
+def test_throughput() -> None:
+    """Test the rate a timed benchmark checked at is recorded."""
+    bench = SimpleNamespace(
+        stats=SimpleNamespace(stats=SimpleNamespace(mean=2.0)),
+        extra_info={},
+    )
+    _throughput(t.cast(FixtureBench, bench), 10, 100)
+    assert bench.extra_info["files_per_sec"] == 5
+    assert bench.extra_info["functions_per_sec"] == 50
+    assert "process_peak_rss_kb" in bench.extra_info
@@ -0,0 +1,209 @@
+"""
+tests.cache_test
+================
+"""
+
+# pylint: disable=protected-access
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import pickle
+from pathlib import Path
+
+import astroid
+import pytest
+
+import docsig
+
+# noinspection PyProtectedMember
+from docsig._cache import CACHE_DIR, Cache
+
+# noinspection PyProtectedMember
+from docsig._config import Config
+
+# noinspection PyProtectedMember
+from docsig._diagnostic import Failures
+
+from . import FixtureInitFile, FixtureMain, FixtureMakeTree
+
+CACHED = "unchanged, using cached result"
+TEMPLATE = '''
+def function(param) -> None:
+    """Summary."""
+'''
+
+
+def test_unchanged_file_reuses_result(
+    capsys: pytest.CaptureFixture,
+    init_file: FixtureInitFile,
+    patch_logger: io.StringIO,
+    main: FixtureMain,
+) -> None:
+    """Test an unchanged file is reported from the cache.
+
+    :param capsys: Capture sys out.
+    :param init_file: Initialize a test file.
+    :param patch_logger: Logs as an io instance.
+    :param main: Mock ``main`` function.
+    """
+    file = init_file(TEMPLATE)
+    assert main(".", "--verbose", test_flake8=False) == 1
+    expected = capsys.readouterr().out
+    assert CACHED not in patch_logger.getvalue()
+    assert main(".", "--verbose", test_flake8=False) == 1
+    assert capsys.readouterr().out == expected
+    assert f"{file.relative_to(Path.cwd())}: {CACHED}" in (
+        patch_logger.getvalue()
+    )
+    assert (Path(CACHE_DIR) / "CACHEDIR.TAG").is_file()
+    assert (Path(CACHE_DIR) / ".gitignore").read_text().endswith("*\n")
+
+
+def test_changed_file_is_checked_again(
+    capsys: pytest.CaptureFixture,
+    init_file: FixtureInitFile,
+    main: FixtureMain,
+) -> None:
+    """Test a file is checked again once its content changes.
+
+    :param capsys: Capture sys out.
+    :param init_file: Initialize a test file.
+    :param main: Mock ``main`` function.
+    """
+    assert main(".", test_flake8=False) == 0
+    init_file(TEMPLATE)
+    assert main(".", test_flake8=False) == 1
+    assert docsig.messages.E[203].ref in capsys.readouterr().out
+
+
+def test_config_change_is_checked_again(
+    init_file: FixtureInitFile,
+    main: FixtureMain,
+) -> None:
+    """Test a file is checked again when the config changes its result.
+
+    :param init_file: Initialize a test file.
+    :param main: Mock ``main`` function.
+    """
+    init_file(TEMPLATE)
+    assert main(".", test_flake8=False) == 1
+    assert main(".", "--disable", "SIG203", test_flake8=False) == 0
+
+
+def test_no_cache(init_file: FixtureInitFile, main: FixtureMain) -> None:
+    """Test nothing is stored when the cache is disabled.
+
+    :param init_file: Initialize a test file.
+    :param main: Mock ``main`` function.
+    """
+    init_file(TEMPLATE)
+    assert main(".", "--no-cache", test_flake8=False) == 1
+    assert not Path(CACHE_DIR).exists()
+
+
+def test_changed_base_class_is_checked_again(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    make_tree: FixtureMakeTree,
+    main: FixtureMain,
+) -> None:
+    """Test a file is checked again when a base class module changes.
+
+    The result for an unchanged file still depends on whether its
+    methods override those of a base class in another module.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param capsys: Capture sys out.
+    :param make_tree: Create directory tree from dict mapping.
+    :param main: Mock ``main`` function.
+    """
+    monkeypatch.syspath_prepend(Path.cwd())
+    base = [
+        "class Base:",
+        "    def method(self, param) -> None:",
+        '        """Summary.',
+        "",
+        "        :param param: Description of param.",
+        '        """',
+    ]
+    child = [
+        "from base import Base",
+        "class Child(Base):",
+        "    def method(self, param) -> None:",
+        '        """Summary."""',
+    ]
+    make_tree({"child.py": child, "base.py": base})
+    assert main("child.py", test_flake8=False) == 0
+    make_tree({"base.py": ["class Base:", "    pass"]})
+    # astroid keeps its own cache of the modules it has already built
+    astroid.MANAGER.clear_cache()
+    assert main("child.py", test_flake8=False) == 1
+    assert "Child.method" in capsys.readouterr().out
+
+
+def test_corrupt_entry_is_a_miss(init_file: FixtureInitFile) -> None:
+    """Test a corrupt entry is checked again rather than raising.
+
+    :param init_file: Initialize a test file.
+    """
+    file = init_file(TEMPLATE)
+    cache = Cache(Config())
+    key = cache.key(file)
+    cache.set(key, Failures(), [])
+    assert cache.get(key) == Failures()
+    cache._path(key).write_bytes(b"corrupt")
+    assert cache.get(key) is None
+
+
+def test_entry_is_plain_data(init_file: FixtureInitFile) -> None:
+    """Test entries are stored as json and a pickle is never loaded.
+
+    :param init_file: Initialize a test file.
+    """
+    file = init_file(TEMPLATE)
+    cache = Cache(Config())
+    key = cache.key(file)
+    cache.set(key, Failures(), [])
+    assert json.loads(cache._path(key).read_bytes()) == [[], []]
+    cache._path(key).write_bytes(pickle.dumps(((), Failures())))
+    assert cache.get(key) is None
+
+
+def test_deleted_dependency_is_a_miss(init_file: FixtureInitFile) -> None:
+    """Test a result is checked again once a file it depends on is gone.
+
+    :param init_file: Initialize a test file.
+    """
+    file = init_file(TEMPLATE)
+    base = init_file("class Base: ...", Path("base.py"))
+    cache = Cache(Config())
+    key = cache.key(file)
+    cache.set(key, Failures(), [str(base)])
+    assert cache.get(key) == Failures()
+    base.unlink()
+    assert cache.get(key) is None
+
+
+def test_prune_evicts_least_recently_used(
+    init_file: FixtureInitFile,
+) -> None:
+    """Test entries past the size limit are evicted oldest first.
+
+    :param init_file: Initialize a test file.
+    """
+    cache = Cache(Config(), max_size=0)
+    keys = []
+    for count in range(3):
+        key = cache.key(init_file(f"# {count}", Path(f"file{count}.py")))
+        cache.set(key, Failures(), [])
+        # pin the time of use, as the writes may share a timestamp
+        os.utime(cache._path(key), ns=(count, count))
+        keys.append(key)
+
+    size = cache._path(keys[0]).stat().st_size
+    cache._max_size = size
+    cache.prune()
+    assert [cache.get(i) for i in keys] == [None, None, Failures()]
@@ -0,0 +1,209 @@
+"""
+tests.changed_test
+==================
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from docsig import docsig
+
+from . import WILL_ERROR, FixtureMain, FixtureMakeTree
+
+
+def _git(*args: str) -> None:
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=docsig",
+            "-c",
+            "user.email=docsig@example.com",
+            *args,
+        ],
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture(name="repo")
+def fixture_repo(make_tree: FixtureMakeTree) -> None:
+    """Commit a repo whose files would all fail.
+
+    :param make_tree: Create directory tree from dict mapping.
+    """
+    make_tree(
+        {
+            "package": {"old.py": [WILL_ERROR], "moved.py": [WILL_ERROR]},
+            "other": {"old.py": [WILL_ERROR]},
+            "deleted.py": [WILL_ERROR],
+        },
+    )
+    _git("init", "--initial-branch", "main")
+    _git("add", ".")
+    _git("commit", "-m", "initial")
+
+
+@pytest.mark.usefixtures("repo")
+def test_changed_since_ref(
+    capsys: pytest.CaptureFixture,
+    make_tree: FixtureMakeTree,
+    main: FixtureMain,
+) -> None:
+    """Test only python files changed since a ref are checked.
+
+    :param capsys: Capture sys out.
+    :param make_tree: Create directory tree from dict mapping.
+    :param main: Mock ``main`` function.
+    """
+    assert main(".", "--changed-since", "main", test_flake8=False) == 0
+    make_tree(
+        {
+            "package": {"new.py": [WILL_ERROR], "data.txt": ["def f(a):"]},
+            "other": {"old.py": [WILL_ERROR, ""]},
+        },
+    )
+    _git("add", ".")
+    _git("mv", str(Path("package/moved.py")), str(Path("package/renamed.py")))
+    _git("rm", "deleted.py")
+    _git("commit", "-m", "change")
+    assert main(".", "--changed-since", "main~1", test_flake8=False) != 0
+    out = capsys.readouterr().out
+    assert all(
+        str(i) in out
+        for i in (
+            Path("package/new.py"),
+            Path("package/renamed.py"),
+            Path("other/old.py"),
+        )
+    )
+    assert str(Path("package/old.py")) not in out
+    assert "data.txt" not in out
+
+    # only those below the given paths
+    main("package", "--changed-since", "main~1", test_flake8=False)
+    assert str(Path("other/old.py")) not in capsys.readouterr().out
+
+
+@pytest.mark.usefixtures("repo")
+def test_changed_since_branch_point(
+    capsys: pytest.CaptureFixture,
+    make_tree: FixtureMakeTree,
+    main: FixtureMain,
+) -> None:
+    """Test changes since the branch left a ref, and new files, count.
+
+    :param capsys: Capture sys out.
+    :param make_tree: Create directory tree from dict mapping.
+    :param main: Mock ``main`` function.
+    """
+    _git("checkout", "-b", "feature")
+    make_tree({"package": {"old.py": [WILL_ERROR, ""]}})
+    _git("commit", "-am", "feature")
+    _git("checkout", "main")
+    make_tree({"other": {"old.py": [WILL_ERROR, ""]}})
+    _git("commit", "-am", "main")
+    _git("checkout", "feature")
+    make_tree({"untracked.py": [WILL_ERROR]})
+    assert main(".", "--changed-since", "main", test_flake8=False) != 0
+    out = capsys.readouterr().out
+    assert str(Path("package/old.py")) in out
+    assert "untracked.py" in out
+    assert str(Path("other/old.py")) not in out
+
+
+@pytest.mark.usefixtures("repo")
+def test_changed_since_staged(
+    capsys: pytest.CaptureFixture,
+    make_tree: FixtureMakeTree,
+    main: FixtureMain,
+) -> None:
+    """Test only python files staged for commit are checked for staged.
+
+    :param capsys: Capture sys out.
+    :param make_tree: Create directory tree from dict mapping.
+    :param main: Mock ``main`` function.
+    """
+    make_tree({"staged.py": [WILL_ERROR], "unstaged.py": [WILL_ERROR]})
+    _git("add", "staged.py")
+    assert main(".", "--changed-since", ":staged", test_flake8=False) != 0
+    out = capsys.readouterr().out
+    assert "staged.py" in out
+    assert "unstaged.py" not in out
+
+
+@pytest.mark.usefixtures("repo")
+def test_changed_since_requires_ref(main: FixtureMain) -> None:
+    """Test a path given after changed since is not taken as a ref.
+
+    :param main: Mock ``main`` function.
+    """
+    with pytest.raises(SystemExit):
+        main("package", "--changed-since", test_flake8=False)
+
+
+@pytest.mark.usefixtures("repo")
+def test_changed_since_outside_cwd(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    make_tree: FixtureMakeTree,
+    main: FixtureMain,
+) -> None:
+    """Test changed files outside of the working dir are reported in full.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param capsys: Capture sys out.
+    :param make_tree: Create directory tree from dict mapping.
+    :param main: Mock ``main`` function.
+    """
+    make_tree({"other": {"old.py": [WILL_ERROR, ""]}})
+    monkeypatch.chdir("package")
+    assert main("..", "--changed-since", "HEAD", test_flake8=False) != 0
+    assert str(Path("..", "other", "old.py").resolve()) in (
+        capsys.readouterr().out
+    )
+
+
+@pytest.mark.usefixtures("repo")
+def test_changed_since_excluded(
+    make_tree: FixtureMakeTree,
+    main: FixtureMain,
+) -> None:
+    """Test excludes still apply to changed files.
+
+    :param make_tree: Create directory tree from dict mapping.
+    :param main: Mock ``main`` function.
+    """
+    make_tree({"package": {"old.py": [WILL_ERROR, ""]}})
+    args = ".", "--changed-since", "HEAD"
+    assert main(*args, "--exclude", ".*old.py", test_flake8=False) == 0
+
+
+def test_changed_since_errors(
+    capsys: pytest.CaptureFixture,
+    make_tree: FixtureMakeTree,
+) -> None:
+    """Test errors for a bad ref, or a path outside a repo.
+
+    :param capsys: Capture sys out.
+    :param make_tree: Create directory tree from dict mapping.
+    """
+    make_tree({"file.py": []})
+    with pytest.raises(RuntimeError) as err:
+        docsig(".", changed_since="main")
+
+    assert str(err.value) == ". is not in a git repository"
+    _git("init")
+    with pytest.raises(RuntimeError):
+        docsig(".", changed_since="does-not-exist")
+
+    # an option would be passed on to git
+    assert docsig(".", changed_since="--output=file") == 2
+    assert not Path("file").exists()
+    assert capsys.readouterr().err.strip() == (
+        "argument to changed-since must be a git ref"
+    )
@@ -18,6 +18,7 @@ from flake8.main.application import Application
 import docsig
 
 from . import (
+    FixtureBench,
     FixtureFlake8,
     FixtureInitFile,
     FixtureInitPyprojectTomlFile,
@@ -162,7 +163,7 @@ def fixture_make_tree() -> FixtureMakeTree:
 
 
 @pytest.fixture(name="bench")
-def bench(request: pytest.FixtureRequest) -> FixtureMain:
+def bench(request: pytest.FixtureRequest) -> FixtureBench:
     """A fixture that returns a benchmark function or a no-op function.
 
     Depends on whether benchmarking is enabled.
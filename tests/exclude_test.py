@@ -9,6 +9,9 @@ tests.exclude_test
 from __future__ import annotations
 
 import io
+import os
+import re
+import typing as t
 from pathlib import Path
 
 import pytest
@@ -140,12 +143,7 @@ def test_gitignore(
         f"{Path('.pytest_cache/.gitignore')}: in gitignore, skipping",
         f"{Path('.pytest_cache/v')}: in gitignore, skipping",
         f"{Path('CHANGELOG.md')}: parsing python code failed",
-        f"{Path('dist/docsig-0.49.1.tar.gz')}: in gitignore, skipping",
-        f"{Path('dist/docsig-0.49.2-py3-none-any.whl')}: in gitignore, skipping",
-        f"{Path('dist/docsig-0.49.2.tar.gz')}: in gitignore, skipping",
-        f"{Path('dist/docsig-0.49.0-py3-none-any.whl')}: in gitignore, skipping",
-        f"{Path('dist/docsig-0.49.0.tar.gz')}: in gitignore, skipping",
-        f"{Path('dist/docsig-0.49.1-py3-none-any.whl')}: in gitignore, skipping",
+        f"{Path('dist')}: in gitignore, skipping",
         f"{Path('.pre-commit-config.yaml')}: parsing python code failed",
         f"{Path('.coverage')}: in gitignore, skipping",
         f"{Path('Makefile')}: parsing python code failed",
@@ -153,17 +151,12 @@ def test_gitignore(
         f"{Path('.pre-commit-hooks.yaml')}: parsing python code failed",
         f"{Path('pyproject.toml')}: parsing python code successful",
         f"{Path('.bumpversion.cfg')}: parsing python code failed",
-        f"{Path('node_modules/.cache')}: in gitignore, skipping",
+        f"{Path('node_modules')}: in gitignore, skipping",
         f"{Path('tests/misc_test.py')}: parsing python code successful",
         f"{Path('tests/conftest.py')}: parsing python code successful",
         f"{Path('tests/disable_test.py')}: parsing python code successful",
         f"{Path('tests/__init__.py')}: parsing python code successful",
-        f"{Path('tests/__pycache__/_test.cpython-38-pytest-8.1.1.pyc')}: in gitignore, skipping",
-        f"{Path('tests/__pycache__/__init__.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('tests/__pycache__/disable_test.cpython-38-pytest-8.1.1.pyc')}: in gitignore, skipping",
-        f"{Path('tests/__pycache__/misc_test.cpython-38-pytest-8.1.1.pyc')}: in gitignore, skipping",
-        f"{Path('tests/__pycache__/_test.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('tests/__pycache__/conftest.cpython-38-pytest-8.1.1.pyc')}: in gitignore, skipping",
+        f"{Path('tests/__pycache__')}: in gitignore, skipping",
         f"{Path('tests/TESTS.md')}: parsing python code failed",
         f"{Path('tests/git_test.py')}: parsing python code successful",
         f"{Path('tests/_test.py')}: parsing python code successful",
@@ -186,39 +179,7 @@ def test_gitignore(
         f"{Path('docsig/__init__.py')}: parsing python code successful",
         f"{Path('docsig/_display.py')}: parsing python code successful",
         f"{Path('docsig/_hooks.py')}: parsing python code successful",
-        f"{Path('docsig/__pycache__/_core.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/__init__.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_core.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_main.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_decorators.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_message.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_config.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_config.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/messages.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_display.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_display.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_stub.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_decorators.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_hooks.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_utils.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_report.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_directives.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_hooks.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/__main__.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_version.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_utils.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_module.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_stub.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/messages.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_message.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_report.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_version.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_directives.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_git.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_module.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/_main.cpython-38.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/__init__.cpython-311.pyc')}: in gitignore, skipping",
-        f"{Path('docsig/__pycache__/__main__.cpython-311.pyc')}: in gitignore, skipping",
+        f"{Path('docsig/__pycache__')}: in gitignore, skipping",
         f"{Path('docsig/_message.py')}: parsing python code successful",
         f"{Path('docsig/_core.py')}: parsing python code successful",
         f"{Path('docsig/_decorators.py')}: parsing python code successful",
@@ -352,45 +313,118 @@ def test_gitignore_patterns(
     make_tree: FixtureMakeTree,
     main: FixtureMain,
 ) -> None:
-    """Test patterns rendered correctly.
+    """Test patterns read relative to the directory of their file.
 
     :param monkeypatch: Mock patch environment and attributes.
     :param make_tree: Create the directory tree from dict mapping.
     :param main: Patch package entry point.
     """
     make_tree(TREE)
-    # remove default excludes to better test nested gitignore files
-    gitignore = docsig._files._Gitignore()  # type: ignore
-    monkeypatch.setattr("docsig._files._Gitignore", lambda _=None: gitignore)
+    gitignores = {}
+    gitignore = docsig._files._Gitignore  # type: ignore
+
+    def _gitignore(directory: Path) -> docsig._files._Gitignore:  # type: ignore
+        gitignores[directory.relative_to(Path.cwd())] = gitignore(directory)
+        return gitignores[directory.relative_to(Path.cwd())]
+
+    monkeypatch.setattr("docsig._files._Gitignore", _gitignore)
     main(".", "--verbose", test_flake8=False)
-    patterns = [
-        "*build/",
-        "*coverage*",
-        "*venv",
-        ".DS_Store",
-        ".env",
-        "__pycache__/",
-        "dist/",
-        "node_modules/",
-        ".pyaud_cache/7.5.1/",
-        ".pyaud_cache/7.5.1/*",
-        ".pytest_cache/*",
-        ".mypy_cache/*",
-        ".idea/dataSources.local.xml",
-        ".idea/dataSources/",
-        ".idea/dictionaries",
-        ".idea/httpRequests/",
-        ".idea/shelf/",
-        ".idea/sonarlint/",
-        ".idea/tasks.xml",
-        ".idea/usage.statistics.xml",
-        ".idea/workspace.xml",
-    ]
+    patterns = {
+        Path(): [
+            "*build/",
+            "*coverage*",
+            "*venv",
+            ".DS_Store",
+            ".env",
+            "__pycache__/",
+            "dist/",
+            "node_modules/",
+        ],
+        Path(".pyaud_cache/7.5.1"): ["*"],
+        Path("docs"): [],
+    }
+    assert all(
+        [i.pattern for i in gitignores[k].patterns] == v
+        for k, v in patterns.items()
+    )
+    # never entered, so never read
+    assert Path("node_modules") not in gitignores
+    assert Path(".idea") not in gitignores
+
+
+def test_gitignore_nearest_file_decides(
+    make_tree: FixtureMakeTree,
+    patch_logger: io.StringIO,
+    main: FixtureMain,
+) -> None:
+    """Test a nested gitignore overrides one above it, like git.
+
+    :param make_tree: Create the directory tree from dict mapping.
+    :param patch_logger: Logs as an io instance.
+    :param main: Patch package entry point.
+    """
+    make_tree(
+        {
+            ".git": {"HEAD": ["ref: refs/heads/master"]},
+            ".gitignore": ["*.py", "!keep.py"],
+            "keep.py": [],
+            "skip.py": [],
+            "package": {
+                ".gitignore": ["keep.py", "!*.py", "skip.py"],
+                "keep.py": [],
+                "other.py": [],
+                "skip.py": [],
+            },
+        },
+    )
+    main(".", "--verbose", test_flake8=False)
+    expected = {
+        Path("keep.py"): False,
+        Path("skip.py"): True,
+        Path("package/keep.py"): False,
+        Path("package/other.py"): False,
+        Path("package/skip.py"): True,
+    }
     assert all(
-        i.pattern in patterns for i in gitignore.patterns  # type: ignore
+        (f"{k}: in gitignore, skipping" in patch_logger.getvalue()) is v
+        for k, v in expected.items()
     )
 
 
+def test_gitignore_only_read_for_checked_path(
+    monkeypatch: pytest.MonkeyPatch,
+    make_tree: FixtureMakeTree,
+    main: FixtureMain,
+) -> None:
+    """Test only the gitignore files above a checked file are read.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param make_tree: Create the directory tree from dict mapping.
+    :param main: Patch package entry point.
+    """
+    make_tree(
+        {
+            ".git": {"HEAD": ["ref: refs/heads/master"]},
+            ".gitignore": ["ignored/"],
+            "vendor": {".gitignore": ["*"], "package": {"module.py": []}},
+            "ignored": {"src": {"module.py": [WILL_ERROR]}},
+            "src": {"package": {"module.py": [WILL_ERROR]}},
+        },
+    )
+    read = []
+    gitignore = docsig._files._Gitignore  # type: ignore
+
+    def _gitignore(directory: Path) -> docsig._files._Gitignore:  # type: ignore
+        read.append(directory.relative_to(Path.cwd()))
+        return gitignore(directory)
+
+    monkeypatch.setattr("docsig._files._Gitignore", _gitignore)
+    assert main(str(Path("src/package/module.py")), test_flake8=False) != 0
+    assert read == [Path(), Path("src"), Path("src/package")]
+    # a file in an ignored directory is ignored when passed directly
+    assert main(str(Path("ignored/src/module.py")), test_flake8=False) == 0
+
+
 @pytest.mark.parametrize(
     "args,expected",
     [
@@ -772,3 +806,150 @@ def test_exclude_string_api(init_file: FixtureInitFile) -> None:
     """
     init_file(WILL_ERROR)
     assert docsig.docsig(".", exclude=r"module[\\/]file.py", no_ansi=True) == 0
+
+
+def test_excluded_dir_is_not_entered(
+    monkeypatch: pytest.MonkeyPatch,
+    make_tree: FixtureMakeTree,
+    patch_logger: io.StringIO,
+    main: FixtureMain,
+) -> None:
+    """Test files below a directory matching an exclude are not walked.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param make_tree: Create the directory tree from dict mapping.
+    :param patch_logger: Logs as an io instance.
+    :param main: Patch package entry point.
+    """
+    entered = []
+    scandir = os.scandir
+
+    def _scandir(path: Path) -> t.Iterator[os.DirEntry]:
+        entered.append(Path(path))
+        return scandir(path)
+
+    monkeypatch.setattr("os.scandir", _scandir)
+    make_tree(
+        {
+            ".venv": {"lib": {"module.py": [WILL_ERROR]}},
+            "src": {"module.py": []},
+        },
+    )
+    assert main(".", "--verbose", test_flake8=False) == 0
+    assert Path("src") in entered
+    assert Path(".venv") not in entered
+    assert Path(".venv/lib") not in entered
+    assert f"{Path('.venv')}: in exclude list, skipping" in (
+        patch_logger.getvalue()
+    )
+    assert "module.py: in exclude list" not in patch_logger.getvalue()
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        r".*[\\/]$",
+        r"(?:.*[\\/])?lib[\\/]$",
+        r".*lib[\\/](?!module)",
+        r".*[\\/][^\\/.]*$",
+        r"^lib[\\/][^.]*$",
+    ],
+    ids=["any-dir", "dir-only", "lookahead", "no-suffix", "anchored-prefix"],
+)
+def test_exclude_not_matching_contents_walks_dir(
+    make_tree: FixtureMakeTree,
+    main: FixtureMain,
+    pattern: str,
+) -> None:
+    """Test a pattern matching a dir, but not what is in it, walks it.
+
+    :param make_tree: Create the directory tree from dict mapping.
+    :param main: Patch package entry point.
+    :param pattern: Exclude pattern matching a dir but not its files.
+    """
+    make_tree({"lib": {"module.py": [WILL_ERROR]}})
+    assert main(".", "--exclude", pattern, test_flake8=False) != 0
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [r"lib[\\/]", f"lib({re.escape(os.sep)}.*)?$"],
+    ids=["prefix", "dir-tail"],
+)
+def test_exclude_dir_and_contents_is_not_entered(
+    monkeypatch: pytest.MonkeyPatch,
+    make_tree: FixtureMakeTree,
+    main: FixtureMain,
+    pattern: str,
+) -> None:
+    """Test a pattern matching a dir and all that is in it prunes it.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param make_tree: Create the directory tree from dict mapping.
+    :param main: Patch package entry point.
+    :param pattern: Exclude pattern matching a dir and its files.
+    """
+    entered = []
+    scandir = os.scandir
+
+    def _scandir(path: Path) -> t.Iterator[os.DirEntry]:
+        entered.append(Path(path))
+        return scandir(path)
+
+    monkeypatch.setattr("os.scandir", _scandir)
+    make_tree({"lib": {"pkg": {"module.py": [WILL_ERROR]}}})
+    assert main(".", "--exclude", pattern, test_flake8=False) == 0
+    assert Path("lib") not in entered
+
+
+def test_exclude_names_in_dir_walks_nested_dirs(
+    capsys: pytest.CaptureFixture,
+    make_tree: FixtureMakeTree,
+    main: FixtureMain,
+) -> None:
+    """Test a pattern matching names in a dir walks the dirs in it.
+
+    :param capsys: Capture sys out.
+    :param make_tree: Create the directory tree from dict mapping.
+    :param main: Patch package entry point.
+    """
+    make_tree(
+        {
+            "gen": {
+                "top.py": [WILL_ERROR],
+                "sub": {"nested.py": [WILL_ERROR]},
+            },
+        },
+    )
+    pattern = r"gen[\\/][^\\/]*$"
+    assert main(".", "--exclude", pattern, test_flake8=False) != 0
+    out = capsys.readouterr().out
+    assert "nested.py" in out
+    assert "top.py" not in out
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        [r"(?x) module [\\/] file\.py  # trailing comment", r".*other"],
+        [r".*other", r"(?i)MODULE[\\/]FILE\.PY"],
+        [r".*other", r"(m)odule[\\/]file.py\1?"],
+        [r".*other", r"(?P<m>m)odule[\\/]file.py(?P=m)?"],
+        [r"(?P<m>.*)other", r"(?P<m>m)odule[\\/]file.py"],
+    ],
+    ids=["verbose", "ignorecase", "backref", "named-backref", "group-names"],
+)
+def test_exclude_patterns_together(
+    init_file: FixtureInitFile,
+    main: FixtureMain,
+    patterns: list[str],
+) -> None:
+    """Test patterns match as they would apart when matched as one.
+
+    :param init_file: Initialize a test file.
+    :param main: Patch package entry point.
+    :param patterns: Exclude patterns, one of which matches the file.
+    """
+    init_file(WILL_ERROR)
+    args = [i for p in patterns for i in ("--exclude", p)]
+    assert main(".", *args, test_flake8=False) == 0
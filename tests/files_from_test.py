@@ -0,0 +1,192 @@
+"""
+tests.files_from_test
+=====================
+"""
+
+from __future__ import annotations
+
+import io
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from docsig import docsig
+
+# noinspection PyProtectedMember
+from docsig._files import _split
+
+from . import WILL_ERROR, FixtureMain, FixtureMakeTree
+
+TREE = {
+    "package": {
+        "listed.py": [WILL_ERROR],
+        "excluded.py": [WILL_ERROR],
+        "ignored.py": [WILL_ERROR],
+        "unlisted.py": [WILL_ERROR],
+    },
+    ".gitignore": ["ignored.py"],
+}
+LISTED = "listed.py", "excluded.py", "ignored.py"
+
+
+@pytest.fixture(name="listed")
+def fixture_listed(make_tree: FixtureMakeTree) -> list[str]:
+    """Make a repo whose files would all fail, and list some of them.
+
+    :param make_tree: Create directory tree from dict mapping.
+    :return: Paths listed.
+    """
+    make_tree(TREE)
+    subprocess.run(["git", "init"], check=True, capture_output=True)
+    return [str(Path("package", i)) for i in LISTED]
+
+
+@pytest.mark.parametrize("separator", ["\n", "\r\n", "\0"])
+def test_files_from(
+    capsys: pytest.CaptureFixture,
+    main: FixtureMain,
+    listed: list[str],
+    separator: str,
+) -> None:
+    """Test only listed paths are checked, filtered as if walked.
+
+    :param capsys: Capture sys out.
+    :param main: Mock ``main`` function.
+    :param listed: Paths listed.
+    :param separator: Separator of the paths listed.
+    """
+    Path("files.txt").write_text(separator.join(listed), encoding="utf-8")
+    args = "--files-from", "files.txt", "--exclude", ".*excluded.py"
+    assert main(*args, test_flake8=False) != 0
+    out = capsys.readouterr().out
+    assert "listed.py" in out
+    assert all(i not in out for i in ("excluded", "ignored", "unlisted"))
+
+
+def test_trust_files_from_stdin(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    main: FixtureMain,
+    listed: list[str],
+) -> None:
+    """Test listed paths from stdin are checked as listed when trusted.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param capsys: Capture sys out.
+    :param main: Mock ``main`` function.
+    :param listed: Paths listed.
+    """
+    Path("files.txt").write_bytes(b"\0".join(i.encode() for i in listed))
+    with Path("files.txt").open("rb") as stdin:
+        monkeypatch.setattr("sys.stdin", stdin)
+        args = "--files-from", "-", "--exclude", ".*excluded.py"
+        assert main(*args, "--trust-files-from", test_flake8=False) != 0
+
+    out = capsys.readouterr().out
+    assert all(i in out for i in LISTED)
+    assert "unlisted" not in out
+
+
+def test_files_from_split_across_reads(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test paths are split the same however the list is read.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param tmp_path: Create and return the temporary directory.
+    """
+    monkeypatch.setattr("docsig._files._CHUNK", 1)
+    file = tmp_path / "files.txt"
+    file.write_bytes(b"one.py\r\ntwo\0.py\r\n\r\nthree.py")
+    with file.open("rb") as stream:
+        paths = list(_split(stream.fileno()))
+
+    assert paths == ["one.py", "two\0.py", "", "three.py"]
+
+
+def test_files_from_with_changed_since(
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Test files from cannot be used with changed since.
+
+    :param capsys: Capture sys out.
+    """
+    assert docsig(files_from="-", changed_since="main") == 2
+    assert capsys.readouterr().err.strip() == (
+        "argument to files-from not allowed with argument to changed-since"
+    )
+
+
+@pytest.mark.parametrize("trust", [False, True], ids=["walked", "trusted"])
+def test_files_from_missing(
+    capsys: pytest.CaptureFixture,
+    patch_logger: io.StringIO,
+    main: FixtureMain,
+    listed: list[str],
+    trust: bool,
+) -> None:
+    """Test a listed path that does not exist is skipped.
+
+    :param capsys: Capture sys out.
+    :param patch_logger: Logs as an io instance.
+    :param main: Mock ``main`` function.
+    :param listed: Paths listed.
+    :param trust: Whether the list is trusted.
+    """
+    missing = str(Path("package", "removed.py"))
+    Path("files.txt").write_text(
+        "\n".join([missing, *listed]),
+        encoding="utf-8",
+    )
+    args = ["--files-from", "files.txt", "--verbose"]
+    if trust:
+        args.append("--trust-files-from")
+
+    assert main(*args, test_flake8=False) != 0
+    assert "listed.py" in capsys.readouterr().out
+    assert f"{missing}: does not exist, skipping" in patch_logger.getvalue()
+
+
+@pytest.mark.parametrize("trust", [False, True], ids=["walked", "trusted"])
+def test_files_from_directory(
+    capsys: pytest.CaptureFixture,
+    main: FixtureMain,
+    listed: list[str],
+    trust: bool,
+) -> None:
+    """Test a listed directory is walked, whether the list is trusted.
+
+    :param capsys: Capture sys out.
+    :param main: Mock ``main`` function.
+    :param listed: Paths listed.
+    :param trust: Whether the list is trusted.
+    """
+    Path("files.txt").write_text(str(Path(listed[0]).parent), encoding="utf-8")
+    args = ["--files-from", "files.txt"]
+    if trust:
+        args.append("--trust-files-from")
+
+    assert main(*args, test_flake8=False) != 0
+    out = capsys.readouterr().out
+    assert all(i in out for i in ("listed", "excluded", "unlisted"))
+    assert "ignored" not in out
+
+
+@pytest.mark.parametrize(
+    "files_from", ["-", "files.txt"], ids=["stdin", "file"]
+)
+def test_files_from_with_stdin_filename(
+    capsys: pytest.CaptureFixture,
+    files_from: str,
+) -> None:
+    """Test files from cannot be used with a filename for stdin.
+
+    :param capsys: Capture sys out.
+    :param files_from: List of paths to check.
+    """
+    assert docsig(files_from=files_from, stdin_filename="module.py") == 2
+    assert capsys.readouterr().err.strip() == (
+        "argument to files-from not allowed with argument to stdin-filename"
+    )
@@ -108,15 +108,14 @@ def test_fix_handle_directory_exclude_patterns_392(
     :param main: Patch package entry point.
     """
     init_pyproject_toml({"exclude": r".*src[\\/]design[\\/].*"})
-    path_obj = Files  # define to avoid recursion
     paths_list = []
 
-    def _paths(*args, **kwargs) -> Files:
-        paths = path_obj(*args, **kwargs)
+    def _paths(*args, **kwargs) -> t.Iterator[Path]:
+        paths = Files(*args, **kwargs)
         paths_list.append(paths)
-        return paths
+        return iter(paths)
 
-    monkeypatch.setattr("docsig._core._Files", _paths)
+    monkeypatch.setattr("docsig._core._iter_files", _paths)
     make_tree(
         {
             "src": {"design": {"file1.py": []}},
@@ -153,43 +152,12 @@ def test_fix_default_exclude_pattern_for_pycache_396(
         f"{Path('.pyaud_cache/7.5.1/CACHEDIR.TAG')}: in gitignore, skipping",
         f"{Path('.pyaud_cache/7.5.1/files.json')}: in gitignore, skipping",
         f"{Path('.pyaud_cache/7.5.1/.gitignore')}: in gitignore, skipping",
-        f"{Path('.pytest_cache/CACHEDIR.TAG')}: in gitignore, skipping",
-        f"{Path('.pytest_cache/README.md')}: in gitignore, skipping",
-        f"{Path('.pytest_cache/.gitignore')}: in gitignore, skipping",
-        f"{Path('.pytest_cache/v')}: in gitignore, skipping",
-        f"{Path('.mypy_cache/CACHEDIR.TAG')}: in gitignore, skipping",
-        f"{Path('.mypy_cache/3.12')}: in gitignore, skipping",
-        f"{Path('.mypy_cache/.gitignore')}: in gitignore, skipping",
-        f"{Path('.mypy_cache/3.8')}: in gitignore, skipping",
-        f"{Path('.idea/workspace.xml')}: in gitignore, skipping",
-        f"{Path('.idea/dictionaries')}: in gitignore, skipping",
-        f"{Path('dist/docsig-0.49.1.tar.gz')}: in exclude list, skipping",
-        f"{Path('dist/docsig-0.49.2-py3-none-any.whl')}: in exclude list, skipping",
-        f"{Path('dist/docsig-0.49.2.tar.gz')}: in exclude list, skipping",
-        f"{Path('dist/docsig-0.49.0-py3-none-any.whl')}: in exclude list, skipping",
-        f"{Path('dist/docsig-0.49.0.tar.gz')}: in exclude list, skipping",
-        f"{Path('dist/docsig-0.49.1-py3-none-any.whl')}: in exclude list, skipping",
-        f"{Path('node_modules/.cache/prettier/.prettier-caches/7f51ae3462154079bc96a79583b977616b1ad315.json')}: in exclude list, skipping",
-        f"{Path('.git/HEAD')}: in exclude list, skipping",
-        f"{Path('.idea/docsig.iml')}: in exclude list, skipping",
-        f"{Path('.idea/jsonSchemas.xml')}: in exclude list, skipping",
-        f"{Path('.idea/inspectionProfiles/profiles_settings.xml')}: in exclude list, skipping",
-        f"{Path('.idea/inspectionProfiles/Project_Default.xml')}: in exclude list, skipping",
-        f"{Path('.idea/codeStyles/Project.xml')}: in exclude list, skipping",
-        f"{Path('.idea/codeStyles/codeStyleConfig.xml')}: in exclude list, skipping",
-        f"{Path('.idea/material_theme_project_new.xml')}: in exclude list, skipping",
-        f"{Path('.idea/vcs.xml')}: in exclude list, skipping",
-        f"{Path('.idea/.gitignore')}: in exclude list, skipping",
-        f"{Path('.idea/modules.xml')}: in exclude list, skipping",
-        f"{Path('.idea/watcherTasks.xml')}: in exclude list, skipping",
-        f"{Path('.idea/misc.xml')}: in exclude list, skipping",
-        f"{Path('.idea/scopes/whitelist_py.xml')}: in exclude list, skipping",
-        f"{Path('.idea/scopes/bump2version.xml')}: in exclude list, skipping",
-        f"{Path('.idea/scopes/docs__themes_graphite_static.xml')}: in exclude list, skipping",
-        f"{Path('.idea/scopes/docs_conf.xml')}: in exclude list, skipping",
-        f"{Path('.idea/scopes/_prettierignore.xml')}: in exclude list, skipping",
-        f"{Path('.idea/scopes/docs_index.xml')}: in exclude list, skipping",
-        f"{Path('.idea/scopes/_pylintrc.xml')}: in exclude list, skipping",
+        f"{Path('.pytest_cache')}: in exclude list, skipping",
+        f"{Path('.mypy_cache')}: in exclude list, skipping",
+        f"{Path('.idea')}: in exclude list, skipping",
+        f"{Path('dist')}: in exclude list, skipping",
+        f"{Path('node_modules')}: in exclude list, skipping",
+        f"{Path('.git')}: in exclude list, skipping",
         f"{Path('.bumpversion.cfg')}: parsing python code failed",
         f"{Path('.conform.yaml')}: parsing python code failed",
         f"{Path('.coverage')}: parsing python code failed",
@@ -219,39 +187,7 @@ def test_fix_default_exclude_pattern_for_pycache_396(
         f"{Path('docs/static/docsig.svg')}: parsing python code failed",
         f"{Path('docsig/__init__.py')}: parsing python code successful",
         f"{Path('docsig/__main__.py')}: parsing python code successful",
-        f"{Path('docsig/__pycache__/__init__.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/__init__.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/__main__.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/__main__.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_config.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_config.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_core.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_core.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_decorators.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_decorators.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_directives.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_directives.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_display.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_display.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_git.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_hooks.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_hooks.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_main.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_main.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_message.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_message.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_module.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_module.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_report.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_report.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_stub.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_stub.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_utils.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_utils.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_version.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/_version.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/messages.cpython-311.pyc')}: in exclude list, skipping",
-        f"{Path('docsig/__pycache__/messages.cpython-38.pyc')}: in exclude list, skipping",
+        f"{Path('docsig/__pycache__')}: in exclude list, skipping",
         f"{Path('docsig/_config.py')}: parsing python code successful",
         f"{Path('docsig/_core.py')}: parsing python code successful",
         f"{Path('docsig/_decorators.py')}: parsing python code successful",
@@ -273,12 +209,7 @@ def test_fix_default_exclude_pattern_for_pycache_396(
         f"{Path('pyproject.toml')}: parsing python code successful",
         f"{Path('tests/TESTS.md')}: parsing python code failed",
         f"{Path('tests/__init__.py')}: parsing python code successful",
-        f"{Path('tests/__pycache__/__init__.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('tests/__pycache__/_test.cpython-38-pytest-8.1.1.pyc')}: in exclude list, skipping",
-        f"{Path('tests/__pycache__/_test.cpython-38.pyc')}: in exclude list, skipping",
-        f"{Path('tests/__pycache__/conftest.cpython-38-pytest-8.1.1.pyc')}: in exclude list, skipping",
-        f"{Path('tests/__pycache__/disable_test.cpython-38-pytest-8.1.1.pyc')}: in exclude list, skipping",
-        f"{Path('tests/__pycache__/misc_test.cpython-38-pytest-8.1.1.pyc')}: in exclude list, skipping",
+        f"{Path('tests/__pycache__')}: in exclude list, skipping",
         f"{Path('tests/_test.py')}: parsing python code successful",
         f"{Path('tests/conftest.py')}: parsing python code successful",
         f"{Path('tests/disable_test.py')}: parsing python code successful",
@@ -1592,6 +1523,47 @@ class G(F[B, A, C], t.Generic[B, A, C]): ...
     assert E[904].ref in std.out
 
 
+def test_fix_docsig_crashes_on_duplicate_bases_error_with_method_783(
+    capsys: pytest.CaptureFixture,
+    init_file: FixtureInitFile,
+    main: FixtureMain,
+) -> None:
+    """Test fix docsig crashes on duplicates found in mros of a method.
+
+    :param capsys: Capture sys out.
+    :param init_file: Initialize a test file.
+    :param main: Mock ``main`` function.
+    """
+    template = """\
+from dataclasses import dataclass
+import typing as t
+from abc import ABC
+
+A = t.TypeVar("A")
+B = t.TypeVar("B", bound=t.SupportsFloat)
+C = t.TypeVar("C")
+
+
+class D(t.Protocol[B, A]): ...
+
+
+class E(D[B, A], t.Protocol[B, A, C]): ...
+
+
+class F(E[B, A, C], t.Generic[B, A, C], ABC): ...
+
+
+@dataclass(frozen=True)
+class G(F[B, A, C], t.Generic[B, A, C]):
+    def method(self, param) -> None:
+        pass
+"""
+    init_file(template)
+    assert main(".", test_flake8=False) == 2
+    std = capsys.readouterr()
+    assert E[904].ref in std.out
+
+
 def test_fix_recognize_directive_for_indented_func_827(
     capsys: pytest.CaptureFixture,
     init_file: FixtureInitFile,
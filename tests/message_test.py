@@ -7,7 +7,7 @@ tests.message_test.py
 import pytest
 
 from docsig.messages import TEMPLATE as T
-from docsig.messages import E
+from docsig.messages import E, Messages
 
 from . import PATH, FixtureInitFile, FixtureMain
 
@@ -2322,3 +2322,30 @@ def test_disable_next_stacked(
     {E[501].fstring(T)}
 """ not in std.out
     assert all(f"function_{i}" in std.out for i in range(2, 4))
+
+
+def test_messages_set() -> None:
+    """Test messages are a set, iterating in the order of their codes."""
+    unknown = E.from_ref("unknown")
+    messages = Messages([E[402], E[101], unknown, E[402], unknown])
+    assert list(messages) == [E[101], E[402], unknown, unknown]
+    assert messages == [E[101], E[402], unknown, unknown]
+    assert messages != [E[402], E[101], unknown, unknown]
+    assert len(messages) == 4
+    assert messages[1] is E[402] and messages[-1] == unknown
+    assert messages.index(E[402]) == 1 and messages.count(unknown) == 2
+    assert E[402] in messages and unknown in messages
+    assert E[202] not in messages
+    assert messages == Messages([unknown, E[101], unknown, E[402]])
+    assert messages != Messages([unknown, E[101], E[402]])
+    assert len({messages, Messages([unknown, E[402], unknown, E[101]])}) == 1
+    assert list(messages - Messages([E[101], unknown])) == [E[402]]
+    assert list(messages & Messages([E[101], E[202]])) == [E[101]]
+    assert list(Messages([E[202]]) | messages) == [
+        E[101],
+        E[202],
+        E[402],
+        unknown,
+        unknown,
+    ]
+    assert E.from_ref(E[101].symbolic) is E[101]
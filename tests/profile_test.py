@@ -0,0 +1,94 @@
+"""
+tests.profile_test
+==================
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from docsig import docsig
+
+# noinspection PyProtectedMember
+from docsig._config import Config
+
+# noinspection PyProtectedMember
+from docsig._core import _worker_runner
+
+# noinspection PyProtectedMember
+from docsig._profile import Profile, Stage
+
+from . import FixtureInitFile, FixtureMain, FixtureMakeTree
+
+TEMPLATE = '''
+def function(param) -> None:
+    """Summary."""
+'''
+
+
+def test_profile_prints_stages(
+    capsys: pytest.CaptureFixture,
+    init_file: FixtureInitFile,
+    main: FixtureMain,
+) -> None:
+    """Test the stages and slowest files are printed after the report.
+
+    :param capsys: Capture sys out.
+    :param init_file: Initialize a test file.
+    :param main: Mock ``main`` function.
+    """
+    file = init_file(TEMPLATE)
+    assert main(".", "--profile", "--no-cache", test_flake8=False) == 1
+    std = capsys.readouterr()
+    # kept apart from the report
+    assert "stages" not in std.out
+    assert str(file.relative_to(Path.cwd())) in std.err
+    assert all(i.value in std.err for i in Stage)
+
+
+@pytest.mark.parametrize("jobs", [1, 2], ids=["serial", "pool"])
+def test_profile_json(make_tree: FixtureMakeTree, jobs: int) -> None:
+    """Test the time of each stage and file is written as json.
+
+    :param make_tree: Create directory tree from dict mapping.
+    :param jobs: Number of processes to check files with.
+    """
+    make_tree({"package": {"one.py": [TEMPLATE], "two.py": [TEMPLATE]}})
+    kwargs = {"profile_json": "profile.json", "jobs": jobs, "no_cache": True}
+    assert docsig(".", **kwargs) == 1
+    profile = json.loads(Path("profile.json").read_text(encoding="utf-8"))
+    assert set(profile["stages"]) == {i.value for i in Stage}
+    for file in Path("package", "one.py"), Path("package", "two.py"):
+        assert profile["files"][str(file)][Stage.CHECK.value]["wall"] >= 0
+
+
+def test_profile_excludes_nested_stages() -> None:
+    """Test time in a stage entered within another counts toward it."""
+    profile = Profile()
+    with profile.stage(Stage.REPORT):
+        with profile.file("file.py"), profile.stage(Stage.CHECK):
+            pass
+
+    ((file, total),) = profile.slowest()
+    stages = profile.to_json()["stages"]
+    assert file == "file.py"
+    # the file was only checked within the report
+    assert total.wall == stages[Stage.CHECK.value]["wall"]
+
+
+def test_worker_profiles_file(init_file: FixtureInitFile) -> None:
+    """Test a worker returns the profile of the file it checked.
+
+    Workers run in processes of their own, so are tested here directly.
+
+    :param init_file: Initialize a test file.
+    """
+    file = init_file(TEMPLATE)
+    failures, profile = _worker_runner(file, Config())
+    assert len(failures) == 1
+    ((name, total),) = profile.slowest()
+    assert name == str(file)
+    assert total.wall >= 0
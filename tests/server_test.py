@@ -0,0 +1,201 @@
+"""
+tests.server_test
+=================
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import typing as t
+from pathlib import Path
+
+import pytest
+
+# noinspection PyProtectedMember
+from docsig._config import Config
+
+# noinspection PyProtectedMember
+from docsig._server import Server
+
+# noinspection PyProtectedMember
+from docsig._traverse import run_checks
+from docsig.messages import TEMPLATE as T
+from docsig.messages import E
+
+from . import FixtureInitFile, FixtureMain, FixtureMakeTree
+
+TEMPLATE = '''
+def function(param) -> None:
+    """Summary."""
+'''
+
+
+def _serve(*requests: t.Any) -> list[dict[str, t.Any]]:
+    stdin = io.StringIO(
+        "".join(
+            f"{i if isinstance(i, str) else json.dumps(i)}\n" for i in requests
+        ),
+    )
+    stdout = io.StringIO()
+    assert Server(Config()).serve(stdin, stdout) == 0
+    return [json.loads(i) for i in stdout.getvalue().splitlines()]
+
+
+def _check(request_id: int, **params: t.Any) -> dict[str, t.Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "check",
+        "params": params,
+    }
+
+
+def test_check_matches_json_format(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    init_file: FixtureInitFile,
+    main: FixtureMain,
+) -> None:
+    """Test a check responds with the payload the JSON format prints.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param capsys: Capture sys out.
+    :param init_file: Initialize a test file.
+    :param main: Mock ``main`` function.
+    """
+    file = init_file(TEMPLATE)
+    path = str(file.relative_to(Path.cwd()))
+    monkeypatch.setenv("_DOCSIG_FORMAT_JSON", "1")
+    main(path, test_flake8=False)
+    expected = json.loads(capsys.readouterr().out)
+    responses = _serve(_check(1, source=TEMPLATE, path=path))
+    assert responses == [{"jsonrpc": "2.0", "id": 1, "result": expected}]
+    assert expected[0]["message"] == E[203].fstring(T)
+
+
+def test_check_without_path() -> None:
+    """Test a check without a path reports no path."""
+    (response,) = _serve(_check(1, source=TEMPLATE))
+    assert response["result"][0]["path"] is None
+    assert response["result"][0]["line"] == 2
+
+
+def test_check_unsaved_non_python_file() -> None:
+    """Test an unsaved file not ending in .py is only checked if valid."""
+    (response,) = _serve(_check(1, source="echo hello", path="script"))
+    assert response["result"] == []
+
+
+def test_server_errors() -> None:
+    """Test malformed requests are responded to with an error."""
+    responses = _serve(
+        "not json",
+        "[]",
+        {"jsonrpc": "2.0", "id": 1, "method": "unknown"},
+        _check(2, path="file.py"),
+        {"jsonrpc": "2.0", "id": 3, "method": "check", "params": []},
+    )
+    assert [i["error"]["code"] for i in responses] == [
+        -32700,
+        -32600,
+        -32601,
+        -32602,
+        -32602,
+    ]
+    assert [i["id"] for i in responses] == [None, None, 1, 2, 3]
+
+
+def test_internal_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a source that fails to check does not stop the server.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    """
+
+    def _run_checks(module: t.Any, config: Config) -> t.Any:
+        if not module.children:
+            raise RuntimeError("failed")
+
+        return run_checks(module, config)
+
+    monkeypatch.setattr("docsig._server._run_checks", _run_checks)
+    responses = _serve(_check(1, source=""), _check(2, source=TEMPLATE))
+    assert responses[0]["error"] == {
+        "code": -32603,
+        "message": "RuntimeError('failed')",
+    }
+    assert responses[1]["result"][0]["line"] == 2
+
+
+def test_notification_and_shutdown() -> None:
+    """Test notifications are not responded to and shutdown stops."""
+    notification = _check(1, source=TEMPLATE)
+    del notification["id"]
+    responses = _serve(
+        notification,
+        {"jsonrpc": "2.0", "method": "unknown"},
+        "",
+        {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+        _check(3, source=TEMPLATE),
+    )
+    assert responses == [{"jsonrpc": "2.0", "id": 2, "result": None}]
+
+
+def test_changed_base_class_is_read_again(
+    monkeypatch: pytest.MonkeyPatch,
+    make_tree: FixtureMakeTree,
+) -> None:
+    """Test a base class changed while serving is not read stale.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param make_tree: Create directory tree from dict mapping.
+    """
+    monkeypatch.syspath_prepend(Path.cwd())
+    make_tree(
+        {
+            "served_base.py": [
+                "class Base:",
+                "    def method(self, param) -> None:",
+                '        """Summary.',
+                "",
+                "        :param param: Description of param.",
+                '        """',
+            ],
+        },
+    )
+    child = """
+from served_base import Base
+class Child(Base):
+    def method(self, param) -> None:
+        \"\"\"Summary.\"\"\"
+"""
+    stdout = io.StringIO()
+    server = Server(Config())
+    server.serve(io.StringIO(json.dumps(_check(1, source=child))), stdout)
+    base = Path("served_base.py")
+    mtime = base.stat().st_mtime_ns
+    base.write_text("class Base:\n    pass\n", encoding="utf-8")
+    # make sure the change is seen however coarse the file system clock
+    os.utime(base, ns=(mtime + 1, mtime + 1))
+    server.serve(io.StringIO(json.dumps(_check(2, source=child))), stdout)
+    first, second = (json.loads(i) for i in stdout.getvalue().splitlines())
+    assert first["result"] == []
+    assert second["result"][0]["message"] == E[203].fstring(T)
+
+
+def test_serve_commandline(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    main: FixtureMain,
+) -> None:
+    """Test serving from the commandline without a path or string.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param capsys: Capture sys out.
+    :param main: Mock ``main`` function.
+    """
+    monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(_check(1))))
+    assert main("--serve", test_flake8=False) == 0
+    response = json.loads(capsys.readouterr().out)
+    assert response["error"]["code"] == -32602
@@ -0,0 +1,135 @@
+"""
+tests.stdin_test
+================
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from . import FixtureInitPyprojectTomlFile, FixtureMain
+
+TEMPLATE = '''
+def _function(param) -> None:
+    """Summary."""
+'''
+
+
+@pytest.fixture(name="stdin")
+def fixture_stdin(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Send unsaved source to stdin.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param tmp_path: Create and return the temporary directory.
+    """
+    file = tmp_path / "stdin"
+    file.write_text(TEMPLATE, encoding="utf-8")
+    # pylint: disable-next=consider-using-with
+    monkeypatch.setattr("sys.stdin", file.open(encoding="utf-8"))
+
+
+@pytest.mark.usefixtures("stdin")
+def test_stdin_filename_json(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    main: FixtureMain,
+) -> None:
+    """Test source from stdin is reported at a path that need not exist.
+
+    :param monkeypatch: Mock patch environment and attributes.
+    :param capsys: Capture sys out.
+    :param main: Mock ``main`` function.
+    """
+    monkeypatch.setenv("_DOCSIG_FORMAT_JSON", "1")
+    file = Path("package", "unsaved.py")
+    args = "--stdin-filename", file, "--check-protected"
+    assert main(*args, test_flake8=False) == 1
+    (issue,) = json.loads(capsys.readouterr().out)
+    assert issue["path"] == str(file)
+    assert issue["line"] == 2
+    assert "SIG203" in issue["message"]
+    assert not file.exists()
+
+
+@pytest.mark.usefixtures("stdin")
+def test_stdin_filename_config(
+    tmp_path: Path,
+    init_pyproject_toml: FixtureInitPyprojectTomlFile,
+    main: FixtureMain,
+) -> None:
+    """Test source from stdin is checked with the config of its path.
+
+    :param tmp_path: Create and return the temporary directory.
+    :param init_pyproject_toml: Initialize a test pyproject.toml file.
+    :param main: Mock ``main`` function.
+    """
+    init_pyproject_toml({"check-protected": True})
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "pyproject.toml").write_text(
+        "[tool.docsig]\n",
+        encoding="utf-8",
+    )
+    file = Path("project", "module.py")
+    assert main("--stdin-filename", file, test_flake8=False) == 0
+
+
+@pytest.mark.usefixtures("stdin")
+def test_stdin_filename_excluded(
+    capsys: pytest.CaptureFixture,
+    main: FixtureMain,
+) -> None:
+    """Test source from stdin is not checked if its path is excluded.
+
+    :param capsys: Capture sys out.
+    :param main: Mock ``main`` function.
+    """
+    file = Path("generated", "module.py")
+    args = "--stdin-filename", file, "--check-protected"
+    assert main(*args, "--exclude", "generated", test_flake8=False) == 0
+    assert not capsys.readouterr().out
+
+
+@pytest.mark.usefixtures("stdin")
+@pytest.mark.parametrize(
+    "gitignore",
+    ["generated/\n", "module.py\n"],
+    ids=["parent", "file"],
+)
+def test_stdin_filename_gitignored(
+    capsys: pytest.CaptureFixture,
+    main: FixtureMain,
+    gitignore: str,
+) -> None:
+    """Test source from stdin is not checked if its path is gitignored.
+
+    :param capsys: Capture sys out.
+    :param main: Mock ``main`` function.
+    :param gitignore: Contents of the gitignore file.
+    """
+    subprocess.run(["git", "init"], check=True, capture_output=True)
+    Path(".gitignore").write_text(gitignore, encoding="utf-8")
+    file = Path("generated", "module.py")
+    args = "--stdin-filename", file, "--check-protected"
+    assert main(*args, test_flake8=False) == 0
+    assert not capsys.readouterr().out
+
+
+def test_stdin_filename_with_path(
+    capsys: pytest.CaptureFixture,
+    main: FixtureMain,
+) -> None:
+    """Test paths cannot be checked with a filename for stdin.
+
+    :param capsys: Capture sys out.
+    :param main: Mock ``main`` function.
+    """
+    args = ".", "--stdin-filename", "module.py"
+    assert main(*args, test_flake8=False) == 2
+    assert capsys.readouterr().err.strip() == (
+        "path(s) not allowed with argument to stdin-filename"
+    )